@@ -0,0 +1,59 @@
+"""
+Benchmark duplicate posting detection: `drop_duplicates` over the seven
+`DEDUP_COLUMNS` versus the stored 64-bit fingerprint column.
+
+Also times computing the fingerprints (done once, at ingest) and checking
+one new batch against every posting seen so far with a `FingerprintSet`,
+which only costs O(batch) instead of re-hashing the whole history.
+
+Usage:
+    python -m benchmarks.bench_dedup [--rows 10000 100000] [--batch 100]
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from config.storage import DEDUP_COLUMNS, FINGERPRINT_COLUMN
+from src.utils.fingerprint import FingerprintSet, posting_fingerprints
+
+from .bench_skills_table import measure
+from .synthetic import make_postings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--batch', type=int, default=100)
+    args = parser.parse_args()
+
+    print(f'{"rows":>8}  {"step":<30}{"seconds":>9}{"peak MiB":>10}{"unique":>9}')
+    for n_rows in args.rows:
+        df = pd.DataFrame(make_postings(n_rows))
+        fingerprints, hash_time, hash_peak = measure(posting_fingerprints, df)
+        df[FINGERPRINT_COLUMN] = fingerprints
+
+        by_columns, columns_time, columns_peak = measure(
+            df.drop_duplicates, DEDUP_COLUMNS
+        )
+        by_fingerprint, fingerprint_time, fingerprint_peak = measure(
+            df.drop_duplicates, FINGERPRINT_COLUMN
+        )
+
+        history, batch = df.iloc[: -args.batch], df.iloc[-args.batch :]
+        seen = FingerprintSet(history[FINGERPRINT_COLUMN])
+        start = time.perf_counter()
+        new = seen.first_seen(batch[FINGERPRINT_COLUMN])
+        batch_time = time.perf_counter() - start
+
+        for step, seconds, peak, unique in [
+            ('fingerprint (at ingest)', hash_time, hash_peak, ''),
+            ('drop_duplicates 7 columns', columns_time, columns_peak, len(by_columns)),
+            ('drop_duplicates fingerprint', fingerprint_time, fingerprint_peak, len(by_fingerprint)),
+            (f'batch of {args.batch} vs seen set', batch_time, 0.0, int(new.sum())),
+        ]:
+            print(f'{n_rows:>8}  {step:<30}{seconds:>9.4f}{peak:>10.1f}{unique:>9}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark the job page parser backends on the saved fixture pages.
+
+Every installed backend parses each fixture page repeatedly; the script
+reports pages/sec per backend and checks that all backends (and the legacy
+multi-pass BeautifulSoup extraction) produce identical fields.
+
+Usage:
+    python -m benchmarks.bench_job_parser [--rounds 200]
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from bs4 import BeautifulSoup
+
+from src.scraping.job_parser import available_backends, parse_job_posting
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'job_pages'
+
+
+def legacy_parse(html: str) -> Dict[str, Any]:
+    """Reproduce the original seven-lookup BeautifulSoup extraction."""
+
+    def safe_find(soup, tag, attrs):
+        element = soup.find(tag, attrs)
+        return element.text.strip() if element else None
+
+    soup = BeautifulSoup(html, 'html.parser')
+    job_post = {
+        'job_title': safe_find(soup, 'h2', {'class': 'top-card-layout__title'}),
+        'company_name': safe_find(
+            soup, 'a', {'class': 'topcard__org-name-link'}
+        ),
+        'location': safe_find(
+            soup, 'span', {'class': 'topcard__flavor topcard__flavor--bullet'}
+        ),
+        'time_posted': safe_find(
+            soup, 'span', {'class': 'posted-time-ago__text'}
+        ),
+        'num_applicants': safe_find(
+            soup, 'span', {'class': 'num-applicants__caption'}
+        ),
+    }
+
+    job_criteria = {}
+    for item in soup.find_all('li', class_='description__job-criteria-item'):
+        try:
+            label = item.find(
+                'h3', class_='description__job-criteria-subheader'
+            ).text.strip()
+            value = item.find(
+                'span', class_='description__job-criteria-text'
+            ).text.strip()
+            job_criteria[label] = value
+        except AttributeError:
+            continue
+
+    values = list(job_criteria.values())
+    job_post['xp_level'] = values[0] if len(values) > 0 else None
+    job_post['job_type'] = values[1] if len(values) > 1 else None
+    job_post['job_sectors'] = values[3] if len(values) > 3 else None
+
+    description = soup.find('div', {'class': 'show-more-less-html__markup'})
+    job_post['job_description'] = (
+        description.get_text(separator='\n', strip=True)
+        if description
+        else None
+    )
+    return job_post
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    pages = {
+        path.name: path.read_text(encoding='utf-8')
+        for path in sorted(FIXTURES_DIR.glob('*.html'))
+    }
+    reference = {name: legacy_parse(html) for name, html in pages.items()}
+    candidates = {'legacy (bs4, multi-pass)': legacy_parse}
+    for backend in available_backends():
+        candidates[backend] = lambda html, b=backend: parse_job_posting(html, b)
+
+    print(f'{len(pages)} fixture pages x {args.rounds} rounds\n')
+    print(f'{"backend":<26}{"pages/sec":>12}{"speedup":>10}  identical')
+
+    baseline = None
+    for name, parse in candidates.items():
+        identical = all(
+            parse(html) == reference[page] for page, html in pages.items()
+        )
+
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for html in pages.values():
+                parse(html)
+        elapsed = time.perf_counter() - start
+
+        pages_per_sec = args.rounds * len(pages) / elapsed
+        baseline = baseline or pages_per_sec
+        print(
+            f'{name:<26}{pages_per_sec:>12.1f}'
+            f'{pages_per_sec / baseline:>9.1f}x  {identical}'
+        )
+
+
+if __name__ == '__main__':
+    main()
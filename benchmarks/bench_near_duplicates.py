@@ -0,0 +1,93 @@
+"""
+Benchmark near-duplicate posting detection (MinHash + LSH).
+
+A share of the synthetic postings are reposts of an earlier one with a
+small edit: a location suffix, a changed word or reordered bullet points.
+Reports the time to compute the signatures and the clusters, and how many
+reposts were clustered with their original (recall) versus how many
+distinct postings were wrongly merged.
+
+Usage:
+    python -m benchmarks.bench_near_duplicates [--rows 10000 100000]
+        [--threshold 0.8] [--repost-rate 0.2]
+"""
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from config.analysis import NEAR_DUPLICATE_THRESHOLD
+from src.analysis.near_duplicates import NearDuplicateDetector
+
+from .synthetic import make_postings
+
+
+def make_reposts(
+    n_texts: int, repost_rate: float, seed: int = 0
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Generate descriptions where about `repost_rate` of them are edited copies
+    of an earlier one. Returns the texts and the position of each text's
+    original (its own position for originals).
+    """
+    rng = random.Random(seed)
+    texts = [p['job_description'] for p in make_postings(n_texts, duplicate_rate=0, seed=seed)]
+    originals = np.arange(n_texts)
+    for i in range(1, n_texts):
+        if rng.random() >= repost_rate:
+            continue
+        original = rng.randrange(i)
+        words = texts[original].split()
+        edit = rng.choice(['suffix', 'word', 'bullets'])
+        if edit == 'suffix':
+            words += ['-', rng.choice(['São', 'Rio']), 'Paulo,', 'SP']
+        elif edit == 'word':
+            words[rng.randrange(len(words))] = 'híbrido'
+        else:
+            bullets = [words[start : start + 30] for start in range(0, len(words), 30)]
+            rng.shuffle(bullets)
+            words = [word for bullet in bullets for word in bullet]
+        texts[i] = ' '.join(words)
+        originals[i] = originals[original]
+    return texts, originals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--threshold', type=float, default=NEAR_DUPLICATE_THRESHOLD)
+    parser.add_argument('--repost-rate', type=float, default=0.2)
+    args = parser.parse_args()
+
+    detector = NearDuplicateDetector(args.threshold)
+    print(
+        f'threshold {args.threshold}, {detector.bands} bands x {detector.rows} rows\n'
+    )
+    print(
+        f'{"rows":>8}{"signatures s":>14}{"clusters s":>12}{"reposts":>9}'
+        f'{"recall":>8}{"wrong merges":>14}'
+    )
+    for n_rows in args.rows:
+        texts, originals = make_reposts(n_rows, args.repost_rate)
+
+        start = time.perf_counter()
+        detector.signatures(texts)
+        signatures_time = time.perf_counter() - start
+        start = time.perf_counter()
+        clusters = detector.cluster_ids(texts)
+        clusters_time = time.perf_counter() - start
+
+        reposts = originals != np.arange(n_rows)
+        found = clusters[reposts] == clusters[originals[reposts]]
+        # Originals merged into the cluster of a different original.
+        wrong = (~reposts & (clusters != np.arange(n_rows))).sum()
+        print(
+            f'{n_rows:>8}{signatures_time:>14.2f}{clusters_time:>12.2f}'
+            f'{reposts.sum():>9}{found.mean():>8.3f}{wrong:>14}'
+        )
+
+
+if __name__ == '__main__':
+    main()
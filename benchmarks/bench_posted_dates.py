@@ -0,0 +1,62 @@
+"""
+Benchmark deriving posting dates: the former row-wise
+`df.apply(parse_posted_date, axis=1)` versus the vectorized
+`parse_posted_dates`.
+
+The row-wise version is only timed up to --max-apply-rows rows.
+
+Usage:
+    python -m benchmarks.bench_posted_dates [--rows 100000 1000000 5000000]
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.analysis_utils import parse_posted_date, parse_posted_dates
+from src.utils.logger import register_success_level
+
+from .synthetic import TIME_POSTED
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--rows', type=int, nargs='+', default=[100_000, 1_000_000, 5_000_000]
+    )
+    parser.add_argument('--max-apply-rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    register_success_level()
+    rng = np.random.default_rng(0)
+
+    print(f'{"rows":>9}  {"method":<20}{"seconds":>9}')
+    for n_rows in args.rows:
+        df = pd.DataFrame(
+            {
+                'time_posted': rng.choice(
+                    np.array(TIME_POSTED, dtype=object), n_rows
+                ),
+                'scrape_date': pd.Timestamp('2025-05-10 12:00:00')
+                - pd.to_timedelta(rng.integers(0, 90, n_rows), unit='D'),
+            }
+        )
+
+        start = time.perf_counter()
+        vectorized = parse_posted_dates(df['time_posted'], df['scrape_date'])
+        vectorized_time = time.perf_counter() - start
+
+        if n_rows <= args.max_apply_rows:
+            start = time.perf_counter()
+            legacy = pd.to_datetime(df.apply(parse_posted_date, axis=1))
+            legacy_time = time.perf_counter() - start
+            assert legacy.equals(vectorized), 'posting dates differ'
+            print(f'{n_rows:>9}  {"apply (legacy)":<20}{legacy_time:>9.3f}')
+        print(f'{n_rows:>9}  {"parse_posted_dates":<20}{vectorized_time:>9.3f}')
+
+
+if __name__ == '__main__':
+    main()
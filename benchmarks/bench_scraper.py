@@ -0,0 +1,159 @@
+"""
+Benchmark JobScraper end to end against the local fixture server.
+
+Runs `get_job_ids` and `get_job_info` with several worker counts against a
+`FixtureServer` replaying an HTTP archive, with configurable latency and
+fault injection, and reports IDs/sec and jobs/sec. Without `--archive`, a
+synthetic archive is generated from the saved fixture job pages.
+
+Usage:
+    python -m benchmarks.bench_scraper [--jobs 200] [--latency 0.1]
+        [--workers 1 2 4 8] [--rps 50] [--rate-429 0.0] [--error-rate 0.0]
+        [--archive data/http_archive/linkedin.jsonl.gz --keyword "PMO"]
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.scraping.fixture_server import FixtureServer
+from src.scraping.http_archive import HttpArchive, archive_key
+from src.scraping.linkedin_scraper import JobScraper
+from src.utils.logger import register_success_level
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'job_pages'
+SEARCH_URL = (
+    'http://fixtures/jobs-guest/jobs/api/seeMoreJobPostings/search?'
+    'keywords={keyword}&location=Brasil&geoId=106057199'
+    '&f_WT={work_model}&start={start}'
+)
+JOB_URL = 'http://fixtures/jobs-guest/jobs/api/jobPosting/{job_id}?_l=pt_BR'
+
+
+def build_synthetic_archive(
+    path: Path, keyword: str, work_model: str, n_jobs: int
+) -> None:
+    """
+    Write an archive with search pages and job pages for `n_jobs` jobs.
+
+    Job pages are copies of the fixture pages with their job ID replaced.
+    """
+    archive = HttpArchive(path)
+    templates = [
+        (page.stem.split('_')[-1], page.read_text(encoding='utf-8'))
+        for page in sorted(FIXTURES_DIR.glob('*.html'))
+    ]
+    formatted_keyword = JobScraper.format_keyword(None, keyword)
+
+    job_ids = [str(5_000_000_000 + i) for i in range(n_jobs)]
+    for start in range(0, n_jobs, 10):
+        cards = ''.join(
+            f'<li><div class="base-card relative" '
+            f'data-entity-urn="urn:li:jobPosting:{job_id}"></div></li>'
+            for job_id in job_ids[start : start + 10]
+        )
+        url = SEARCH_URL.format(
+            keyword=formatted_keyword, work_model=work_model, start=start
+        )
+        archive.add(archive_key('GET', url), 200, {}, cards)
+
+    for i, job_id in enumerate(job_ids):
+        template_id, template = templates[i % len(templates)]
+        url = JOB_URL.format(job_id=job_id)
+        archive.add(
+            archive_key('GET', url),
+            200,
+            {},
+            template.replace(template_id, job_id),
+        )
+
+
+def run_once(args, archive: HttpArchive, workers: int) -> dict:
+    """Scrape everything in the archive once with `workers` workers."""
+    with FixtureServer(
+        archive,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        rate_429=args.rate_429,
+        error_rate=args.error_rate,
+        seed=0,
+    ) as server, tempfile.TemporaryDirectory() as work_dir:
+        cwd = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            scraper = JobScraper(
+                max_workers=workers,
+                requests_per_second=args.rps,
+                base_url=server.url,
+            )
+
+            start = time.perf_counter()
+            scraper.get_job_ids(args.jobs, args.keyword, args.work_model)
+            ids_elapsed = time.perf_counter() - start
+            n_ids = len(scraper.job_ids_cache)
+
+            start = time.perf_counter()
+            scraper.get_job_info()
+            info_elapsed = time.perf_counter() - start
+            n_jobs = len(scraper.job_data_cache)
+            scraper.close()
+        finally:
+            os.chdir(cwd)
+
+        return {
+            'workers': workers,
+            'ids': n_ids,
+            'ids_per_sec': n_ids / ids_elapsed,
+            'jobs': n_jobs,
+            'jobs_per_sec': n_jobs / info_elapsed,
+            'requests': server.request_count,
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--archive', type=Path, default=None)
+    parser.add_argument('--keyword', default='Project Manager')
+    parser.add_argument('--work-model', default='2')
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--rps', type=float, default=50.0)
+    parser.add_argument('--latency', type=float, default=0.1)
+    parser.add_argument('--latency-jitter', type=float, default=0.05)
+    parser.add_argument('--rate-429', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    register_success_level()
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        archive_path = args.archive
+        if archive_path is None:
+            archive_path = Path(archive_dir) / 'synthetic.jsonl.gz'
+            build_synthetic_archive(
+                archive_path, args.keyword, args.work_model, args.jobs
+            )
+        archive = HttpArchive(archive_path)
+
+        print(
+            f'{len(archive)} archived responses, latency {args.latency}s '
+            f'(+{args.latency_jitter}s), {args.rps} req/s limit\n'
+        )
+        print(
+            f'{"workers":>8}{"ids":>7}{"ids/sec":>10}'
+            f'{"jobs":>7}{"jobs/sec":>10}{"requests":>10}'
+        )
+        for workers in args.workers:
+            result = run_once(args, archive, workers)
+            print(
+                f'{result["workers"]:>8}{result["ids"]:>7}'
+                f'{result["ids_per_sec"]:>10.1f}{result["jobs"]:>7}'
+                f'{result["jobs_per_sec"]:>10.1f}{result["requests"]:>10}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark SkillExtractor's multi-pattern matcher against the per-pattern
+regex loop as the skill map grows.
+
+The legacy loop is timed on a sample of the documents (it is too slow to run
+on all of them) and its results are compared with the matcher's.
+
+Usage:
+    python -m benchmarks.bench_skill_matcher [--docs 100000]
+        [--skills 17 100 300] [--legacy-sample 2000]
+"""
+import argparse
+import logging
+import time
+
+from src.analysis.extracting_skills_list import SkillExtractor
+from src.utils.logger import register_success_level
+
+from .synthetic import make_descriptions, make_skill_map
+
+
+def legacy_extract(extractor: SkillExtractor, text: str) -> set:
+    """Search every compiled pattern of every skill, as before."""
+    normalized_text = extractor.normalize_text(text)
+    found_skills = set()
+    for skill_name, compiled_patterns in extractor.regex_patterns.items():
+        for pattern in compiled_patterns:
+            if pattern.search(normalized_text):
+                found_skills.add(skill_name)
+                break
+    return found_skills
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--docs', type=int, default=100_000)
+    parser.add_argument('--skills', type=int, nargs='+', default=[17, 100, 300])
+    parser.add_argument('--legacy-sample', type=int, default=2000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    register_success_level()
+
+    print(f'{args.docs} synthetic descriptions\n')
+    print(
+        f'{"skills":>7}{"legacy docs/s":>15}{"matcher docs/s":>16}'
+        f'{"speedup":>9}  identical'
+    )
+    for n_skills in args.skills:
+        skill_map = make_skill_map(n_skills)
+        docs = make_descriptions(args.docs, skill_map)
+        extractor = SkillExtractor(skill_map)
+        sample = docs[: args.legacy_sample]
+
+        start = time.perf_counter()
+        legacy = [legacy_extract(extractor, doc) for doc in sample]
+        legacy_rate = len(sample) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        matched = [extractor.extract_skills(doc) for doc in docs]
+        matcher_rate = len(docs) / (time.perf_counter() - start)
+
+        identical = all(
+            set(found) == expected
+            for found, expected in zip(matched, legacy)
+        )
+        print(
+            f'{n_skills:>7}{legacy_rate:>15.0f}{matcher_rate:>16.0f}'
+            f'{matcher_rate / legacy_rate:>8.1f}x  {identical}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark building the long-format skills table from per-job skill lists:
+the former iterrows loop versus the columnar construction, plus the sparse
+job x skill indicator matrix.
+
+Reports wall time and peak traced memory (tracemalloc) of each step.
+
+Usage:
+    python -m benchmarks.bench_skills_table [--rows 10000 100000]
+"""
+import argparse
+import logging
+import random
+import time
+import tracemalloc
+
+import pandas as pd
+
+from config.analysis import STANDARD_SKILL_MAP
+from src.analysis.extracting_skills_list import SkillExtractor
+from src.utils.logger import register_success_level
+
+
+def legacy_skills_table(df_processed: pd.DataFrame) -> pd.DataFrame:
+    """Build the skills table one dict per (job, skill) pair, as before."""
+    skills_data = []
+    for index, row in df_processed.iterrows():
+        for skill in row['skills_found']:
+            if skill:
+                skills_data.append({'job_id': row['job_id'], 'skill': skill})
+    return pd.DataFrame(skills_data)
+
+
+def measure(func, *args):
+    """Run `func` and return its result, wall time and peak memory (MiB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    register_success_level()
+    extractor = SkillExtractor(STANDARD_SKILL_MAP)
+    skills = list(STANDARD_SKILL_MAP)
+    rng = random.Random(0)
+
+    print(f'{"rows":>8}  {"step":<22}{"seconds":>9}{"peak MiB":>10}')
+    for n_rows in args.rows:
+        df_processed = pd.DataFrame(
+            {
+                'job_id': [str(4_000_000_000 + i) for i in range(n_rows)],
+                'job_description': ['x' * 2000] * n_rows,
+                'skills_found': [
+                    rng.sample(skills, rng.randint(0, 6))
+                    for _ in range(n_rows)
+                ],
+            }
+        )
+
+        legacy, legacy_time, legacy_peak = measure(
+            legacy_skills_table, df_processed
+        )
+        columnar, columnar_time, columnar_peak = measure(
+            extractor.build_skills_table,
+            df_processed['job_id'],
+            df_processed['skills_found'],
+        )
+        matrix, matrix_time, matrix_peak = measure(
+            extractor.skill_indicator_matrix,
+            columnar,
+            df_processed['job_id'],
+        )
+        assert legacy.equals(columnar), 'skills tables differ'
+        assert int(matrix.sum().sum()) == len(columnar)
+
+        for step, seconds, peak in [
+            ('iterrows (legacy)', legacy_time, legacy_peak),
+            ('columnar', columnar_time, columnar_peak),
+            ('sparse matrix', matrix_time, matrix_peak),
+        ]:
+            print(f'{n_rows:>8}  {step:<22}{seconds:>9.3f}{peak:>10.1f}')
+        print(
+            f'{"":>8}  speedup {legacy_time / columnar_time:.0f}x, '
+            f'matrix density {matrix.sparse.density:.3f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
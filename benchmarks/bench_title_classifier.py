@@ -0,0 +1,87 @@
+"""
+Benchmark job title classification on a skewed title distribution: the
+former per-row `.apply` with a loop over every role pattern versus
+`classify_titles`, which classifies each distinct normalized title once
+with a single scan over all role patterns.
+
+Usage:
+    python -m benchmarks.bench_title_classifier [--rows 10000 100000]
+"""
+import argparse
+import logging
+import re
+import time
+
+import pandas as pd
+
+from config.analysis import ROLE_PATTERNS, SPECIAL_CASES
+from src.analysis.analysis_utils import _classify_normalized, classify_titles
+from src.utils.logger import register_success_level
+
+from .synthetic import make_job_titles
+
+
+def legacy_title_classifier(title: str) -> str:
+    """Classify one title by trying every role pattern, as before."""
+    if not isinstance(title, str) or not title.strip():
+        return 'Outros'
+
+    title_lower = title.lower().strip()
+    matches = []
+
+    for role, patterns in ROLE_PATTERNS.items():
+        for pattern in patterns:
+            if re.search(pattern, title_lower):
+                matches.append(role)
+                break
+
+    if matches:
+        for candidate_role in matches:
+            special_rules = SPECIAL_CASES.get(candidate_role, [])
+            for exclude_pattern, new_role in special_rules:
+                if re.search(exclude_pattern, title_lower):
+                    if new_role:
+                        return new_role
+                    matches.remove(candidate_role)
+
+        for role in ROLE_PATTERNS.keys():
+            if role in matches:
+                return role
+
+    if any(word in title_lower for word in ['dados', 'data']):
+        return 'Outros Dados'
+
+    return 'Outros'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--distinct', type=int, default=2000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    register_success_level()
+
+    print(f'{"rows":>8}{"distinct":>10}  {"method":<18}{"seconds":>9}')
+    for n_rows in args.rows:
+        titles = pd.Series(make_job_titles(n_rows, args.distinct))
+        n_distinct = titles.str.lower().str.strip().nunique()
+
+        start = time.perf_counter()
+        legacy = titles.apply(legacy_title_classifier)
+        legacy_time = time.perf_counter() - start
+
+        _classify_normalized.cache_clear()
+        start = time.perf_counter()
+        memoized = classify_titles(titles)
+        memoized_time = time.perf_counter() - start
+
+        assert legacy.equals(memoized), 'classifications differ'
+        print(f'{n_rows:>8}{n_distinct:>10}  {"apply (legacy)":<18}{legacy_time:>9.3f}')
+        print(f'{"":>18}  {"classify_titles":<18}{memoized_time:>9.3f}')
+        print(f'{"":>18}  speedup {legacy_time / memoized_time:.0f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark HTTP transports against the local fixture server.
+
+Sends the same job page requests from several threads with each transport:
+a bare `requests.get` per request (a new connection every time), a shared
+session with the default adapter (10 pooled connections per host) and a
+session with one pooled connection per worker, as `JobScraper` mounts, plus
+the httpx client when installed. Reports requests/sec, connections opened,
+latency percentiles and the bytes received over the wire versus decoded.
+
+Usage:
+    python -m benchmarks.bench_transport [--requests 2000] [--workers 1 4 16]
+        [--latency 0.0] [--no-compress]
+"""
+import argparse
+import logging
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from src.scraping.fixture_server import FixtureServer
+from src.scraping.http_archive import HttpArchive
+from src.scraping.transport import (
+    ACCEPT_ENCODING,
+    HttpxSession,
+    TransportStats,
+    connections_opened,
+    mount_adapter,
+    resolve_client,
+)
+from src.utils.logger import register_success_level
+
+from .bench_scraper import JOB_URL, build_synthetic_archive
+
+HEADERS = {'Accept-Encoding': ACCEPT_ENCODING}
+
+
+def make_transports(
+    workers: int,
+) -> List[Tuple[str, Callable[[], Optional[object]]]]:
+    """List (name, factory) pairs; a factory returns a session or None."""
+
+    def default_session():
+        return requests.Session()
+
+    def tuned_session():
+        session = requests.Session()
+        mount_adapter(session, pool_connections=10, pool_maxsize=workers)
+        return session
+
+    transports = [
+        ('requests.get', lambda: None),
+        ('session (pool 10)', default_session),
+        (f'session (pool {workers})', tuned_session),
+    ]
+    if resolve_client('httpx') == 'httpx':
+        transports.append(('httpx', lambda: HttpxSession(workers)))
+    return transports
+
+
+def run_once(
+    urls: List[str], workers: int, session: Optional[object]
+) -> Dict[str, object]:
+    """Fetch every URL with `workers` threads and collect statistics."""
+    stats = TransportStats()
+    get = session.get if session is not None else requests.get
+
+    def fetch(url: str) -> None:
+        start = time.perf_counter()
+        response = get(url, headers=HEADERS, timeout=10)
+        stats.record(time.perf_counter() - start, response)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(fetch, urls))
+    elapsed = time.perf_counter() - start
+
+    summary = stats.summary()
+    summary['per_sec'] = len(urls) / elapsed
+    summary['connections'] = (
+        len(urls) if session is None else connections_opened(session)
+    )
+    if session is not None:
+        session.close()
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--jobs', type=int, default=100)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--no-compress', action='store_true')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    register_success_level()
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        archive_path = Path(archive_dir) / 'synthetic.jsonl.gz'
+        build_synthetic_archive(archive_path, 'Project Manager', '2', args.jobs)
+        archive = HttpArchive(archive_path)
+
+        with FixtureServer(
+            archive, latency=args.latency, compress=not args.no_compress
+        ) as server:
+            job_urls = [
+                JOB_URL.format(job_id=5_000_000_000 + i).replace(
+                    'http://fixtures', server.url
+                )
+                for i in range(args.jobs)
+            ]
+            urls = [job_urls[i % len(job_urls)] for i in range(args.requests)]
+
+            print(
+                f'{args.requests} requests, latency {args.latency}s, '
+                f'Accept-Encoding: {ACCEPT_ENCODING}\n'
+            )
+            print(
+                f'{"workers":>8}  {"transport":<20}{"req/sec":>9}{"conns":>7}'
+                f'{"p50 ms":>8}{"p95 ms":>8}{"wire MiB":>10}{"body MiB":>10}'
+            )
+            for workers in args.workers:
+                for name, factory in make_transports(workers):
+                    result = run_once(urls, workers, factory())
+                    print(
+                        f'{workers:>8}  {name:<20}{result["per_sec"]:>9.0f}'
+                        f'{result["connections"] or 0:>7}'
+                        f'{result["latency_p50"] * 1000:>8.2f}'
+                        f'{result["latency_p95"] * 1000:>8.2f}'
+                        f'{result["wire_bytes"] / 2**20:>10.2f}'
+                        f'{result["body_bytes"] / 2**20:>10.2f}'
+                    )
+
+
+if __name__ == '__main__':
+    main()
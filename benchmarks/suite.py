@@ -0,0 +1,364 @@
+"""
+Benchmark suite of the analysis hot paths, recording every run to a file.
+
+Runs each case on synthetic job titles, Portuguese/English descriptions,
+location strings and 'time_posted' strings at every size. A case is
+repeated up to --repeat times (stopping early once it has run for
+--max-seconds) and its best and median wall time are appended, one JSON
+line per case and size, to --output together with the commit, the Python
+and library versions and the machine. Every result is compared with the
+latest earlier one of the same case and size on this machine (or with the
+latest one of --baseline COMMIT) and slowdowns beyond --tolerance are
+flagged, so regressions between versions show up.
+
+Descriptions are drawn from a pool of at most DESCRIPTION_POOL distinct
+texts so that 1M rows fit in memory; skill extraction keeps no per-text
+cache, so repeated texts cost as much as new ones. The largest sizes take
+several minutes for the row-wise cases (extract_skills, parse_posted_date).
+
+Usage:
+    python -m benchmarks.suite [--sizes 1000 100000 1000000]
+        [--cases extract_skills classify_job_titles ...] [--repeat 3]
+        [--max-seconds 10] [--memory] [--output benchmarks/results.jsonl]
+        [--baseline COMMIT] [--tolerance 0.1] [--fail-on-regression]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.analysis import STANDARD_SKILL_MAP
+from src.analysis.analysis_utils import (
+    _classify_normalized,
+    classify_job_titles,
+    parse_posted_date,
+    parse_posted_dates,
+    standardize_locations,
+    title_classifier,
+)
+from src.analysis.extracting_skills_list import SkillExtractor
+from src.analysis.location_resolver import LocationResolver
+from src.utils.logger import register_success_level
+
+from .synthetic import (
+    make_descriptions,
+    make_job_titles,
+    make_locations,
+    make_time_posted,
+)
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+DEFAULT_OUTPUT = Path(__file__).parent / 'results.jsonl'
+DESCRIPTION_POOL = 100_000
+
+
+class SuiteData:
+    """The synthetic data of one size, generated on first use."""
+
+    def __init__(self, n_rows: int, seed: int = 0):
+        """
+        Initialize the SuiteData.
+
+        Args:
+            n_rows (int): Rows of every column.
+            seed (int, optional): Seed of the generators. Defaults to 0.
+        """
+        self.n_rows = n_rows
+        self.seed = seed
+
+    @cached_property
+    def extractor(self) -> SkillExtractor:
+        return SkillExtractor(STANDARD_SKILL_MAP)
+
+    @cached_property
+    def descriptions(self) -> List[str]:
+        pool = make_descriptions(
+            min(self.n_rows, DESCRIPTION_POOL), seed=self.seed
+        )
+        if self.n_rows <= len(pool):
+            return pool
+        return random.Random(self.seed).choices(pool, k=self.n_rows)
+
+    @cached_property
+    def jobs(self) -> pd.DataFrame:
+        """Postings with the columns read by the analysis steps."""
+        rng = np.random.default_rng(self.seed)
+        return pd.DataFrame(
+            {
+                'job_id': [str(4_000_000_000 + i) for i in range(self.n_rows)],
+                'job_title': make_job_titles(self.n_rows, seed=self.seed),
+                'job_description': self.descriptions,
+                'location': make_locations(self.n_rows, seed=self.seed),
+                'time_posted': make_time_posted(self.n_rows, seed=self.seed),
+                'scrape_date': pd.Timestamp('2025-05-10 12:00:00')
+                - pd.to_timedelta(rng.integers(0, 90, self.n_rows), unit='D'),
+            }
+        )
+
+
+def bench_extract_skills(data: SuiteData) -> Callable[[], Any]:
+    extractor, descriptions = data.extractor, data.descriptions
+    return lambda: [extractor.extract_skills(text) for text in descriptions]
+
+
+def bench_process_dataframe(data: SuiteData) -> Callable[[], Any]:
+    extractor = data.extractor
+    df = data.jobs[['job_id', 'job_description']]
+    return lambda: extractor.process_dataframe(df, 'job_description')
+
+
+def bench_title_classifier(data: SuiteData) -> Callable[[], Any]:
+    # Start every repeat with a cold cache, as a new run would.
+    _classify_normalized.cache_clear()
+    titles = data.jobs['job_title'].tolist()
+    return lambda: [title_classifier(title) for title in titles]
+
+
+def bench_classify_job_titles(data: SuiteData) -> Callable[[], Any]:
+    _classify_normalized.cache_clear()
+    df = data.jobs[['job_id', 'job_title']]
+    return lambda: classify_job_titles(df=df, output_path=None)
+
+
+def bench_parse_posted_date(data: SuiteData) -> Callable[[], Any]:
+    df = data.jobs[['time_posted', 'scrape_date']]
+    return lambda: df.apply(parse_posted_date, axis=1)
+
+
+def bench_parse_posted_dates(data: SuiteData) -> Callable[[], Any]:
+    df = data.jobs
+    return lambda: parse_posted_dates(df['time_posted'], df['scrape_date'])
+
+
+def bench_standardize_locations(data: SuiteData) -> Callable[[], Any]:
+    df = data.jobs[['job_id', 'location']].copy()
+    return lambda: standardize_locations(df, resolver=LocationResolver())
+
+
+# Each case prepares a repeat (outside the timing) and returns the call timed.
+CASES: Dict[str, Callable[[SuiteData], Callable[[], Any]]] = {
+    'extract_skills': bench_extract_skills,
+    'process_dataframe': bench_process_dataframe,
+    'title_classifier': bench_title_classifier,
+    'classify_job_titles': bench_classify_job_titles,
+    'parse_posted_date': bench_parse_posted_date,
+    'parse_posted_dates': bench_parse_posted_dates,
+    'standardize_locations': bench_standardize_locations,
+}
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the code version and machine the results belong to."""
+
+    def git(*args: str) -> Optional[str]:
+        try:
+            return subprocess.run(
+                ['git', *args],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=Path(__file__).parent,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = git('status', '--porcelain', '--untracked-files=no')
+    return {
+        'commit': git('rev-parse', '--short', 'HEAD'),
+        'dirty': bool(status) if status is not None else None,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.node(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def run_case(
+    case: str,
+    data: SuiteData,
+    repeat: int,
+    max_seconds: float,
+    memory: bool,
+) -> Dict[str, Any]:
+    """
+    Time a case on one size.
+
+    Args:
+        case (str): The name of the case in `CASES`.
+        data (SuiteData): The data of the size.
+        repeat (int): Maximum number of timed runs.
+        max_seconds (float): No further run starts once the runs so far
+            took this long.
+        memory (bool): Also measure the peak traced memory, in an extra
+            run under tracemalloc.
+
+    Returns:
+        Dict[str, Any]: The case, rows, runs, best and median seconds, rows
+            per second of the best run and peak MiB (None without `memory`).
+    """
+    timings = []
+    while len(timings) < repeat and sum(timings) < max_seconds:
+        func = CASES[case](data)
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        func = CASES[case](data)
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        'case': case,
+        'rows': data.n_rows,
+        'runs': len(timings),
+        'best_seconds': best,
+        'median_seconds': statistics.median(timings),
+        'rows_per_second': data.n_rows / best if best > 0 else None,
+        'peak_mib': peak,
+    }
+
+
+def load_results(path: Path) -> List[Dict[str, Any]]:
+    """Read the results recorded so far, oldest first."""
+    if not path.exists():
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_baseline(
+    history: List[Dict[str, Any]],
+    result: Dict[str, Any],
+    baseline: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Find the recorded result to compare a new one with.
+
+    Args:
+        history (List[Dict[str, Any]]): The recorded results, oldest first.
+        result (Dict[str, Any]): The new result.
+        baseline (Optional[str], optional): Only consider results of commits
+            starting with this. Defaults to any earlier run.
+
+    Returns:
+        Optional[Dict[str, Any]]: The latest matching result of the same
+            case and size on the same machine, if any.
+    """
+    for previous in reversed(history):
+        if (
+            previous['case'] == result['case']
+            and previous['rows'] == result['rows']
+            and previous['machine'] == result['machine']
+            and (
+                baseline is None
+                or (previous['commit'] or '').startswith(baseline)
+            )
+        ):
+            return previous
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument(
+        '--cases', nargs='+', choices=list(CASES), default=list(CASES)
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-seconds', type=float, default=10.0)
+    parser.add_argument(
+        '--memory',
+        action='store_true',
+        help='Also measure the peak traced memory (one extra run per case).',
+    )
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        '--baseline',
+        metavar='COMMIT',
+        help='Compare with this commit instead of the previous run.',
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.1,
+        help='Relative slowdown of the best time flagged as a regression.',
+    )
+    parser.add_argument(
+        '--fail-on-regression',
+        action='store_true',
+        help='Exit with status 1 if any case regressed.',
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    register_success_level()
+    history = load_results(args.output)
+    run = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        **environment(),
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    dirty = ' (uncommitted changes)' if run['dirty'] else ''
+    print(f"commit {run['commit']}{dirty}, Python {run['python']}, {run['machine']}")
+
+    regressions = []
+    print(
+        f'{"case":<24}{"rows":>9}{"runs":>6}{"best s":>10}'
+        f'{"rows/s":>12}{"peak MiB":>10}  baseline'
+    )
+    for n_rows in args.sizes:
+        data = SuiteData(n_rows)
+        for case in args.cases:
+            result = run_case(
+                case, data, args.repeat, args.max_seconds, args.memory
+            )
+            result = {**run, **result}
+            with open(args.output, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(result) + '\n')
+
+            previous = find_baseline(history, result, args.baseline)
+            comparison = ''
+            if previous is not None:
+                ratio = result['best_seconds'] / previous['best_seconds']
+                label = (previous['commit'] or '?') + ('+' if previous['dirty'] else '')
+                comparison = f'{ratio:.2f}x the time of {label}'
+                if ratio > 1 + args.tolerance:
+                    comparison += '  REGRESSION'
+                    regressions.append(f'{case} ({n_rows} rows)')
+            peak = f"{result['peak_mib']:.1f}" if args.memory else '-'
+            print(
+                f"{case:<24}{n_rows:>9}{result['runs']:>6}"
+                f"{result['best_seconds']:>10.3f}"
+                f"{result['rows_per_second'] or 0:>12.0f}{peak:>10}  {comparison}"
+            )
+
+    print(f'Results appended to {args.output}')
+    if regressions:
+        print(f"Regressions beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+"""Synthetic data generators shared by the benchmarks."""
+import random
+from typing import Dict, List, Optional
+
+from config.analysis import BRAZILIAN_STATES, REGION_CITIES, STANDARD_SKILL_MAP
+
+FILLER_PT = (
+    'buscamos profissional para atuar com gestão de projetos em ambiente '
+    'dinâmico responsável por planejamento acompanhamento de cronogramas '
+    'riscos orçamento e comunicação com stakeholders experiência em '
+    'metodologias ágeis e tradicionais inglês avançado será um diferencial '
+    'oferecemos plano de saúde vale refeição e trabalho remoto'
+).split()
+FILLER_EN = (
+    'we are looking for a professional to lead cross functional teams '
+    'deliver projects on time and within budget manage risks and '
+    'communicate with stakeholders experience with agile and waterfall '
+    'methodologies strong communication skills remote friendly benefits'
+).split()
+SKILL_MENTIONS = [
+    'Jira', 'Confluence', 'MS Project', 'Microsoft Project', 'Excel',
+    'Trello', 'Asana', 'monday.com', 'ClickUp', 'PMO', 'Scrum', 'Kanban',
+    'Extreme Programming', 'XP', 'Agile', 'Certified Scrum Master', 'CSM',
+    'PMP', 'Prince2', 'OKRs', 'Power BI', 'SQL', 'Python',
+]
+
+
+def make_skill_map(
+    n_skills: int, seed: int = 0
+) -> Dict[str, List[str]]:
+    """
+    Build a skill map with `n_skills` skills in the style of
+    `STANDARD_SKILL_MAP`, starting with the real skills.
+    """
+    rng = random.Random(seed)
+    skill_map = dict(list(STANDARD_SKILL_MAP.items())[:n_skills])
+    while len(skill_map) < n_skills:
+        name = ''.join(
+            rng.choice('abcdefghijklmnopqrstuvwxyz')
+            for _ in range(rng.randint(3, 9))
+        )
+        suffix = rng.choice(['', 's', 'ing', 'ops'])
+        patterns = [rf'\b{name}\b']
+        if suffix:
+            patterns.append(rf'\b{name}\s?{suffix}\b')
+        if rng.random() < 0.2:
+            patterns.append(rf'\b{name}[s]?\b')
+        skill_map.setdefault(name, patterns)
+    return skill_map
+
+
+def make_descriptions(
+    n_docs: int,
+    skill_map: Optional[Dict[str, List[str]]] = None,
+    words_per_doc: int = 250,
+    seed: int = 0,
+) -> List[str]:
+    """
+    Generate Portuguese/English job descriptions sprinkled with skill
+    mentions (real ones plus the synthetic names in `skill_map`).
+    """
+    rng = random.Random(seed)
+    mentions = list(SKILL_MENTIONS)
+    if skill_map:
+        mentions += [name for name in skill_map if name.isalpha()]
+
+    docs = []
+    for _ in range(n_docs):
+        filler = FILLER_PT if rng.random() < 0.7 else FILLER_EN
+        words = rng.choices(filler, k=words_per_doc)
+        for _ in range(rng.randint(0, 12)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(mentions))
+        docs.append(' '.join(words))
+    return docs
+
+
+TITLE_ROLES = [
+    'Gerente de Projetos', 'Project Manager', 'Scrum Master',
+    'Product Owner', 'Analista PMO', 'Agile Coach', 'Coach Ágil',
+    'Coordenador de Projetos', 'Gestor de Projetos', 'Dono de Produto',
+    'Analista de Dados', 'Data Engineer', 'Analista de Sistemas',
+    'Engenheiro de Software', 'Vendedor',
+]
+TITLE_PREFIXES = ['', 'Sr. ', 'Senior ', 'Pleno ', 'Júnior ', 'Lead ']
+TITLE_SUFFIXES = [
+    '', ' Sênior', ' Pleno', ' Jr', ' - Remoto', ' (Híbrido)', ' TI',
+    ' - Banco', ' | SAFe', ' PMP', ' - Vaga Afirmativa', ' Bilíngue',
+]
+
+
+def make_job_titles(
+    n_titles: int, n_distinct: int = 2000, skew: float = 1.1, seed: int = 0
+) -> List[str]:
+    """
+    Generate job titles with a Zipf-like frequency distribution: a few
+    titles account for most postings and there is a long tail of variants
+    (seniority, work model and casing/spacing differences).
+    """
+    rng = random.Random(seed)
+    distinct = []
+    seen = set()
+    while len(distinct) < n_distinct:
+        title = (
+            rng.choice(TITLE_PREFIXES)
+            + rng.choice(TITLE_ROLES)
+            + rng.choice(TITLE_SUFFIXES)
+        )
+        if rng.random() < 0.1:
+            title = title.upper()
+        if rng.random() < 0.05:
+            title = f' {title} '
+        if rng.random() < 0.3:
+            title += f' {rng.randint(1, 999)}'
+        if title not in seen:
+            seen.add(title)
+            distinct.append(title)
+    weights = [1 / (rank + 1) ** skew for rank in range(n_distinct)]
+    return rng.choices(distinct, weights=weights, k=n_titles)
+
+
+def make_postings(
+    n_postings: int,
+    duplicate_rate: float = 0.2,
+    description_length: int = 150,
+    seed: int = 0,
+) -> List[Dict[str, Optional[str]]]:
+    """
+    Generate raw job postings with the scraper's fields. About
+    `duplicate_rate` of them repost an earlier vacancy (same deduplication
+    fields, new job ID), as LinkedIn searches return.
+    """
+    rng = random.Random(seed)
+    titles = make_job_titles(n_postings, seed=seed)
+    companies = [f'Empresa {i}' for i in range(max(1, n_postings // 20))]
+    xp_levels = ['Assistente', 'Pleno-sênior', 'Diretor', 'Executivo', None]
+    job_types = ['Tempo integral', 'Contrato', 'Temporário']
+    sectors = ['Tecnologia da Informação', 'Serviços financeiros', 'Varejo']
+    filler = FILLER_PT + FILLER_EN + SKILL_MENTIONS
+
+    postings = []
+    for i in range(n_postings):
+        if postings and rng.random() < duplicate_rate:
+            posting = dict(rng.choice(postings))
+        else:
+            posting = {
+                'work_model': rng.choice(['1', '2', '3']),
+                'keyword': 'Project Manager',
+                'job_title': titles[i],
+                'company_name': rng.choice(companies),
+                'location': 'São Paulo, SP',
+                'xp_level': rng.choice(xp_levels),
+                'job_type': rng.choice(job_types),
+                'job_sectors': rng.choice(sectors),
+                'job_description': ' '.join(
+                    rng.choices(filler, k=description_length)
+                ),
+            }
+        posting['job_id'] = str(4_000_000_000 + i)
+        posting['scrape_date'] = '17-10-2026 10:00:00'
+        postings.append(posting)
+    return postings
+
+
+LOCATION_CITIES = [
+    'São Paulo', 'Rio de Janeiro', 'Belo Horizonte', 'Curitiba',
+    'Porto Alegre', 'Campinas', 'Barueri', 'Florianópolis', 'Recife',
+    'Joinville', 'São José dos Campos', 'Osasco', 'Uberlândia', 'Londrina',
+] + list(REGION_CITIES)
+TIME_POSTED = [
+    'Há 5 minutos', 'Há 1 hora', 'Há 3 horas', 'Há 1 dia', 'Há 2 dias',
+    'Há 1 semana', 'Há 3 semanas', 'Há 1 mês', 'Há 2 meses', 'Há 1 ano',
+    'Reposted há 2 dias', None,
+]
+
+
+def make_locations(
+    n_locations: int, n_distinct: int = 500, skew: float = 1.1, seed: int = 0
+) -> List[Optional[str]]:
+    """
+    Generate LinkedIn location strings in the formats the scraper sees
+    ('São Paulo, SP', 'Curitiba e Região', 'Minas Gerais, Brasil', 'Brasil',
+    ...), with a Zipf-like frequency distribution like `make_job_titles`
+    and a few missing values.
+    """
+    rng = random.Random(seed)
+    states = list(BRAZILIAN_STATES.items())
+    formats = [
+        lambda city, abbrev, state: f'{city}, {abbrev}',
+        lambda city, abbrev, state: f'{city}, {state}',
+        lambda city, abbrev, state: f'{city}, {state}, Brasil',
+        lambda city, abbrev, state: f'{city}, Brasil',
+        lambda city, abbrev, state: f'{city} e Região',
+        lambda city, abbrev, state: f'{state}, Brasil',
+        lambda city, abbrev, state: state,
+        lambda city, abbrev, state: 'Brasil',
+    ]
+    distinct = []
+    seen = set()
+    while len(distinct) < n_distinct:
+        city = rng.choice(LOCATION_CITIES)
+        if rng.random() < 0.3:
+            # Neighbourhoods and smaller towns the resolver doesn't know.
+            region = rng.choice(['Norte', 'Sul', 'Leste', 'Oeste'])
+            city += f' {region} {rng.randint(1, 99)}'
+        abbrev, state = rng.choice(states)
+        location = rng.choice(formats)(city, abbrev, state)
+        if location not in seen:
+            seen.add(location)
+            distinct.append(location)
+    weights = [1 / (rank + 1) ** skew for rank in range(n_distinct)]
+    locations = rng.choices(distinct, weights=weights, k=n_locations)
+    for i in rng.sample(range(n_locations), n_locations // 100):
+        locations[i] = None
+    return locations
+
+
+def make_time_posted(n_rows: int, seed: int = 0) -> List[Optional[str]]:
+    """Generate 'time_posted' strings ('Há 2 dias', ...) and a few missing ones."""
+    rng = random.Random(seed)
+    return rng.choices(TIME_POSTED, k=n_rows)
@@ -1,4 +1,5 @@
 import re
+from pathlib import Path
 
 ROLE_PATTERNS = {
     "project_manager": [re.compile(r"(project manager|gerente de projetos|gestor de projetos)", re.I)],
@@ -8,6 +9,9 @@ ROLE_PATTERNS = {
     "agile_coach": [re.compile(r"(agile coach|coach ágil)", re.I)],
 }
 
+# Distinct normalized titles whose classification is kept in memory.
+TITLE_CACHE_SIZE = 65536
+
 STANDARD_SKILL_MAP = {
     "jira": [r"\bjira\b"],
     "confluence": [r"\bconfluence\b"],
@@ -98,3 +102,14 @@ REGION_CITIES = {
     'Palmas': 'TO',
     'Campinas': 'SP',
 }
+
+# Locations whose state couldn't be determined, written by LocationResolver.
+UNRESOLVED_LOCATIONS_PATH = Path('data/processed/unresolved_locations.csv')
+
+# Near-duplicate postings (reposts with small edits to the description):
+# estimated Jaccard similarity of the descriptions' word shingles above which
+# two postings are the same vacancy, MinHash signature length and words per
+# shingle.
+NEAR_DUPLICATE_THRESHOLD = 0.8
+MINHASH_NUM_PERM = 128
+SHINGLE_SIZE = 5
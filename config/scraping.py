@@ -1,3 +1,5 @@
+from pathlib import Path
+
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/93.0.4577.63 Safari/537.36',
@@ -27,9 +29,56 @@ KEYWORDS = [
     'PMO',
     'Agile Coach',
     'Coordenador de Projetos',
-    'Coordenador de Projetos',
     'Especialista em Projetos',
     'Analista de Projetos',
     'Gestor de Portfolio',
     'Portfolio Manager'
 ]
+
+LINKEDIN_BASE_URL = 'https://www.linkedin.com'
+
+# Concurrency and politeness settings for detailed job fetching
+MAX_WORKERS = 4
+REQUESTS_PER_SECOND = 2.0
+RATE_LIMIT_BURST = 2
+# Adaptive rate (AIMD) between MIN_REQUESTS_PER_SECOND and
+# REQUESTS_PER_SECOND: each 429 multiplies the rate by RATE_DECREASE_FACTOR,
+# successful requests add back about RATE_INCREASE requests/s per second.
+# Retries wait a jittered backoff of up to MAX_BACKOFF seconds, or the
+# Retry-After time (capped at MAX_RETRY_AFTER).
+MIN_REQUESTS_PER_SECOND = 0.2
+RATE_DECREASE_FACTOR = 0.5
+RATE_INCREASE = 0.1
+MAX_BACKOFF = 60
+MAX_RETRY_AFTER = 300
+
+# HTTP transport: client ('requests' or 'httpx', which is needed for HTTP/2
+# and falls back to 'requests' if not installed), hosts with a connection
+# pool and request timeout in seconds. Connections kept alive per host
+# default to MAX_WORKERS.
+HTTP_CLIENT = 'requests'
+HTTP2 = False
+POOL_CONNECTIONS = 10
+REQUEST_TIMEOUT = 10
+# Search result pages of one keyword/work model in flight at once. Streams
+# are crawled concurrently; above 1, pages past the last result are wasted.
+SEARCH_PAGES_AHEAD = 1
+# A search stops after LOW_YIELD_PAGES pages in a row where fewer than
+# LOW_YIELD_THRESHOLD of the cards were new IDs (0 pages disables this)
+LOW_YIELD_THRESHOLD = 0.2
+LOW_YIELD_PAGES = 3
+# Per-keyword overlap of the search results of the last ID crawl
+KEYWORD_OVERLAP_PATH = Path('data/processed/keyword_overlap.csv')
+
+# Job data / job ID cache storage ('sqlite' or 'pickle')
+CACHE_BACKEND = 'sqlite'
+CACHE_DIR = Path('data/cache')
+# Seconds the job counts per keyword are reused before being fetched again
+JOB_AMOUNT_TTL = 6 * 60 * 60
+
+# HTML parser used on job pages ('auto', 'selectolax', 'lxml' or 'bs4')
+HTML_PARSER_BACKEND = 'auto'
+
+# HTTP record/replay ('live', 'record' or 'replay') and archive location
+HTTP_MODE = 'live'
+HTTP_ARCHIVE_PATH = Path('data/http_archive/linkedin.jsonl.gz')
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+# 'parquet' or 'csv'
+STORAGE_FORMAT = 'parquet'
+
+# Paths without suffix: Parquet data lives in a directory (raw jobs) or a
+# .parquet file (processed tables), CSV data in a .csv file.
+RAW_JOBS_PATH = Path('data/raw/jobs_data')
+PROCESSED_DIR = Path('data/processed')
+
+# Processed tables appended to by the streaming pipeline, in batches of
+# STREAM_BATCH_SIZE scraped jobs.
+STREAMING_OUTPUT_DIR = PROCESSED_DIR / 'streaming'
+STREAM_BATCH_SIZE = 100
+
+# Postings equal in all these columns (after normalizing case and
+# whitespace) are the same vacancy posted again. Their 64-bit fingerprint is
+# stored with every raw record in FINGERPRINT_COLUMN.
+DEDUP_COLUMNS = [
+    'work_model',
+    'job_title',
+    'company_name',
+    'xp_level',
+    'job_type',
+    'job_sectors',
+    'job_description',
+]
+FINGERPRINT_COLUMN = 'fingerprint'
+
+# Low-cardinality columns stored as dictionary-encoded categoricals.
+CATEGORICAL_COLUMNS = ['work_model', 'keyword', 'xp_level', 'job_type']
+
+# Arrow types of the processed table columns that aren't strings. Tables
+# appended in batches are cast to them, so every part file has the same
+# schema whatever a batch contains (e.g. whole applicant counts, which
+# pandas would otherwise store as int64 in one batch and double in another).
+TABLE_COLUMN_TYPES = {
+    'num_applicants': 'double',
+    'scrape_date': 'timestamp[ns]',
+    FINGERPRINT_COLUMN: 'int64',
+}
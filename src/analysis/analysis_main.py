@@ -1,94 +1,218 @@
+import argparse
 import logging
-from pathlib import Path
+from typing import Optional, Tuple
 
 import pandas as pd
 
-from config.analysis import STANDARD_SKILL_MAP
+from config.analysis import NEAR_DUPLICATE_THRESHOLD, STANDARD_SKILL_MAP
+from config.storage import FINGERPRINT_COLUMN, PROCESSED_DIR, STORAGE_FORMAT
 
 from ..utils.logger import setup_logging
+from ..utils.metrics import enable_metrics, metrics
+from ..utils.profiling import add_profiling_arguments, profiling_from_args
+from ..utils.storage import STORAGE_FORMATS, JobDataset, write_table
 from .analysis_utils import (
+    add_posting_dates,
     classify_job_titles,
-    parse_posted_date,
     standardize_locations,
 )
 from .extracting_skills_list import SkillExtractor
+from .incremental import run_incremental
+from .location_resolver import LocationResolver
+from .near_duplicates import drop_near_duplicates
 
 logger = logging.getLogger(__name__)
 
 
-def run_pipeline(classify_titles: bool = True):
-    """Execute main pipeline with optional classification."""
+def process_jobs(
+    jobs_data: pd.DataFrame,
+    extractor: SkillExtractor,
+    location_resolver: LocationResolver,
+    classify_titles: bool = True,
+    n_jobs: int = 1,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Run the analysis stages on deduplicated raw job postings.
+
+    Extracts the skills, optionally classifies the titles, parses the
+    posting dates and standardizes the locations. An error while
+    classifying the titles, or while converting the dates and locations, is
+    logged and the run continues without that step.
+
+    Args:
+        jobs_data: The deduplicated raw job postings.
+        extractor: The SkillExtractor with the current skill map.
+        location_resolver: The LocationResolver to use.
+        classify_titles: Whether to classify job titles.
+        n_jobs: Number of worker processes for skill extraction
+            (-1 uses all CPUs).
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The processed jobs DataFrame and
+            the long-format skills DataFrame.
+    """
+    df_jobs, df_skills = extractor.process_dataframe(
+        jobs_data, text_column='job_description', n_jobs=n_jobs
+    )
+    logger.success(
+        f'Successfully extracted skills from {len(jobs_data)} postings.'
+    )
+
+    if classify_titles:
+        try:
+            logger.info('Starting job title classification')
+            df_jobs = classify_job_titles(df=df_jobs, output_path=None)
+            logger.success(f'Successfully classified job titles.')
+        except Exception as e:
+            logger.error(f'Error while classifying job titles: {e}')
+
     try:
-        logger.info('Starting job skills extraction.')
+        # Work on a copy so a failure leaves the columns as scraped instead
+        # of half converted.
+        treated = add_posting_dates(df_jobs.copy())
+        treated['post_date'] = treated['post_date'].dt.strftime(
+            '%d-%m-%Y %H:%M:%S'
+        )
 
-        extractor = SkillExtractor(STANDARD_SKILL_MAP)
+        treated = standardize_locations(treated, 'location', location_resolver)
 
-        dataset_path = Path('data/raw/jobs_data.csv')
-        jobs_data = pd.read_csv(dataset_path)
-        # Removing same vacancies posted more than one time
-        jobs_data_unique = jobs_data.drop_duplicates(
-            subset=[
-                'work_model',
-                'job_title',
-                'company_name',
-                'xp_level',
-                'job_type',
-                'job_sectors',
-                'job_description',
-            ]
-        )
-        df_jobs, df_skills = extractor.process_dataframe(
-            jobs_data_unique, text_column='job_description'
-        )
-        logger.success(
-            f'Successfully extracted skills from {len(jobs_data)} postings.'
+        df_jobs = treated.drop(columns=['time_posted', 'location'])
+
+    except Exception as e:
+        logger.error(
+            f'Error while treating df_jobs columns, keeping them as scraped: {e}'
         )
 
-        if classify_titles:
-            try:
-                logger.info('Starting job title classification')
-                df_jobs = classify_job_titles(df=df_jobs, output_path=None)
-                output_path = Path('data/processed/df_jobs_classified.csv')
-                logger.success(f'Successfully classified job titles.')
-            except Exception as e:
-                logger.error(f'Error while classifying job titles: {e}')
-        else:
-            output_path = Path('data/processed/df_jobs.csv')
+    return df_jobs, df_skills
+
+
+def run_pipeline(
+    classify_titles: bool = True,
+    n_jobs: int = 1,
+    incremental: bool = False,
+    storage_format: str = STORAGE_FORMAT,
+    near_duplicate_threshold: Optional[float] = None,
+):
+    """
+    Execute main pipeline with optional classification.
+
+    Args:
+        classify_titles: Whether to classify job titles.
+        n_jobs: Number of worker processes for skill extraction
+            (-1 uses all CPUs).
+        incremental: Reuse the results stored by previous runs and only
+            process postings (or stages) whose inputs changed. The outputs
+            are the same as a full run.
+        storage_format: Format of the raw dataset read and of the processed
+            tables written, 'parquet' or 'csv'.
+        near_duplicate_threshold: Also drop reposts whose description was
+            slightly edited: postings whose descriptions have an estimated
+            Jaccard similarity of at least this value are clustered and only
+            the first one is kept (e.g. `NEAR_DUPLICATE_THRESHOLD`).
+            Defaults to None (exact duplicates only).
+    """
+    extractor = SkillExtractor(STANDARD_SKILL_MAP)
+    try:
+        logger.info('Starting job skills extraction.')
+
+        location_resolver = LocationResolver()
 
-        try:
-            df_jobs['num_applicants'] = df_jobs['num_applicants'].str.extract(
-                r'(\d+)'
-            )
-            df_jobs['num_applicants'] = pd.to_numeric(
-                df_jobs['num_applicants']
+        with metrics.timer('analysis.read_raw') as timer:
+            jobs_data = JobDataset(storage_format=storage_format).read()
+            timer.add_records(len(jobs_data))
+        # Removing same vacancies posted more than one time
+        with metrics.timer('analysis.deduplication', len(jobs_data)):
+            jobs_data_unique = jobs_data.drop_duplicates(
+                subset=FINGERPRINT_COLUMN
             )
+            if near_duplicate_threshold is not None:
+                jobs_data_unique = drop_near_duplicates(
+                    jobs_data_unique, threshold=near_duplicate_threshold
+                )
+        metrics.count(
+            'analysis.duplicates_dropped', len(jobs_data) - len(jobs_data_unique)
+        )
+        output_path = PROCESSED_DIR / (
+            'df_jobs_classified' if classify_titles else 'df_jobs'
+        )
 
-            df_jobs['scrape_date'] = pd.to_datetime(
-                df_jobs['scrape_date'], format='%d-%m-%Y %H:%M:%S'
+        if incremental:
+            df_jobs, df_skills = run_incremental(
+                jobs_data_unique,
+                extractor,
+                classify_titles=classify_titles,
+                n_jobs=n_jobs,
+                resolver=location_resolver,
             )
-            df_jobs['post_date'] = df_jobs.apply(parse_posted_date, axis=1)
-            df_jobs['post_date'] = df_jobs['post_date'].dt.strftime(
-                '%d-%m-%Y %H:%M:%S'
+            with metrics.timer('analysis.write', len(df_jobs)):
+                write_table(df_jobs, output_path, storage_format)
+                write_table(df_skills, PROCESSED_DIR / 'df_skills', storage_format)
+            location_resolver.export_report()
+            logger.success(
+                f'Successfully exported {storage_format} files with {len(df_jobs)} data jobs info and their skills required.'
             )
-
-            df_jobs = standardize_locations(df_jobs, 'location')
-
-            df_jobs.drop(columns=['time_posted', 'location'], inplace=True)
-
-        except Exception as e:
-            logger.error(f'Error while treating df_jobs columns: {e}')
-
-        extractor.export(df_jobs, output_path)
-        extractor.export(df_skills, Path('data/processed/df_skills.csv'))
+            return
+
+        df_jobs, df_skills = process_jobs(
+            jobs_data_unique,
+            extractor,
+            location_resolver,
+            classify_titles=classify_titles,
+            n_jobs=n_jobs,
+        )
+        with metrics.timer('analysis.write', len(df_jobs)):
+            write_table(df_jobs, output_path, storage_format)
+            write_table(df_skills, PROCESSED_DIR / 'df_skills', storage_format)
+        location_resolver.export_report()
         logger.success(
-            f'Successfully exported CSV file with {len(df_jobs)} data jobs info and their skills required.'
+            f'Successfully exported {storage_format} files with {len(df_jobs)} data jobs info and their skills required.'
         )
 
     except Exception as e:
         logger.error(f'Pipeline failed: {e}')
         raise
+    finally:
+        extractor.close()
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Extract skills from the scraped job postings.'
+    )
+    parser.add_argument('--no-classify', action='store_true')
+    parser.add_argument(
+        '--n-jobs',
+        type=int,
+        default=1,
+        help='Worker processes for skill extraction (-1 uses all CPUs).',
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only process postings (or stages) whose inputs changed.',
+    )
+    parser.add_argument(
+        '--near-duplicates',
+        type=float,
+        nargs='?',
+        const=NEAR_DUPLICATE_THRESHOLD,
+        metavar='THRESHOLD',
+        help='Also drop near-duplicate descriptions (estimated Jaccard '
+        f'similarity, default {NEAR_DUPLICATE_THRESHOLD}).',
+    )
+    parser.add_argument(
+        '--storage-format', choices=STORAGE_FORMATS, default=STORAGE_FORMAT
+    )
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+
     setup_logging()
-    run_pipeline(classify_titles=True)
+    enable_metrics()
+    profiling_from_args(args)
+    run_pipeline(
+        classify_titles=not args.no_classify,
+        n_jobs=args.n_jobs,
+        incremental=args.incremental,
+        storage_format=args.storage_format,
+        near_duplicate_threshold=args.near_duplicates,
+    )
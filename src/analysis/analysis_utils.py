@@ -1,26 +1,48 @@
 import logging
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from config.analysis import (
-    BRAZILIAN_STATES,
-    REGION_CITIES,
     ROLE_PATTERNS,
     SPECIAL_CASES,
+    TITLE_CACHE_SIZE,
 )
 
 from ..utils.logger import setup_logging
+from ..utils.metrics import metrics
+from .location_resolver import LocationResolver
+from .pattern_matcher import MultiPatternMatcher
 
 logger = logging.getLogger(__name__)
 
+# All role patterns, matched against a title in one scan.
+_ROLE_MATCHER = MultiPatternMatcher(ROLE_PATTERNS)
+
+# Unit substrings of 'time_posted' strings, checked in this order, and the
+# time span of one unit.
+POSTED_DATE_UNITS = [
+    ('minuto', pd.Timedelta(minutes=1)),
+    ('hora', pd.Timedelta(hours=1)),
+    ('dia', pd.Timedelta(days=1)),
+    ('semana', pd.Timedelta(weeks=1)),
+    ('mes', pd.Timedelta(days=30)),
+    ('mês', pd.Timedelta(days=30)),
+    ('ano', pd.Timedelta(days=365)),
+]
+# The second and third whitespace-separated tokens: the amount and unit.
+_TIME_POSTED_RE = r'^\s*\S+\s+(\S+)\s+(\S+)'
+
 
 def title_classifier(title: str) -> str:
     """
     Classifies job titles into standardized categories using pattern matching and special rules.
+    Results are memoized per normalized title.
 
     Args:
         title: The raw job title string to classify.
@@ -35,14 +57,23 @@ def title_classifier(title: str) -> str:
         )
         return 'Outros'
 
-    title_lower = title.lower().strip()
-    matches = []
+    return _classify_normalized(title.lower().strip())
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def _classify_normalized(title_lower: str) -> str:
+    """
+    Classify a lowercased, stripped job title.
+
+    Titles repeat heavily across postings, so results are memoized.
+
+    Args:
+        title_lower: The normalized job title.
 
-    for role, patterns in ROLE_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, title_lower):
-                matches.append(role)
-                break
+    Returns:
+        str: The standardized job category.
+    """
+    matches = _ROLE_MATCHER.find(title_lower)
 
     if matches:
         for candidate_role in matches:
@@ -127,6 +158,38 @@ def test_classifier(
         logger.success(summary_message)
 
 
+@metrics.timed(
+    'analysis.title_classification', records=lambda titles: len(titles)
+)
+def classify_titles(titles: pd.Series) -> pd.Series:
+    """
+    Classify a column of job titles, once per distinct normalized title.
+
+    Equivalent to `titles.apply(title_classifier)`: the titles are
+    lowercased and stripped, factorized into unique values, classified and
+    mapped back to the rows.
+
+    Args:
+        titles: The raw job titles.
+
+    Returns:
+        pd.Series: The standardized job category of each title, with the
+            same index as `titles`.
+    """
+    codes, uniques = pd.factorize(
+        titles.astype(object).str.lower().str.strip()
+    )
+    logger.info(
+        f'Classifying {len(uniques)} distinct titles out of {len(titles)} rows.'
+    )
+    labels = np.array(
+        [_classify_normalized(title) for title in uniques] + ['Outros'],
+        dtype=object,
+    )
+    # Missing and non-string titles have code -1, the trailing 'Outros'.
+    return pd.Series(labels[codes], index=titles.index, dtype=object)
+
+
 def classify_job_titles(
     input_path: Path = Path('data/processed/df_jobs.csv'),
     output_path: Path = Path('data/processed/df_jobs_classified.csv'),
@@ -164,9 +227,7 @@ def classify_job_titles(
 
         data.dropna(subset=['job_title'], inplace=True)
         data['job_title'] = data['job_title'].astype(str)
-        data['classified_job_title'] = data['job_title'].apply(
-            title_classifier
-        )
+        data['classified_job_title'] = classify_titles(data['job_title'])
 
         if output_path:
             try:
@@ -237,100 +298,142 @@ def parse_posted_date(row):
         return pd.NaT
 
 
-def standardize_locations(
-    df: pd.DataFrame, location_col: str = 'location'
-) -> pd.DataFrame:
+def _to_int(token: str) -> Optional[int]:
+    """Convert a token like `int()` does, returning None if it can't."""
+    try:
+        return int(token)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_posted_dates(
+    time_posted: pd.Series, scrape_date: pd.Series
+) -> pd.Series:
     """
-    Standardizes location strings from a DataFrame column into separate city, state, and country columns.
-    It handles various formats commonly found in Brazilian job postings.
+    Vectorized version of `parse_posted_date` for whole columns.
+
+    The amount and unit are extracted with a single `str.extract`, converted
+    to a time offset and subtracted from the scrape dates in one operation.
+    Each distinct amount token is converted only once.
+
+    Malformed input gives NaT exactly where `parse_posted_date` does: missing
+    or non-string values, fewer than three tokens, an amount `int()` can't
+    parse, an unknown unit, a missing scrape date, or a result outside the
+    range of pandas timestamps.
 
     Args:
-        df: The input pandas DataFrame.
-        location_col: The name of the column containing the raw location strings.
+        time_posted: Strings such as "Há 2 semanas".
+        scrape_date: The scrape dates, as datetimes or '%d-%m-%Y %H:%M:%S'
+            strings, aligned with `time_posted`.
 
     Returns:
-        pd.DataFrame: The DataFrame with added 'city', 'state', and 'country' columns.
+        pd.Series: The posting dates (datetime64), indexed like `time_posted`.
     """
-    df['city'] = None
-    df['state'] = None
-    df['country'] = 'Brasil'
+    if not pd.api.types.is_datetime64_any_dtype(scrape_date):
+        scrape_date = pd.to_datetime(scrape_date, format='%d-%m-%Y %H:%M:%S')
 
-    state_mapping = {
-        **{v: k for k, v in BRAZILIAN_STATES.items()},
-        **BRAZILIAN_STATES,
-    }
+    # Postings repeat a handful of strings, so each distinct one is parsed
+    # once and the results are mapped back to the rows by their codes.
+    # Missing values get code -1, the trailing "unparsable" entry.
+    codes, uniques = pd.factorize(time_posted.astype(object))
+    tokens = pd.Series(uniques, dtype=object).str.extract(_TIME_POSTED_RE)
 
-    state_names = set(BRAZILIAN_STATES.values())
-    state_abbrevs = set(BRAZILIAN_STATES.keys())
+    amounts = np.array(
+        [_to_int(token) for token in tokens[0]] + [None], dtype=object
+    )
+    has_amount = pd.notna(amounts)
+    # Amounts this large overflow any offset anyway.
+    has_amount[has_amount] = np.abs(amounts[has_amount].astype(float)) < 2**40
+    amounts = np.where(has_amount, amounts, 0).astype(np.int64)
+
+    units = tokens[1].str.lower()
+    unit_ns = np.select(
+        [
+            units.str.contains(name, regex=False, na=False).to_numpy(bool)
+            for name, _ in POSTED_DATE_UNITS
+        ],
+        [span.value for _, span in POSTED_DATE_UNITS],
+        default=0,
+    )
+    unit_ns = np.append(unit_ns, 0)
 
-    def extract_location(location):
-        """Helper function to extract city, state, country from a single location string."""
-        if pd.isna(location):
-            return (None, None, 'Brasil')
+    amounts, has_amount, unit_ns = (
+        amounts[codes],
+        has_amount[codes],
+        unit_ns[codes],
+    )
+    valid = has_amount & (unit_ns > 0) & scrape_date.notna().to_numpy()
+
+    # Keep only results inside the Timestamp range, as subtracting from a
+    # Timestamp raises (and `parse_posted_date` returns NaT) otherwise. The
+    # bounds are checked in floating point before any int64 arithmetic.
+    scrape_ns = scrape_date.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    result_ns = scrape_ns.astype(float) - amounts.astype(float) * unit_ns
+    valid &= (result_ns > pd.Timestamp.min.value + 1e6) & (
+        result_ns < pd.Timestamp.max.value - 1e6
+    )
 
-        location = str(location).strip()
+    offsets = np.zeros(len(time_posted), dtype=np.int64)
+    offsets[valid] = amounts[valid] * unit_ns[valid]
 
-        if location.lower() in ['brasil']:
-            return (None, None, 'Brasil')
+    post_date = scrape_date - pd.to_timedelta(offsets, unit='ns')
+    post_date = post_date.where(valid)
+    post_date.index = time_posted.index
+    return post_date
 
-        if location in state_names or location in state_abbrevs:
-            state_code = (
-                location
-                if location in state_abbrevs
-                else state_mapping.get(location)
-            )
-            return (None, state_code, 'Brasil')
 
-        match = re.match(
-            r'^(?P<state>[^,]+),\s*Brasil$', location, re.IGNORECASE
-        )
-        if match and match.group('state') in state_names:
-            state_name = match.group('state')
-            return (None, state_mapping.get(state_name), 'Brasil')
-
-        match = re.match(r'^(?P<city>.+)\s+e\s+Região$', location)
-        if match:
-            city = match.group('city').strip().title()
-            state = REGION_CITIES.get(city)
-            return (city, state, 'Brasil')
-
-        match = re.match(r'^(?P<city>[^,]+),\s*(?P<state>[A-Z]{2})$', location)
-        if match:
-            return (
-                match.group('city').title(),
-                match.group('state').upper(),
-                'Brasil',
-            )
+@metrics.timed('analysis.date_parsing', records=lambda df: len(df))
+def add_posting_dates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the scraped applicant count and dates into typed columns.
 
-        match = re.match(r'^(?P<city>[^,]+),\s*(?P<state>.+)$', location)
-        if match:
-            state = match.group('state').strip()
+    Parses 'num_applicants' into a number, 'scrape_date' into a datetime and
+    derives 'post_date' from 'time_posted' relative to the scrape date.
 
-            if state.lower() in ['brasil', 'brazil']:
-                city_name = match.group('city').title()
-                return (city_name, REGION_CITIES.get(city_name), 'Brasil')
+    Args:
+        df: A DataFrame with 'num_applicants', 'scrape_date' and 'time_posted' columns.
 
-            if state in state_names or state in state_abbrevs:
-                state_code = (
-                    state
-                    if state in state_abbrevs
-                    else state_mapping.get(state)
-                )
-                return (match.group('city').title(), state_code, 'Brasil')
+    Returns:
+        pd.DataFrame: The same DataFrame with the converted and added columns.
+    """
+    df['num_applicants'] = (
+        df['num_applicants'].astype(object).str.extract(r'(\d+)')
+    )
+    df['num_applicants'] = pd.to_numeric(df['num_applicants'])
 
-            return (match.group('city').title(), None, 'Brasil')
+    df['scrape_date'] = pd.to_datetime(
+        df['scrape_date'], format='%d-%m-%Y %H:%M:%S'
+    )
+    df['post_date'] = parse_posted_dates(df['time_posted'], df['scrape_date'])
+    return df
 
-        logger.info(f'Standardizing locations...')
 
-        city_name = location.title()
-        if city_name in REGION_CITIES:
-            return (city_name, REGION_CITIES.get(city_name), 'Brasil')
+@metrics.timed(
+    'analysis.location_standardization',
+    records=lambda df, *args, **kwargs: len(df),
+)
+def standardize_locations(
+    df: pd.DataFrame,
+    location_col: str = 'location',
+    resolver: Optional[LocationResolver] = None,
+) -> pd.DataFrame:
+    """
+    Standardizes location strings from a DataFrame column into separate city, state, and country columns.
+    It handles various formats commonly found in Brazilian job postings.
 
-        return (city_name, None, 'Brasil')
+    Args:
+        df: The input pandas DataFrame.
+        location_col: The name of the column containing the raw location strings.
+        resolver: The LocationResolver to use, e.g. to export its report of
+            unresolved locations afterwards. Defaults to a new one.
 
-    df[['city', 'state', 'country']] = df[location_col].apply(
-        lambda x: pd.Series(extract_location(x))
-    )
+    Returns:
+        pd.DataFrame: The DataFrame with added 'city', 'state', and 'country' columns.
+    """
+    logger.info('Standardizing locations...')
+    if resolver is None:
+        resolver = LocationResolver()
+    df = resolver.standardize(df, location_col)
     logger.success('Location standardization complete.')
     return df
 
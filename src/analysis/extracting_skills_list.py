@@ -1,12 +1,66 @@
 import logging
+import math
+import multiprocessing
+import os
 import re
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+from ..utils.logger import register_success_level
+from ..utils.metrics import metrics
+from .pattern_matcher import MultiPatternMatcher
+
 logger = logging.getLogger(__name__)
 
+# Forking a process that runs threads (the scraper's, tqdm's monitor) can
+# deadlock the child; the workers rebuild their state in `_init_worker`.
+WORKER_START_METHOD = (
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Extractor built once per worker process by `_init_worker`.
+_worker_extractor = None
+
+
+def _init_worker(skill_patterns):
+    """Build the worker's SkillExtractor once, when the process starts."""
+    global _worker_extractor
+    register_success_level()
+    logging.getLogger(__name__).setLevel(logging.WARNING)
+    _worker_extractor = SkillExtractor(skill_patterns)
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """
+    Return the number of worker processes `n_jobs` stands for.
+
+    Args:
+        n_jobs (int): A positive number of processes, or -1 for all CPUs.
+
+    Returns:
+        int: The number of processes.
+
+    Raises:
+        ValueError: If `n_jobs` is 0 or below -1.
+    """
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(
+            f'Invalid n_jobs {n_jobs}. Use a positive number of processes or -1 for all CPUs.'
+        )
+    return n_jobs
+
+
+def _extract_chunk(texts):
+    """Extract skills from a chunk of texts inside a worker process."""
+    return [_worker_extractor.extract_skills(text) for text in texts]
+
 
 class SkillExtractor:
     """
@@ -28,12 +82,16 @@ class SkillExtractor:
 
         self.skill_patterns = skill_patterns
         self.regex_patterns = {}
+        # Worker pool of `extract_skills_parallel`, kept between calls.
+        self._executor = None
+        self._executor_workers = 0
         self._prepare_regex_patterns()
 
     def _prepare_regex_patterns(self):
         """
         Compiles regex patterns for efficient matching.
-        Patterns are compiled with re.IGNORECASE.
+        Patterns are compiled with re.IGNORECASE and indexed by a
+        MultiPatternMatcher so each text is scanned once for all skills.
         """
         for skill_name, patterns in self.skill_patterns.items():
             if not isinstance(patterns, list):
@@ -60,6 +118,8 @@ class SkillExtractor:
                     f"No valid regex patterns were compiled for skill '{skill_name}'."
                 )
 
+        self.matcher = MultiPatternMatcher(self.regex_patterns)
+
         if self.regex_patterns:
             logger.success(
                 f'Successfully prepared regex patterns for {len(self.regex_patterns)} skills.'
@@ -97,11 +157,15 @@ class SkillExtractor:
         """
         Extract skills from a given text using the pre-compiled regex patterns.
 
+        Only the patterns whose literal prefix occurs in the text are
+        searched; the result is the same as searching every pattern.
+
         Args:
             text (str): The text from which to extract skills.
 
         Returns:
-            list: A list of unique canonical skill names found in the text.
+            list: A list of unique canonical skill names found in the text,
+                  in the order of the skill map.
                   Returns an empty list if input text is None or empty, or no skills are found.
         """
         if not text:
@@ -111,74 +175,230 @@ class SkillExtractor:
         if not normalized_text:
             return []
 
-        found_skills = set()
+        return self.matcher.find(normalized_text)
 
-        for skill_name, compiled_patterns in self.regex_patterns.items():
-            for pattern in compiled_patterns:
-                if pattern.search(normalized_text):
-                    found_skills.add(skill_name)
-                    break
+    def extract_skills_parallel(
+        self, texts: list, n_jobs: int, chunk_size: int = None
+    ) -> list:
+        """
+        Extract skills from many texts using a pool of worker processes.
 
-        return list(found_skills)
+        The texts are split into chunks that are processed in parallel and
+        merged back in their original order, so the result is identical to
+        calling `extract_skills` on each text. The skill patterns are sent to
+        each worker only once, when it starts: the pool is kept for the next
+        calls with the same `n_jobs` (e.g. one per streamed batch) until
+        `close` is called.
 
+        Args:
+            texts (list): The texts to analyze.
+            n_jobs (int): Number of worker processes. -1 uses all CPUs.
+            chunk_size (int, optional): Texts per task. Defaults to splitting
+                the texts into about 4 chunks per worker.
+
+        Returns:
+            list: One list of skill names per input text.
+
+        Raises:
+            ValueError: If `n_jobs` is 0 or below -1.
+        """
+        n_jobs = resolve_n_jobs(n_jobs)
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(len(texts) / (n_jobs * 4)))
+
+        chunks = [
+            texts[start : start + chunk_size]
+            for start in range(0, len(texts), chunk_size)
+        ]
+
+        if self._executor_workers != n_jobs:
+            self.close()
+            self._executor = ProcessPoolExecutor(
+                max_workers=n_jobs,
+                mp_context=multiprocessing.get_context(WORKER_START_METHOD),
+                initializer=_init_worker,
+                initargs=(self.skill_patterns,),
+            )
+            self._executor_workers = n_jobs
+
+        results = []
+        with tqdm(total=len(texts), desc='Extracting skills') as progress:
+            for chunk_result in self._executor.map(_extract_chunk, chunks):
+                results.extend(chunk_result)
+                progress.update(len(chunk_result))
+
+        return results
+
+    def close(self) -> None:
+        """Shut down the worker processes of `extract_skills_parallel`, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_workers = 0
+
+    def build_skills_table(
+        self, job_ids: pd.Series, skills_found: pd.Series
+    ) -> pd.DataFrame:
+        """
+        Build the long-format (job_id, skill) table from per-job skill lists.
+
+        The table is assembled from flat arrays (job IDs repeated by the
+        number of skills of each job) instead of one dict per pair.
+
+        Args:
+            job_ids (pd.Series): The job ID of each row.
+            skills_found (pd.Series): The list of skills found for each row,
+                aligned with `job_ids`.
+
+        Returns:
+            pd.DataFrame: A DataFrame with 'job_id' and 'skill' columns, one
+                row per (job, skill) pair, in row then skill order.
+        """
+        skill_lists = [
+            skills if isinstance(skills, list) else []
+            for skills in skills_found
+        ]
+        lengths = np.fromiter(
+            (len(skills) for skills in skill_lists),
+            dtype=np.int64,
+            count=len(skill_lists),
+        )
+        skills = np.array(
+            list(chain.from_iterable(skill_lists)), dtype=object
+        )
+        df_skills = pd.DataFrame(
+            {
+                'job_id': np.repeat(job_ids.to_numpy(), lengths),
+                'skill': skills,
+            }
+        )
+        if len(df_skills):
+            df_skills = df_skills[
+                df_skills['skill'].astype(bool)
+            ].reset_index(drop=True)
+        return df_skills
+
+    def skill_indicator_matrix(
+        self, df_skills: pd.DataFrame, job_ids: pd.Series = None
+    ) -> pd.DataFrame:
+        """
+        Build a sparse job x skill indicator matrix from the skills table.
+
+        Args:
+            df_skills (pd.DataFrame): The long-format table returned by
+                `build_skills_table`.
+            job_ids (pd.Series, optional): Job IDs to use as rows, so jobs
+                without skills get an all-zero row. Defaults to the job IDs
+                present in `df_skills`.
+
+        Returns:
+            pd.DataFrame: A DataFrame indexed by job_id with one sparse int32
+                column per skill (in skill map order), 1 where the job
+                requires the skill.
+        """
+        if job_ids is None:
+            job_ids = df_skills['job_id']
+        rows = pd.Index(pd.unique(job_ids.to_numpy()), name='job_id')
+        present = set(df_skills['skill'])
+        skill_names = [
+            name for name in self.regex_patterns if name in present
+        ] + sorted(present - set(self.regex_patterns))
+
+        row_codes = rows.get_indexer(df_skills['job_id'])
+        skill_codes = pd.Categorical(
+            df_skills['skill'], categories=skill_names
+        ).codes
+        sparse_dtype = pd.SparseDtype(np.int32, 0)
+
+        columns = {}
+        order = np.argsort(skill_codes, kind='stable')
+        bounds = np.searchsorted(
+            skill_codes[order], np.arange(len(skill_names) + 1)
+        )
+        for code, name in enumerate(skill_names):
+            column = np.zeros(len(rows), dtype=np.int32)
+            column[row_codes[order[bounds[code] : bounds[code + 1]]]] = 1
+            columns[name] = pd.arrays.SparseArray(column, dtype=sparse_dtype)
+
+        return pd.DataFrame(columns, index=rows)
+
+    @metrics.timed(
+        'analysis.skill_extraction',
+        records=lambda self, df, *args, **kwargs: len(df),
+    )
     def process_dataframe(
-        self, df: pd.DataFrame, text_column: str
-    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        self,
+        df: pd.DataFrame,
+        text_column: str,
+        n_jobs: int = 1,
+        chunk_size: int = None,
+        return_matrix: bool = False,
+    ) -> tuple:
         """
         Process a DataFrame to extract skills from a specified text column.
 
         Args:
             df (pd.DataFrame): The input DataFrame.
             text_column (str): The name of the column containing the text to analyze.
+            n_jobs (int, optional): Number of worker processes used for
+                extraction. 1 runs in the current process, -1 uses all CPUs.
+                The output is identical either way. Defaults to 1.
+            chunk_size (int, optional): Texts per worker task when `n_jobs` is
+                not 1. Defaults to about 4 chunks per worker.
+            return_matrix (bool, optional): Also return the sparse job x skill
+                indicator matrix. Defaults to False.
 
         Returns:
             tuple[pd.DataFrame, pd.DataFrame]:
                 1. The original DataFrame (or a copy, if modified) without the temporary 'skills_found' column.
                 2. A new DataFrame (df_skills) with two columns: the id_column and 'skill',
                    mapping each job ID to an individual extracted skill.
+                3. Only if `return_matrix` is True: the sparse indicator
+                   matrix from `skill_indicator_matrix`.
 
         Raises:
-            ValueError: If the text_column or id_column is not found in the DataFrame.
+            ValueError: If the text_column or id_column is not found in the DataFrame,
+                or `n_jobs` is 0 or below -1.
             Exception: Propagates other unexpected errors during processing.
         """
         if text_column not in df.columns:
             raise ValueError(
                 f"Text column '{text_column}' not found in DataFrame."
             )
+        resolve_n_jobs(n_jobs)
 
         try:
             logger.info(
                 f'Starting skill extraction for DataFrame with {len(df)} rows.'
             )
-            tqdm.pandas(desc='Extracting skills')
-
             df_processed = df.copy()
 
-            df_processed['skills_found'] = df_processed[
-                text_column
-            ].progress_apply(self.extract_skills)
-
-            skills_data = []
-            for index, row in df_processed.iterrows():
-                job_id_val = row['job_id']
-                extracted_skills_list = row['skills_found']
-                try:
-                    for skill in extracted_skills_list:
-                        if skill:
-                            skills_data.append(
-                                {'job_id': job_id_val, 'skill': skill}
-                            )
-                except Exception as e:
-                    logger.warning(
-                        f'Error processing skills for job_id {job_id_val}: {str(e)}. Skills list: {extracted_skills_list}'
-                    )
+            if n_jobs != 1 and len(df_processed) > 1:
+                df_processed['skills_found'] = self.extract_skills_parallel(
+                    df_processed[text_column].tolist(), n_jobs, chunk_size
+                )
+            else:
+                tqdm.pandas(desc='Extracting skills')
+                df_processed['skills_found'] = df_processed[
+                    text_column
+                ].progress_apply(self.extract_skills)
 
-            df_skills = pd.DataFrame(skills_data)
+            df_skills = self.build_skills_table(
+                df_processed['job_id'], df_processed['skills_found']
+            )
             df_processed = df_processed.drop(columns=['skills_found'])
 
             logger.info(
                 f'Skill extraction completed. Found {len(df_skills)} skill entries.'
             )
+            if return_matrix:
+                return (
+                    df_processed,
+                    df_skills,
+                    self.skill_indicator_matrix(
+                        df_skills, df_processed['job_id']
+                    ),
+                )
             return df_processed, df_skills
 
         except Exception as e:
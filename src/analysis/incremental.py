@@ -0,0 +1,417 @@
+import hashlib
+import logging
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from config.analysis import ROLE_PATTERNS, SPECIAL_CASES
+
+from ..utils.metrics import metrics
+from .analysis_utils import (
+    add_posting_dates,
+    standardize_locations,
+    title_classifier,
+)
+from .extracting_skills_list import SkillExtractor, resolve_n_jobs
+from .location_resolver import LocationResolver
+
+logger = logging.getLogger(__name__)
+
+STATE_PATH = Path('data/processed/pipeline_state.pkl')
+
+# Bump when the date/applicant parsing logic changes.
+DATES_VERSION = '1'
+
+# Raw columns each stage depends on.
+STAGE_INPUTS = {
+    'skills': ['job_description'],
+    'titles': ['job_title'],
+    'dates': ['num_applicants', 'scrape_date', 'time_posted'],
+}
+
+
+def content_hash(*values: Any) -> str:
+    """
+    Compute a short, stable hash of a sequence of values.
+
+    Missing values (None/NaN) hash differently from any string.
+
+    Args:
+        *values: The values to hash.
+
+    Returns:
+        str: A 16-character hexadecimal digest.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for value in values:
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            digest.update(b'\x00NA')
+        else:
+            digest.update(str(value).encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+def config_version(obj: Any) -> str:
+    """
+    Hash a configuration object (e.g. a pattern dictionary).
+
+    Compiled regexes are hashed by their pattern string and flags, so the
+    version only changes when the configuration itself changes.
+
+    Args:
+        obj: A (nested) dict/list/tuple of strings and compiled patterns.
+
+    Returns:
+        str: A 16-character hexadecimal digest.
+    """
+
+    def stable(value):
+        if hasattr(value, 'pattern') and hasattr(value, 'flags'):
+            return ('re', value.pattern, value.flags)
+        if isinstance(value, dict):
+            return tuple((key, stable(item)) for key, item in value.items())
+        if isinstance(value, (list, tuple)):
+            return tuple(stable(item) for item in value)
+        return value
+
+    return content_hash(repr(stable(obj)))
+
+
+class PipelineState:
+    """
+    Per-job results of the analysis stages, persisted between runs.
+
+    Every stage result is stored under the job ID plus a hash of the raw
+    fields that stage reads, so a job is only reprocessed by the stages
+    whose inputs changed. Each stage also records the version of the
+    configuration it ran with. Title results are dropped when their
+    patterns change. Skill results are kept and only the skills whose
+    patterns changed (or were added) are re-extracted.
+    """
+
+    def __init__(self, path: Path = STATE_PATH):
+        """
+        Initialize the PipelineState, loading it from `path` if it exists.
+
+        Args:
+            path (Path, optional): The state file. Defaults to `STATE_PATH`.
+        """
+        self.path = Path(path)
+        self.versions: Dict[str, Any] = {}
+        self.results: Dict[str, Dict[str, Any]] = {
+            stage: {} for stage in STAGE_INPUTS
+        }
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'rb') as f:
+                    saved = pickle.load(f)
+                self.versions = saved['versions']
+                self.results.update(
+                    (stage, results)
+                    for stage, results in saved['results'].items()
+                    if stage in STAGE_INPUTS
+                )
+                logger.info(
+                    f'Loaded pipeline state with {len(self.results["skills"])} skill results from {self.path}'
+                )
+            except Exception as e:
+                logger.error(
+                    f'Failed to load pipeline state from {self.path}, starting fresh: {e}'
+                )
+
+    def save(self, keep_keys: Optional[Dict[str, Set[str]]] = None) -> None:
+        """
+        Persist the state, optionally pruning results no longer in use.
+
+        Args:
+            keep_keys (Optional[Dict[str, Set[str]]], optional): Per stage,
+                the keys still referenced by the current data. Other entries
+                are removed before saving.
+        """
+        if keep_keys:
+            for stage, keys in keep_keys.items():
+                stage_results = self.results[stage]
+                self.results[stage] = {
+                    key: stage_results[key]
+                    for key in keys
+                    if key in stage_results
+                }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'wb') as f:
+            pickle.dump({'versions': self.versions, 'results': self.results}, f)
+        logger.info(f'Saved pipeline state to {self.path}')
+
+    def check_version(self, stage: str, version: Any) -> bool:
+        """
+        Record the configuration version of a stage, invalidating its
+        results if it changed.
+
+        Args:
+            stage (str): The stage name.
+            version (Any): The current configuration version.
+
+        Returns:
+            bool: True if the stored results were kept.
+        """
+        if self.versions.get(stage) == version:
+            return True
+        if self.results[stage]:
+            logger.info(
+                f"Configuration of stage '{stage}' changed; invalidating {len(self.results[stage])} results."
+            )
+        self.results[stage] = {}
+        self.versions[stage] = version
+        return False
+
+    def update_skill_versions(self, extractor: SkillExtractor) -> Set[str]:
+        """
+        Compare per-skill pattern versions with the stored ones.
+
+        Stored skill lists are stripped of removed or changed skills, which
+        must then be re-extracted for every job.
+
+        Args:
+            extractor (SkillExtractor): The extractor with the current skill map.
+
+        Returns:
+            Set[str]: Skills that are new or whose patterns changed.
+        """
+        current = {
+            skill: config_version(patterns)
+            for skill, patterns in extractor.regex_patterns.items()
+        }
+        previous = self.versions.get('skills') or {}
+        if not isinstance(previous, dict):
+            previous = {}
+
+        stale = {
+            skill
+            for skill, version in current.items()
+            if previous.get(skill) != version
+        }
+        removed = set(previous) - set(current)
+        invalid = stale | removed
+
+        if invalid and self.results['skills']:
+            logger.info(
+                f'Skill map changed for {len(invalid)} skills; re-extracting only those.'
+            )
+            self.results['skills'] = {
+                key: [skill for skill in skills if skill not in invalid]
+                for key, skills in self.results['skills'].items()
+            }
+
+        self.versions['skills'] = current
+        return stale if self.results['skills'] else set()
+
+
+def _stage_keys(df: pd.DataFrame, stage: str) -> List[str]:
+    """Build the state key (job ID + input hash) of every row for a stage."""
+    columns = [df['job_id'].astype(str)] + [
+        df[column] for column in STAGE_INPUTS[stage]
+    ]
+    return [
+        f'{values[0]}:{content_hash(*values[1:])}' for values in zip(*columns)
+    ]
+
+
+def run_incremental(
+    jobs_data: pd.DataFrame,
+    extractor: SkillExtractor,
+    classify_titles: bool = True,
+    n_jobs: int = 1,
+    state_path: Path = STATE_PATH,
+    resolver: Optional[LocationResolver] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Run the analysis stages, reusing stored results for unchanged jobs.
+
+    Produces the same outputs as the full pipeline: skills are extracted,
+    titles classified, dates parsed and locations standardized, but each
+    stage only processes the rows whose inputs or configuration changed
+    since the last run. Locations are always resolved, since resolving
+    each distinct location is cheaper than looking up per-row results. As
+    in the full pipeline, an error while converting the dates and locations
+    is logged and those columns are returned as scraped.
+
+    Args:
+        jobs_data: The deduplicated raw job postings.
+        extractor: The SkillExtractor with the current skill map.
+        classify_titles: Whether to add the 'classified_job_title' column.
+        n_jobs: Worker processes for skill extraction (-1 uses all CPUs).
+        state_path: The state file to read and update.
+        resolver: The LocationResolver to use. Defaults to a new one.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The processed jobs DataFrame and
+            the long-format skills DataFrame.
+    """
+    state = PipelineState(state_path)
+    jobs_data = jobs_data.reset_index(drop=True)
+    keys = {stage: _stage_keys(jobs_data, stage) for stage in STAGE_INPUTS}
+
+    # Skills
+    changed_skills = state.update_skill_versions(extractor)
+    skill_results = state.results['skills']
+    texts = jobs_data['job_description'].tolist()
+    missing = [
+        i for i, key in enumerate(keys['skills']) if key not in skill_results
+    ]
+    logger.info(
+        f'Skills: extracting {len(missing)} new or changed postings, reusing {len(jobs_data) - len(missing)}.'
+    )
+    for i, skills in zip(
+        missing, _extract(extractor, [texts[i] for i in missing], n_jobs)
+    ):
+        skill_results[keys['skills'][i]] = skills
+
+    if changed_skills:
+        partial_extractor = SkillExtractor(
+            {skill: extractor.skill_patterns[skill] for skill in changed_skills}
+        )
+        extracted = set(missing)
+        reused = [i for i in range(len(jobs_data)) if i not in extracted]
+        logger.info(
+            f'Skills: re-extracting {len(changed_skills)} changed skills for {len(reused)} postings.'
+        )
+        order = {skill: n for n, skill in enumerate(extractor.regex_patterns)}
+        try:
+            for i, found in zip(
+                reused,
+                _extract(partial_extractor, [texts[i] for i in reused], n_jobs),
+            ):
+                key = keys['skills'][i]
+                skill_results[key] = sorted(
+                    set(skill_results[key]) | set(found), key=order.get
+                )
+        finally:
+            partial_extractor.close()
+
+    skills_found = pd.Series(
+        [skill_results[key] for key in keys['skills']], dtype=object
+    )
+    df_skills = extractor.build_skills_table(
+        jobs_data['job_id'], skills_found
+    )
+
+    df_jobs = jobs_data.copy()
+
+    # Titles
+    if classify_titles:
+        df_jobs = df_jobs[df_jobs['job_title'].notna()]
+        df_jobs['job_title'] = df_jobs['job_title'].astype(str)
+        title_keys = [keys['titles'][i] for i in df_jobs.index]
+        state.check_version(
+            'titles', config_version([ROLE_PATTERNS, SPECIAL_CASES])
+        )
+        title_results = state.results['titles']
+        titles = df_jobs['job_title'].tolist()
+        new_titles = 0
+        with metrics.timer('analysis.title_classification') as timer:
+            for key, title in zip(title_keys, titles):
+                if key not in title_results:
+                    title_results[key] = title_classifier(title)
+                    new_titles += 1
+            timer.add_records(new_titles)
+        logger.info(f'Titles: classified {new_titles} new or changed titles.')
+        df_jobs['classified_job_title'] = [
+            title_results[key] for key in title_keys
+        ]
+
+    # Dates, applicants and locations. Like the full pipeline, a failure
+    # keeps the columns as scraped; the date results of this run are then
+    # not stored.
+    state.check_version('dates', DATES_VERSION)
+    date_results = dict(state.results['dates'])
+    try:
+        _fill_stage(
+            df_jobs,
+            [keys['dates'][i] for i in df_jobs.index],
+            date_results,
+            lambda subset: add_posting_dates(subset)[
+                ['num_applicants', 'post_date']
+            ],
+            'Dates',
+        )
+        treated = df_jobs.copy()
+        treated['scrape_date'] = pd.to_datetime(
+            treated['scrape_date'], format='%d-%m-%Y %H:%M:%S'
+        )
+        date_values = [date_results[keys['dates'][i]] for i in treated.index]
+        treated['num_applicants'] = pd.to_numeric(
+            pd.Series([value[0] for value in date_values], index=treated.index)
+        )
+        treated['post_date'] = pd.to_datetime(
+            pd.Series([value[1] for value in date_values], index=treated.index)
+        ).dt.strftime('%d-%m-%Y %H:%M:%S')
+
+        treated = standardize_locations(treated, 'location', resolver)
+
+        df_jobs = treated.drop(columns=['time_posted', 'location'])
+        state.results['dates'] = date_results
+    except Exception as e:
+        logger.error(
+            f'Error while treating df_jobs columns, keeping them as scraped: {e}'
+        )
+
+    state.save(
+        keep_keys={stage: set(stage_keys) for stage, stage_keys in keys.items()}
+    )
+    return df_jobs, df_skills
+
+
+@metrics.timed(
+    'analysis.skill_extraction',
+    records=lambda extractor, texts, n_jobs: len(texts),
+)
+def _extract(
+    extractor: SkillExtractor, texts: List[Any], n_jobs: int
+) -> List[List[str]]:
+    """Extract skills from texts, in parallel when worthwhile."""
+    resolve_n_jobs(n_jobs)
+    if not texts:
+        return []
+    if n_jobs != 1 and len(texts) > 1:
+        return extractor.extract_skills_parallel(texts, n_jobs)
+    return [extractor.extract_skills(text) for text in texts]
+
+
+def _fill_stage(
+    df: pd.DataFrame,
+    row_keys: List[str],
+    results: Dict[str, Tuple],
+    compute,
+    label: str,
+) -> None:
+    """
+    Compute a stage for the rows of `df` without a stored result.
+
+    Args:
+        df: The rows the stage must cover.
+        row_keys: The state key of each row of `df`.
+        results: The stage results, updated in place with tuples of the
+            output columns.
+        compute: Function mapping a DataFrame subset to its output columns.
+        label: Stage name for logging.
+    """
+    missing = [
+        position
+        for position, key in enumerate(row_keys)
+        if key not in results
+    ]
+    logger.info(
+        f'{label}: processing {len(missing)} new or changed rows, reusing {len(row_keys) - len(missing)}.'
+    )
+    if not missing:
+        return
+
+    outputs = compute(df.iloc[missing].copy())
+    for position, values in zip(
+        missing, outputs.itertuples(index=False, name=None)
+    ):
+        results[row_keys[position]] = values
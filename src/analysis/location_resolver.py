@@ -0,0 +1,220 @@
+import logging
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.analysis import (
+    BRAZILIAN_STATES,
+    REGION_CITIES,
+    UNRESOLVED_LOCATIONS_PATH,
+)
+
+from ..utils.logger import setup_logging
+from ..utils.storage import JobDataset
+
+logger = logging.getLogger(__name__)
+
+Location = Tuple[Optional[str], Optional[str], str]
+
+
+class LocationResolver:
+    """
+    Resolve raw LinkedIn location strings into (city, state, country).
+
+    Patterns and state lookups are built once. A location column is resolved
+    once per distinct value and the results are mapped back to the rows by
+    their categorical codes. Locations whose city was recognized but whose
+    state couldn't be determined are tallied for `unresolved_report`, to see
+    which cities `REGION_CITIES` is missing.
+    """
+
+    def __init__(
+        self,
+        states: Dict[str, str] = BRAZILIAN_STATES,
+        region_cities: Dict[str, str] = REGION_CITIES,
+    ):
+        """
+        Initialize the LocationResolver.
+
+        Args:
+            states: State abbreviations mapped to their names.
+                Defaults to `BRAZILIAN_STATES`.
+            region_cities: City names mapped to their state abbreviation.
+                Defaults to `REGION_CITIES`.
+        """
+        self.region_cities = region_cities
+        self.state_mapping = {
+            **{v: k for k, v in states.items()},
+            **states,
+        }
+        self.state_names = set(states.values())
+        self.state_abbrevs = set(states.keys())
+
+        self._state_country_re = re.compile(
+            r'^(?P<state>[^,]+),\s*Brasil$', re.IGNORECASE
+        )
+        self._region_re = re.compile(r'^(?P<city>.+)\s+e\s+Região$')
+        self._city_abbrev_re = re.compile(
+            r'^(?P<city>[^,]+),\s*(?P<state>[A-Z]{2})$'
+        )
+        self._city_state_re = re.compile(r'^(?P<city>[^,]+),\s*(?P<state>.+)$')
+
+        self._results: Dict[Any, Location] = {}
+        self._row_counts: Counter = Counter()
+
+    def _state_code(self, state: str) -> Optional[str]:
+        """Return the abbreviation of a state given by name or abbreviation."""
+        if state in self.state_abbrevs:
+            return state
+        return self.state_mapping.get(state)
+
+    def resolve(self, location: Any) -> Location:
+        """
+        Resolve a single location string. Results are memoized.
+
+        Handles the formats commonly found in Brazilian job postings:
+        'Brasil', a state name or abbreviation, '<state>, Brasil',
+        '<city> e Região', '<city>, <UF>', '<city>, <state>' and a bare city.
+
+        Args:
+            location: The raw location (missing values are allowed).
+
+        Returns:
+            Tuple[Optional[str], Optional[str], str]: The city, state
+                abbreviation and country. Unknown parts are None.
+        """
+        if pd.isna(location):
+            return (None, None, 'Brasil')
+
+        result = self._results.get(location)
+        if result is None:
+            result = self._resolve(str(location).strip())
+            self._results[location] = result
+        return result
+
+    def _resolve(self, location: str) -> Location:
+        if location.lower() in ['brasil']:
+            return (None, None, 'Brasil')
+
+        if location in self.state_names or location in self.state_abbrevs:
+            return (None, self._state_code(location), 'Brasil')
+
+        match = self._state_country_re.match(location)
+        if match and match.group('state') in self.state_names:
+            return (None, self.state_mapping.get(match.group('state')), 'Brasil')
+
+        match = self._region_re.match(location)
+        if match:
+            city = match.group('city').strip().title()
+            return (city, self.region_cities.get(city), 'Brasil')
+
+        match = self._city_abbrev_re.match(location)
+        if match:
+            return (
+                match.group('city').title(),
+                match.group('state').upper(),
+                'Brasil',
+            )
+
+        match = self._city_state_re.match(location)
+        if match:
+            state = match.group('state').strip()
+            city_name = match.group('city').title()
+
+            if state.lower() in ['brasil', 'brazil']:
+                return (city_name, self.region_cities.get(city_name), 'Brasil')
+
+            if state in self.state_names or state in self.state_abbrevs:
+                return (city_name, self._state_code(state), 'Brasil')
+
+            return (city_name, None, 'Brasil')
+
+        city_name = location.title()
+        return (city_name, self.region_cities.get(city_name), 'Brasil')
+
+    def standardize(
+        self, df: pd.DataFrame, location_col: str = 'location'
+    ) -> pd.DataFrame:
+        """
+        Add 'city', 'state' and 'country' columns resolved from a location column.
+
+        Args:
+            df: The input DataFrame.
+            location_col: The column containing the raw location strings.
+
+        Returns:
+            pd.DataFrame: The same DataFrame with the added columns.
+        """
+        locations = pd.Categorical(df[location_col])
+        categories = list(locations.categories)
+        resolved = [self.resolve(location) for location in categories]
+        # Missing locations have code -1, i.e. the trailing entry.
+        resolved.append(self.resolve(None))
+
+        counts = np.bincount(locations.codes + 1, minlength=len(categories) + 1)
+        for location, count in zip(categories, counts[1:]):
+            if count:
+                self._row_counts[location] += int(count)
+
+        for n, column in enumerate(['city', 'state', 'country']):
+            values = np.array([result[n] for result in resolved], dtype=object)
+            df[column] = values[locations.codes]
+
+        logger.info(
+            f'Resolved {len(categories)} distinct locations for {len(df)} rows.'
+        )
+        return df
+
+    def unresolved_report(self) -> pd.DataFrame:
+        """
+        List the locations seen by `standardize` whose state is unknown.
+
+        Returns:
+            pd.DataFrame: One row per distinct location with the 'location',
+                the 'city' it was resolved to and the number of 'rows' it
+                appeared in, most frequent first.
+        """
+        rows = [
+            {'location': location, 'city': self._results[location][0], 'rows': count}
+            for location, count in self._row_counts.items()
+            if self._results[location][0] is not None
+            and self._results[location][1] is None
+        ]
+        report = pd.DataFrame(rows, columns=['location', 'city', 'rows'])
+        return report.sort_values(
+            ['rows', 'location'], ascending=[False, True], ignore_index=True
+        )
+
+    def export_report(self, path: Path = UNRESOLVED_LOCATIONS_PATH) -> pd.DataFrame:
+        """
+        Write the unresolved locations report to a CSV file.
+
+        Args:
+            path: The output file. Defaults to `UNRESOLVED_LOCATIONS_PATH`.
+
+        Returns:
+            pd.DataFrame: The report that was written.
+        """
+        report = self.unresolved_report()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report.to_csv(path, index=False)
+        if len(report):
+            logger.warning(
+                f"{len(report)} locations ({report['rows'].sum()} rows) have no known state. Report saved to '{path}'."
+            )
+        else:
+            logger.info(f"All locations resolved. Report saved to '{path}'.")
+        return report
+
+
+if __name__ == '__main__':
+    # Rebuild the report from the raw data, e.g. after extending REGION_CITIES.
+    setup_logging()
+    resolver = LocationResolver()
+    resolver.standardize(JobDataset().read(columns=['location']))
+    resolver.export_report()
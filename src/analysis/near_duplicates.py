@@ -0,0 +1,278 @@
+import logging
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.analysis import (
+    MINHASH_NUM_PERM,
+    NEAR_DUPLICATE_THRESHOLD,
+    SHINGLE_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+# Anything but letters and digits separates words (accents included).
+_WORD_SEPARATOR = r'[^\p{L}\p{N}]+'
+_EMPTY = np.uint32(0xFFFFFFFF)
+_GOLDEN = np.uint32(0x9E3779B1)
+_CHUNK_SIZE = 20_000
+# NumPy < 2.0 (still supported by pandas) only has the older name.
+_trapezoid = getattr(np, 'trapezoid', None) or np.trapz
+
+
+def _mix(h: np.ndarray) -> np.ndarray:
+    """Spread the bits of 64-bit hashes (splitmix64 finalizer)."""
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose the LSH bands and rows per band for a similarity threshold.
+
+    Minimizes the probability mass of false positives (pairs below the
+    threshold becoming candidates) plus false negatives (pairs above it
+    never sharing a band), as in Leskovec et al., "Mining of Massive
+    Datasets", ch. 3.
+
+    Args:
+        threshold (float): The Jaccard similarity threshold.
+        num_perm (int): The signature length.
+
+    Returns:
+        Tuple[int, int]: The number of bands and of rows per band.
+    """
+    similarities = np.linspace(0, 1, 1001)
+    below = similarities < threshold
+    best, best_cost = (1, num_perm), np.inf
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            candidate = 1 - (1 - similarities**rows) ** bands
+            cost = _trapezoid(candidate[below], similarities[below]) + _trapezoid(
+                1 - candidate[~below], similarities[~below]
+            )
+            if cost < best_cost:
+                best, best_cost = (bands, rows), cost
+    return best
+
+
+class NearDuplicateDetector:
+    """
+    Cluster texts that are near-duplicates of each other.
+
+    Every text is split into lowercase word shingles (`shingle_size`
+    consecutive words) and summarized by a MinHash signature of `num_perm`
+    values, whose share of equal values between two texts estimates the
+    Jaccard similarity of their shingle sets. Signatures use one permutation
+    hashing with densification (Shrivastava, 2017), so each shingle is hashed
+    once instead of `num_perm` times.
+
+    Candidate pairs come from an LSH index: signatures are cut into bands
+    and texts sharing a band are compared, which avoids comparing all
+    pairs. Candidates whose estimated similarity reaches `threshold` are
+    merged, and clusters are the connected components of those pairs.
+    """
+
+    def __init__(
+        self,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        num_perm: int = MINHASH_NUM_PERM,
+        shingle_size: int = SHINGLE_SIZE,
+    ):
+        """
+        Initialize the NearDuplicateDetector.
+
+        Args:
+            threshold (float, optional): Estimated Jaccard similarity from
+                which two texts are near-duplicates. Defaults to
+                `NEAR_DUPLICATE_THRESHOLD`.
+            num_perm (int, optional): Signature length; longer signatures
+                estimate similarities more precisely but take more memory.
+                Defaults to `MINHASH_NUM_PERM`.
+            shingle_size (int, optional): Words per shingle. Defaults to
+                `SHINGLE_SIZE`.
+
+        Raises:
+            ValueError: If `threshold` is not in (0, 1].
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(f'Invalid threshold {threshold}. Choose a value in (0, 1].')
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+
+    def _shingle_hashes(self, texts: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """Hash the word shingles of texts, returning (text positions, hashes)."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        words = pc.split_pattern_regex(
+            pc.utf8_lower(pa.array(texts.tolist(), type=pa.string())),
+            _WORD_SEPARATOR,
+        )
+        lengths = pc.list_value_length(words).fill_null(0).to_numpy()
+        flat = pc.list_flatten(words)
+        positions = np.repeat(np.arange(len(texts)), lengths)
+        # Leading/trailing separators leave empty words.
+        non_empty = pc.not_equal(flat, '').to_numpy(zero_copy_only=False)
+        positions = positions[non_empty]
+        tokens = pd.util.hash_array(
+            flat.to_numpy(zero_copy_only=False)[non_empty]
+        )
+
+        k = self.shingle_size
+        n_shingles = len(tokens) - k + 1
+        if n_shingles <= 0:
+            return np.empty(0, np.int64), np.empty(0, np.uint64)
+        hashes = tokens[:n_shingles].copy()
+        for offset in range(1, k):
+            hashes = _mix(hashes) ^ tokens[offset : offset + n_shingles]
+        # Shingles must not span two texts; texts shorter than
+        # `shingle_size` words have no shingles.
+        within = positions[:n_shingles] == positions[k - 1 :]
+        return positions[:n_shingles][within], _mix(hashes[within])
+
+    def _densify(self, signatures: np.ndarray) -> np.ndarray:
+        """Fill empty bins from the next non-empty bin (rotation)."""
+        n_texts, num_perm = signatures.shape
+        filled = signatures != _EMPTY
+        columns = np.arange(2 * num_perm)
+        positions = np.where(np.tile(filled, 2), columns, 2 * num_perm - 1)
+        source = np.minimum.accumulate(positions[:, ::-1], axis=1)[:, ::-1][
+            :, :num_perm
+        ]
+        distance = (source - columns[:num_perm]).astype(np.uint32)
+        densified = np.take_along_axis(
+            np.tile(signatures, 2), source, axis=1
+        ) + distance * _GOLDEN
+        densified[~filled.any(axis=1)] = _EMPTY
+        return densified
+
+    def signatures(self, texts: Iterable[Optional[str]]) -> np.ndarray:
+        """
+        Compute the MinHash signatures of texts.
+
+        Args:
+            texts (Iterable[Optional[str]]): The texts; missing ones are
+                treated as empty.
+
+        Returns:
+            np.ndarray: A (len(texts), num_perm) uint32 array. Texts without
+                any shingle get a row of 0xFFFFFFFF.
+        """
+        texts = pd.Series(list(texts), dtype=object)
+        texts = texts.where(texts.map(lambda text: isinstance(text, str)), None)
+        signatures = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        num_perm = np.uint64(self.num_perm)
+        for start in range(0, len(texts), _CHUNK_SIZE):
+            chunk = texts.iloc[start : start + _CHUNK_SIZE]
+            positions, hashes = self._shingle_hashes(chunk)
+            bins = (hashes % num_perm).astype(np.int64)
+            values = (hashes >> np.uint64(32)).astype(np.uint32)
+            flat = np.full(len(chunk) * self.num_perm, _EMPTY, dtype=np.uint32)
+            np.minimum.at(flat, positions * self.num_perm + bins, values)
+            signatures[start : start + len(chunk)] = self._densify(
+                flat.reshape(len(chunk), self.num_perm)
+            )
+        return signatures
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Estimate the Jaccard similarity of signatures.
+
+        Args:
+            a (np.ndarray): Signatures, one per row (or a single one).
+            b (np.ndarray): Signatures of the same shape as `a`.
+
+        Returns:
+            np.ndarray: The share of equal values of each pair of rows.
+        """
+        return (a == b).mean(axis=-1)
+
+    def _candidate_pairs(self, signatures: np.ndarray) -> np.ndarray:
+        """Pairs of rows sharing at least one LSH band, as an (n, 2) array."""
+        rows = np.flatnonzero(signatures[:, 0] != _EMPTY)
+        pairs = []
+        for band in range(self.bands):
+            columns = signatures[rows, band * self.rows : (band + 1) * self.rows]
+            keys = np.full(len(rows), band, dtype=np.uint64)
+            for column in columns.T:
+                keys = _mix(keys ^ column.astype(np.uint64))
+            order = np.argsort(keys, kind='stable')
+            same = keys[order[1:]] == keys[order[:-1]]
+            # Linking every member to the previous one in its bucket is
+            # enough to connect the bucket.
+            pairs.append(
+                np.stack([rows[order[:-1][same]], rows[order[1:][same]]], axis=1)
+            )
+        if not pairs:
+            return np.empty((0, 2), dtype=np.int64)
+        return np.unique(np.concatenate(pairs), axis=0)
+
+    def cluster_ids(self, texts: Iterable[Optional[str]]) -> np.ndarray:
+        """
+        Assign each text to a cluster of near-duplicates.
+
+        Args:
+            texts (Iterable[Optional[str]]): The texts to cluster.
+
+        Returns:
+            np.ndarray: For every text, the position of the first text of its
+                cluster (its own position when it has no near-duplicate).
+        """
+        signatures = self.signatures(texts)
+        pairs = self._candidate_pairs(signatures)
+        similar = np.zeros(len(pairs), dtype=bool)
+        for start in range(0, len(pairs), _CHUNK_SIZE):
+            chunk = pairs[start : start + _CHUNK_SIZE]
+            similar[start : start + _CHUNK_SIZE] = (
+                self.similarity(signatures[chunk[:, 0]], signatures[chunk[:, 1]])
+                >= self.threshold
+            )
+        first, second = pairs[similar, 0], pairs[similar, 1]
+
+        # Connected components: propagate the smallest position along the
+        # pairs, with pointer jumping, until nothing changes.
+        labels = np.arange(len(signatures))
+        while True:
+            smallest = np.minimum(labels[first], labels[second])
+            updated = labels.copy()
+            np.minimum.at(updated, first, smallest)
+            np.minimum.at(updated, second, smallest)
+            updated = updated[updated]
+            if np.array_equal(updated, labels):
+                return labels
+            labels = updated
+
+
+def drop_near_duplicates(
+    df: pd.DataFrame,
+    text_column: str = 'job_description',
+    threshold: float = NEAR_DUPLICATE_THRESHOLD,
+) -> pd.DataFrame:
+    """
+    Keep one posting per cluster of near-duplicate descriptions.
+
+    Args:
+        df (pd.DataFrame): The postings.
+        text_column (str, optional): The column compared.
+            Defaults to 'job_description'.
+        threshold (float, optional): Estimated Jaccard similarity from which
+            two descriptions are near-duplicates. Defaults to
+            `NEAR_DUPLICATE_THRESHOLD`.
+
+    Returns:
+        pd.DataFrame: The first posting of every cluster, in their original
+            order.
+    """
+    clusters = NearDuplicateDetector(threshold).cluster_ids(df[text_column])
+    keep = clusters == np.arange(len(df))
+    logger.info(
+        f'Dropped {len(df) - keep.sum()} near-duplicate postings '
+        f'({keep.sum()} clusters, similarity >= {threshold}).'
+    )
+    return df[keep]
@@ -0,0 +1,266 @@
+import logging
+import re
+from typing import Dict, List, NamedTuple, Optional, Pattern, Set, Tuple
+
+# The literal prefixes are read from the syntax tree of `re`'s own parser.
+# Its modules are private (`re._parser` and `re._constants` since Python
+# 3.11) and may change without notice: if they are missing, or their tree
+# can't be walked, patterns aren't indexed and every pattern is searched on
+# every text, which gives the same results, only slower.
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parser
+except ImportError:
+    sre_constants = sre_parser = None
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r'\w+')
+_WORD_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_'
+)
+# Non-ASCII characters that IGNORECASE matches against ASCII letters.
+_CASE_FOLD = str.maketrans(
+    {'İ': 'i', 'ı': 'i', 'ſ': 's', 'K': 'k'}
+)
+_MAX_ALTERNATIVES = 64
+
+
+class _Head(NamedTuple):
+    """The literal text one alternative of a pattern must start with."""
+
+    anchored: bool
+    literal: str
+    closed: bool
+    complete: bool
+
+
+def _fold(text: str) -> str:
+    """Case-fold text the way IGNORECASE compares it to ASCII literals."""
+    return text.translate(_CASE_FOLD).lower()
+
+
+def _pattern_heads(pattern: Pattern) -> Optional[List[_Head]]:
+    """
+    Find the literal every match of `pattern` must start with.
+
+    The pattern is parsed into its regex syntax tree and walked from the
+    start, collecting ASCII literal characters until the first construct
+    that isn't a plain literal. Alternations yield one head per branch.
+
+    Returns:
+        Optional[List[_Head]]: One head per alternative, or None if the
+            pattern can't be indexed (it is then searched on every text).
+    """
+    if sre_parser is None or pattern.flags & re.LOCALE:
+        return None
+    ignore_case = bool(pattern.flags & re.IGNORECASE)
+
+    try:
+        parsed = sre_parser.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+
+    heads: List[_Head] = []
+
+    def walk(
+        items: list, anchored: bool, literal: str, plain: bool = True
+    ) -> bool:
+        for i, (op, av) in enumerate(items):
+            if op is sre_constants.AT and av is sre_constants.AT_BOUNDARY:
+                if not literal:
+                    anchored = True
+                    continue
+                closed = literal[-1] in _WORD_CHARS
+                complete = (
+                    plain
+                    and closed
+                    and anchored
+                    and all(ch in _WORD_CHARS for ch in literal)
+                    and i == len(items) - 1
+                )
+                heads.append(_Head(anchored, literal, closed, complete))
+                return True
+            if op is sre_constants.AT and not literal:
+                # Other anchors (^, \B, ...) only restrict where a match may
+                # start, so the literal that follows is still required.
+                plain = False
+                continue
+            if op is sre_constants.LITERAL and 32 <= av < 127:
+                ch = chr(av)
+                literal += ch.lower() if ignore_case else ch
+                continue
+            if op is sre_constants.SUBPATTERN:
+                _, add_flags, del_flags, sub_pattern = av
+                if not add_flags and not del_flags:
+                    return walk(
+                        list(sub_pattern) + items[i + 1 :],
+                        anchored,
+                        literal,
+                        plain,
+                    )
+            if op is sre_constants.BRANCH:
+                rest = items[i + 1 :]
+                return all(
+                    walk(list(branch) + rest, anchored, literal, plain)
+                    for branch in av[1]
+                )
+            break
+
+        heads.append(_Head(anchored, literal, False, False))
+        return len(heads) <= _MAX_ALTERNATIVES
+
+    try:
+        if not walk(list(parsed), False, ''):
+            return None
+    except (AttributeError, TypeError, ValueError):
+        # The parser's syntax tree no longer has the expected shape.
+        return None
+    if any(not head.literal for head in heads):
+        return None
+    return heads
+
+
+class MultiPatternMatcher:
+    """
+    Match many groups of regex patterns against a text in one scan.
+
+    Python's `re` tries the branches of an alternation one by one at every
+    position, so a single combined regex is slower than searching each
+    pattern. Instead, the literal text each pattern must start with is
+    extracted up front and indexed. A text is tokenized once; the tokens
+    (for word-anchored literals) or substring checks select the few
+    candidate patterns that could match, and only those are searched with
+    their original regex. Patterns of the form `\\bword\\b` are confirmed by
+    the token alone. Results are identical to searching every pattern.
+    """
+
+    def __init__(self, patterns: Dict[str, List[Pattern]]):
+        """
+        Initialize the MultiPatternMatcher.
+
+        Args:
+            patterns (Dict[str, List[Pattern]]): Compiled patterns by group
+                name (e.g. skill or role). A group matches if any of its
+                patterns matches.
+        """
+        self.names: List[str] = list(patterns)
+        self._patterns: List[Tuple[int, Pattern]] = []
+        # (folded, token) -> ids of patterns a token can start
+        self._exact_tokens: Dict[Tuple[bool, str], Set[int]] = {}
+        self._prefix_tokens: Dict[Tuple[bool, str], Set[int]] = {}
+        self._prefix_lengths: Dict[bool, List[int]] = {True: [], False: []}
+        self._substrings: List[Tuple[int, bool, str]] = []
+        self._always: Set[int] = set()
+        self._certain: Set[int] = set()
+        self._needs_fold = False
+        self._needs_raw = False
+
+        for group_id, name in enumerate(self.names):
+            for pattern in patterns[name]:
+                pattern_id = len(self._patterns)
+                self._patterns.append((group_id, pattern))
+                self._index_pattern(pattern_id, pattern)
+
+        for folded in (True, False):
+            self._prefix_lengths[folded] = sorted(
+                {
+                    len(token)
+                    for is_folded, token in self._prefix_tokens
+                    if is_folded == folded
+                }
+            )
+
+        logger.debug(
+            f'Indexed {len(self._patterns)} patterns: '
+            f'{len(self._always)} without a usable literal prefix.'
+        )
+
+    def _index_pattern(self, pattern_id: int, pattern: Pattern) -> None:
+        """Register a pattern under the literal prefixes of its alternatives."""
+        heads = _pattern_heads(pattern)
+        if heads is None:
+            self._always.add(pattern_id)
+            return
+
+        folded = bool(pattern.flags & re.IGNORECASE)
+        ascii_only = bool(pattern.flags & re.ASCII)
+        if folded:
+            self._needs_fold = True
+        else:
+            self._needs_raw = True
+
+        if len(heads) == 1 and heads[0].complete and not ascii_only:
+            self._certain.add(pattern_id)
+
+        for head in heads:
+            literal = head.literal
+            if head.anchored and literal[0] in _WORD_CHARS and not ascii_only:
+                word_end = 0
+                while word_end < len(literal) and literal[word_end] in _WORD_CHARS:
+                    word_end += 1
+                word = literal[:word_end]
+                if word_end < len(literal) or head.closed:
+                    self._exact_tokens.setdefault((folded, word), set()).add(
+                        pattern_id
+                    )
+                else:
+                    self._prefix_tokens.setdefault((folded, word), set()).add(
+                        pattern_id
+                    )
+            else:
+                self._substrings.append((pattern_id, folded, literal))
+
+    def _candidates(self, text: str) -> Set[int]:
+        """Return the ids of the patterns that could match `text`."""
+        candidates = set(self._always)
+        views = []
+        if self._needs_fold:
+            views.append((True, _fold(text)))
+        if self._needs_raw:
+            views.append((False, text))
+
+        for folded, view in views:
+            lengths = self._prefix_lengths[folded]
+            for token in set(_WORD_RE.findall(view)):
+                ids = self._exact_tokens.get((folded, token))
+                if ids:
+                    candidates.update(ids)
+                for length in lengths:
+                    if length > len(token):
+                        break
+                    ids = self._prefix_tokens.get((folded, token[:length]))
+                    if ids:
+                        candidates.update(ids)
+
+        folded_text = views[0][1] if self._needs_fold else None
+        for pattern_id, folded, literal in self._substrings:
+            if literal in (folded_text if folded else text):
+                candidates.add(pattern_id)
+
+        return candidates
+
+    def find(self, text: str) -> List[str]:
+        """
+        Find every group with at least one pattern matching `text`.
+
+        Args:
+            text (str): The text to scan.
+
+        Returns:
+            List[str]: The names of the matching groups, in the order of the
+                `patterns` mapping.
+        """
+        if not text:
+            return []
+
+        candidates = self._candidates(text)
+        found: List[int] = []
+        for pattern_id in sorted(candidates):
+            group_id, pattern = self._patterns[pattern_id]
+            if found and found[-1] == group_id:
+                continue
+            if pattern_id in self._certain or pattern.search(text):
+                found.append(group_id)
+
+        return [self.names[group_id] for group_id in found]
@@ -0,0 +1,165 @@
+import logging
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+
+from config.analysis import STANDARD_SKILL_MAP
+from config.storage import (
+    DEDUP_COLUMNS,
+    FINGERPRINT_COLUMN,
+    STORAGE_FORMAT,
+    STREAMING_OUTPUT_DIR,
+)
+
+from ..utils.fingerprint import FingerprintSet, posting_fingerprints
+from ..utils.metrics import metrics
+from ..utils.storage import append_table, read_table
+from .analysis_main import process_jobs
+from .extracting_skills_list import SkillExtractor
+from .location_resolver import LocationResolver
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingPipeline:
+    """
+    Process scraped jobs in batches as they arrive.
+
+    Every batch is deduplicated against the postings already processed,
+    run through the same stages as `run_pipeline` (skills, titles, dates
+    and locations) and appended to the processed tables, so memory use is
+    bounded by the batch size and the outputs are available while the
+    scrape is still running. A posting is identified by its fingerprint
+    (`FINGERPRINT_COLUMN`, added by the scraper); the fingerprints of
+    previous runs are loaded from the jobs table on start, so a stream can
+    be resumed, and checking a batch only costs O(batch size).
+    """
+
+    def __init__(
+        self,
+        classify_titles: bool = True,
+        n_jobs: int = 1,
+        storage_format: str = STORAGE_FORMAT,
+        output_dir: Path = STREAMING_OUTPUT_DIR,
+    ):
+        """
+        Initialize the StreamingPipeline.
+
+        Args:
+            classify_titles: Whether to classify job titles.
+            n_jobs: Number of worker processes for skill extraction
+                (-1 uses all CPUs).
+            storage_format: Format of the processed tables, 'parquet' or 'csv'.
+            output_dir: Directory of the processed tables.
+                Defaults to `STREAMING_OUTPUT_DIR`.
+        """
+        self.classify_titles = classify_titles
+        self.n_jobs = n_jobs
+        self.storage_format = storage_format
+        self.extractor = SkillExtractor(STANDARD_SKILL_MAP)
+        self.location_resolver = LocationResolver()
+
+        output_dir = Path(output_dir)
+        self.jobs_path = output_dir / (
+            'df_jobs_classified' if classify_titles else 'df_jobs'
+        )
+        self.skills_path = output_dir / 'df_skills'
+
+        self.seen = self._load_seen()
+        self.rows_written = 0
+
+    def _load_seen(self) -> FingerprintSet:
+        """Load the fingerprints of the postings in the jobs table, if any."""
+        table = self.jobs_path.with_suffix(f'.{self.storage_format}')
+        if not table.exists():
+            return FingerprintSet()
+        try:
+            fingerprints = read_table(
+                self.jobs_path,
+                columns=[FINGERPRINT_COLUMN],
+                storage_format=self.storage_format,
+            )[FINGERPRINT_COLUMN]
+            if fingerprints.isna().any():
+                raise ValueError('missing fingerprints')
+        except (KeyError, ValueError):
+            # Tables written before fingerprints were stored.
+            fingerprints = posting_fingerprints(
+                read_table(
+                    self.jobs_path,
+                    columns=DEDUP_COLUMNS,
+                    storage_format=self.storage_format,
+                )
+            )
+        seen = FingerprintSet(fingerprints)
+        logger.info(f'Loaded {len(seen)} processed postings from {table}')
+        return seen
+
+    def process_batch(self, batch: pd.DataFrame) -> int:
+        """
+        Deduplicate, process and append a batch of raw job postings.
+
+        Args:
+            batch: Raw job postings, as yielded by
+                `JobScraper.iter_job_batches`.
+
+        Returns:
+            int: The number of job rows appended.
+        """
+        if batch.empty:
+            return 0
+        metrics.observe('streaming.batch_size', len(batch))
+
+        if (
+            FINGERPRINT_COLUMN not in batch.columns
+            or batch[FINGERPRINT_COLUMN].isna().any()
+        ):
+            batch = batch.assign(**{FINGERPRINT_COLUMN: posting_fingerprints(batch)})
+        unique = batch[self.seen.first_seen(batch[FINGERPRINT_COLUMN])].reset_index(
+            drop=True
+        )
+        metrics.count('streaming.duplicates_skipped', len(batch) - len(unique))
+        if unique.empty:
+            logger.info(f'Skipped a batch of {len(batch)} duplicate postings.')
+            return 0
+
+        df_jobs, df_skills = process_jobs(
+            unique,
+            self.extractor,
+            self.location_resolver,
+            classify_titles=self.classify_titles,
+            n_jobs=self.n_jobs,
+        )
+        with metrics.timer('streaming.append', len(df_jobs)):
+            append_table(df_jobs, self.jobs_path, self.storage_format)
+            append_table(df_skills, self.skills_path, self.storage_format)
+        self.rows_written += len(df_jobs)
+        logger.info(
+            f'Appended {len(df_jobs)} jobs and {len(df_skills)} skills ({len(batch) - len(unique)} duplicates skipped).'
+        )
+        return len(df_jobs)
+
+    def run(self, batches: Iterable[pd.DataFrame]) -> int:
+        """
+        Process batches until the iterable is exhausted.
+
+        The skill extraction workers, kept across batches, are shut down and
+        the unresolved locations report is exported at the end, also when
+        the stream stops with an error.
+
+        Args:
+            batches: The batches of raw job postings.
+
+        Returns:
+            int: The number of job rows appended.
+        """
+        try:
+            for batch in batches:
+                self.process_batch(batch)
+        finally:
+            self.extractor.close()
+            self.location_resolver.export_report()
+            logger.success(
+                f'Streamed {self.rows_written} data jobs into {self.jobs_path.parent}.'
+            )
+        return self.rows_written
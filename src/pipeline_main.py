@@ -0,0 +1,84 @@
+import argparse
+import logging
+
+from config.storage import STORAGE_FORMAT, STREAM_BATCH_SIZE
+
+from .analysis.streaming import StreamingPipeline
+from .scraping.linkedin_scraper import JobScraper
+from .scraping.scraping_main import collect_job_ids
+from .utils.logger import setup_logging
+from .utils.metrics import enable_metrics
+from .utils.profiling import add_profiling_arguments, profiling_from_args
+from .utils.storage import STORAGE_FORMATS
+
+logger = logging.getLogger(__name__)
+
+
+def run_streaming(
+    batch_size: int = STREAM_BATCH_SIZE,
+    collect_ids: bool = True,
+    classify_titles: bool = True,
+    n_jobs: int = 1,
+    storage_format: str = STORAGE_FORMAT,
+) -> int:
+    """
+    Scrape job postings and process them as they arrive.
+
+    Jobs are fetched, saved to the raw dataset and handed to the analysis
+    stages in batches of `batch_size`, whose results are appended to the
+    processed tables in `STREAMING_OUTPUT_DIR`.
+
+    Args:
+        batch_size: Maximum number of jobs processed at once.
+        collect_ids: Search for new job IDs before fetching the jobs.
+        classify_titles: Whether to classify job titles.
+        n_jobs: Number of worker processes for skill extraction
+            (-1 uses all CPUs).
+        storage_format: Format of the raw dataset and of the processed
+            tables, 'parquet' or 'csv'.
+
+    Returns:
+        int: The number of job rows appended.
+    """
+    job_scraper = JobScraper(storage_format=storage_format)
+    try:
+        if collect_ids:
+            collect_job_ids(job_scraper)
+        pipeline = StreamingPipeline(
+            classify_titles=classify_titles,
+            n_jobs=n_jobs,
+            storage_format=storage_format,
+        )
+        return pipeline.run(job_scraper.iter_job_batches(batch_size))
+    finally:
+        job_scraper.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Scrape job postings and process them in batches.'
+    )
+    parser.add_argument('--batch-size', type=int, default=STREAM_BATCH_SIZE)
+    parser.add_argument(
+        '--skip-ids',
+        action='store_true',
+        help='Only fetch the job IDs already collected.',
+    )
+    parser.add_argument('--no-classify', action='store_true')
+    parser.add_argument('--n-jobs', type=int, default=1)
+    parser.add_argument(
+        '--storage-format', choices=STORAGE_FORMATS, default=STORAGE_FORMAT
+    )
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+
+    setup_logging()
+    enable_metrics()
+    profiling_from_args(args)
+    run_streaming(
+        batch_size=args.batch_size,
+        collect_ids=not args.skip_ids,
+        classify_titles=not args.no_classify,
+        n_jobs=args.n_jobs,
+        storage_format=args.storage_format,
+    )
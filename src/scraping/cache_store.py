@@ -0,0 +1,366 @@
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from config.scraping import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+LEGACY_PICKLE_FILES = {
+    'job_data': 'job_data_cache.pkl',
+    'job_id': 'job_ids_cache.pkl',
+    'job_amount': 'job_amount_cache.pkl',
+}
+
+
+class CacheStore(MutableMapping, ABC):
+    """
+    Base class for the key/value caches used by `JobScraper`.
+
+    Stores behave like dictionaries keyed by job ID. Writes may be buffered
+    in memory until `flush` persists them. Subclasses implement `flush` and
+    the abstract methods of `MutableMapping`.
+    """
+
+    @abstractmethod
+    def flush(self) -> int:
+        """
+        Persist buffered writes.
+
+        Returns:
+            int: The number of entries written.
+        """
+
+    def close(self) -> None:
+        """Flush pending writes and release any underlying resources."""
+        self.flush()
+
+
+class PickleCacheStore(CacheStore):
+    """
+    A cache kept in memory and persisted as a single pickle file.
+
+    This is the original cache format: every flush rewrites the whole file.
+    The file is only unpickled on first access.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the PickleCacheStore.
+
+        Args:
+            path (Path): The pickle file backing the cache.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._data: Optional[Dict[str, Any]] = None
+        self._dirty = False
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """The cached dictionary, loaded from disk on first access."""
+        if self._data is None:
+            self._data = {}
+            if self.path.exists():
+                try:
+                    with open(self.path, 'rb') as f:
+                        self._data = pickle.load(f)
+                    logger.info(
+                        f'Successfully loaded cache with {len(self._data)} entries from {self.path}'
+                    )
+                except Exception as e:
+                    logger.error(f'Failed to load cache from {self.path}: {e}')
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.data[key] = value
+        self._dirty = True
+
+    def __delitem__(self, key: str) -> None:
+        del self.data[key]
+        self._dirty = True
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def flush(self) -> int:
+        if not self._dirty:
+            return 0
+
+        with open(self.path, 'wb') as f:
+            pickle.dump(self.data, f)
+        self._dirty = False
+        return len(self.data)
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    A cache persisted as one table of a SQLite database in WAL mode.
+
+    Nothing is loaded up front: lookups hit the database directly. New or
+    changed entries are buffered and written in a single transaction when
+    `flush` is called or when `batch_size` entries are pending, so each flush
+    costs O(changes) instead of O(cache size). Values are stored as JSON.
+    """
+
+    PAGE_SIZE = 1000
+
+    def __init__(self, db_path: Path, table: str, batch_size: int = 500):
+        """
+        Initialize the SQLiteCacheStore.
+
+        Args:
+            db_path (Path): The SQLite database file.
+            table (str): The table holding this cache. Several caches can
+                share one database file using different tables.
+            batch_size (int, optional): Number of pending writes that triggers
+                an automatic flush. Defaults to 500.
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid cache table name: '{table}'.")
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.table = table
+        self.batch_size = batch_size
+        self._pending: Dict[str, Any] = {}
+        self._deleted: set[str] = set()
+        self._lock = threading.RLock()
+
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.table} '
+            '(key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            if key in self._deleted:
+                raise KeyError(key)
+            row = self._conn.execute(
+                f'SELECT value FROM {self.table} WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._pending[key] = value
+            self._deleted.discard(key)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        with self._lock:
+            self._pending.pop(key, None)
+            self._deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            if key in self._pending:
+                return True
+            if key in self._deleted:
+                return False
+            row = self._conn.execute(
+                f'SELECT 1 FROM {self.table} WHERE key = ?', (key,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._lock:
+            return self._conn.execute(
+                f'SELECT COUNT(*) FROM {self.table}'
+            ).fetchone()[0]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._iter_rows('key')
+
+    def items(self) -> Iterator:
+        """Iterate over (key, value) pairs in insertion order."""
+        for key, value in self._iter_rows('key, value'):
+            yield key, json.loads(value)
+
+    def _iter_rows(self, columns: str) -> Iterator:
+        """
+        Page through the table in rowid order.
+
+        Paging keeps memory bounded and lets callers write to the cache while
+        iterating over it.
+        """
+        self.flush()
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f'SELECT rowid, {columns} FROM {self.table} '
+                    'WHERE rowid > ? ORDER BY rowid LIMIT ?',
+                    (last_rowid, self.PAGE_SIZE),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row[1] if len(row) == 2 else row[1:]
+            last_rowid = rows[-1][0]
+
+    def update_many(self, entries: Dict[str, Any]) -> int:
+        """
+        Write many entries in a single transaction.
+
+        Args:
+            entries (Dict[str, Any]): The entries to write.
+
+        Returns:
+            int: The number of entries written.
+        """
+        with self._lock:
+            self._pending.update(entries)
+            self._deleted.difference_update(entries)
+            return self.flush()
+
+    def flush(self) -> int:
+        with self._lock:
+            if not self._pending and not self._deleted:
+                return 0
+
+            written = len(self._pending) + len(self._deleted)
+            with self._conn:
+                self._conn.execute('BEGIN')
+                self._conn.executemany(
+                    f'INSERT INTO {self.table} (key, value) VALUES (?, ?) '
+                    'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                    (
+                        (key, json.dumps(value, ensure_ascii=False))
+                        for key, value in self._pending.items()
+                    ),
+                )
+                self._conn.executemany(
+                    f'DELETE FROM {self.table} WHERE key = ?',
+                    ((key,) for key in self._deleted),
+                )
+            self._pending.clear()
+            self._deleted.clear()
+            return written
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+
+def migrate_pickle_cache(pickle_path: Path, store: CacheStore) -> int:
+    """
+    Copy every entry of a legacy pickle cache into another cache store.
+
+    Args:
+        pickle_path (Path): The legacy `.pkl` cache file.
+        store (CacheStore): The destination store.
+
+    Returns:
+        int: The number of migrated entries (0 if the file does not exist).
+    """
+    pickle_path = Path(pickle_path)
+    if not pickle_path.exists():
+        return 0
+
+    with open(pickle_path, 'rb') as f:
+        legacy_cache = pickle.load(f)
+
+    if isinstance(store, SQLiteCacheStore):
+        store.update_many(legacy_cache)
+    else:
+        store.update(legacy_cache)
+        store.flush()
+
+    logger.info(
+        f'Migrated {len(legacy_cache)} cache entries from {pickle_path} to {type(store).__name__}.'
+    )
+    return len(legacy_cache)
+
+
+def open_cache_store(
+    cache_type: str, backend: str = 'sqlite', cache_dir: Path = CACHE_DIR
+) -> CacheStore:
+    """
+    Open the job data, job ID or job amount cache with the chosen backend.
+
+    The first time a SQLite cache table is created, entries from the matching
+    legacy pickle file (if any) are migrated into it.
+
+    Args:
+        cache_type (str): The cache to open, 'job_data', 'job_id' or
+            'job_amount'.
+        backend (str, optional): 'sqlite' or 'pickle'. Defaults to 'sqlite'.
+        cache_dir (Path, optional): Directory holding the cache files.
+            Defaults to `CACHE_DIR`.
+
+    Returns:
+        CacheStore: The opened cache store.
+
+    Raises:
+        ValueError: If `cache_type` or `backend` is not supported.
+    """
+    if cache_type not in LEGACY_PICKLE_FILES:
+        raise ValueError(
+            f"Invalid cache type '{cache_type}'. Choose from {', '.join(repr(t) for t in LEGACY_PICKLE_FILES)}."
+        )
+
+    cache_dir = Path(cache_dir)
+    pickle_path = cache_dir / LEGACY_PICKLE_FILES[cache_type]
+
+    if backend == 'pickle':
+        return PickleCacheStore(pickle_path)
+
+    if backend == 'sqlite':
+        db_path = cache_dir / 'job_cache.sqlite'
+        store = SQLiteCacheStore(db_path, table=f'{cache_type}_cache')
+        with store._lock:
+            is_empty = (
+                store._conn.execute(
+                    f'SELECT 1 FROM {store.table} LIMIT 1'
+                ).fetchone()
+                is None
+            )
+        if is_empty and pickle_path.exists():
+            migrate_pickle_cache(pickle_path, store)
+        return store
+
+    raise ValueError(
+        f"Invalid cache backend '{backend}'. Choose from 'sqlite' or 'pickle'."
+    )
+
+
+if __name__ == '__main__':
+    from ..utils.logger import setup_logging
+
+    setup_logging()
+    for cache_type, file_name in LEGACY_PICKLE_FILES.items():
+        sqlite_store = SQLiteCacheStore(
+            Path(CACHE_DIR) / 'job_cache.sqlite', table=f'{cache_type}_cache'
+        )
+        migrate_pickle_cache(Path(CACHE_DIR) / file_name, sqlite_store)
+        sqlite_store.close()
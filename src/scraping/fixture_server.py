@@ -0,0 +1,228 @@
+import argparse
+import gzip
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+from config.scraping import HTTP_ARCHIVE_PATH
+
+from ..utils.logger import setup_logging
+from .http_archive import HttpArchive
+
+logger = logging.getLogger(__name__)
+
+
+class FixtureServer:
+    """
+    A local stand-in for LinkedIn that serves responses from an `HttpArchive`.
+
+    Point a `JobScraper` at it with `base_url=server.url` to run scraping end
+    to end without network access. Latency, 429 responses and server errors
+    can be injected to tune concurrency and retry settings.
+    """
+
+    def __init__(
+        self,
+        archive: HttpArchive,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        rate_429: float = 0.0,
+        retry_after: Optional[int] = None,
+        error_rate: float = 0.0,
+        compress: bool = False,
+        throttle_rate: Optional[float] = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the FixtureServer.
+
+        Args:
+            archive (HttpArchive): The archive whose responses are served.
+            latency (float, optional): Seconds added to every response.
+                Defaults to 0.0.
+            latency_jitter (float, optional): Extra uniformly random latency
+                of up to this many seconds. Defaults to 0.0.
+            rate_429 (float, optional): Fraction of requests answered with
+                429 Too Many Requests. Defaults to 0.0.
+            retry_after (Optional[int], optional): Value of the Retry-After
+                header sent with injected 429s. Defaults to None (no header).
+            error_rate (float, optional): Fraction of requests answered with
+                500 Internal Server Error. Defaults to 0.0.
+            compress (bool, optional): Gzip response bodies for clients
+                accepting it. Defaults to False.
+            throttle_rate (Optional[float], optional): Answer with 429 the
+                requests exceeding this many per second, like a real rate
+                limit (a token bucket holding one second of requests).
+                Defaults to None (no limit).
+            host (str, optional): Interface to bind. Defaults to '127.0.0.1'.
+            port (int, optional): Port to bind; 0 picks a free port.
+                Defaults to 0.
+            seed (Optional[int], optional): Seed for the fault injection.
+        """
+        self.archive = archive
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.compress = compress
+        self.throttle_rate = throttle_rate
+        self.throttled_count = 0
+        self._bucket = throttle_rate or 0.0
+        self._bucket_time = time.monotonic()
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        # Load the archive before serving so the first requests aren't slow.
+        len(self.archive)
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """The base URL to pass to `JobScraper(base_url=...)`."""
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def _draw(self):
+        """Pick the delay and injected failure (if any) of one request."""
+        with self._lock:
+            self.request_count += 1
+            delay = self.latency + self._random.uniform(0, self.latency_jitter)
+            roll = self._random.random()
+            throttled = False
+            if self.throttle_rate:
+                now = time.monotonic()
+                self._bucket = min(
+                    self.throttle_rate,
+                    self._bucket + (now - self._bucket_time) * self.throttle_rate,
+                )
+                self._bucket_time = now
+                if self._bucket >= 1:
+                    self._bucket -= 1
+                else:
+                    throttled = True
+                    self.throttled_count += 1
+        if throttled or roll < self.rate_429:
+            return delay, 429
+        if roll < self.rate_429 + self.error_rate:
+            return delay, 500
+        return delay, None
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are separate writes; without TCP_NODELAY a
+            # kept-alive client waits for a delayed ACK on every response.
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def _send(self, status, body=b'', headers=None):
+                self.send_response(status)
+                for header, value in (headers or {}).items():
+                    self.send_header(header, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                delay, failure = server._draw()
+                if delay:
+                    time.sleep(delay)
+
+                if failure == 429:
+                    headers = {}
+                    if server.retry_after is not None:
+                        headers['Retry-After'] = str(server.retry_after)
+                    self._send(429, headers=headers)
+                    return
+                if failure == 500:
+                    self._send(500)
+                    return
+
+                entry = server.archive.get(f'GET {self.path}')
+                if entry is None:
+                    self._send(404)
+                    return
+
+                headers = dict(entry['headers'])
+                headers.setdefault('Content-Type', 'text/html; charset=utf-8')
+                body = entry['body'].encode('utf-8')
+                if server.compress and 'gzip' in self.headers.get(
+                    'Accept-Encoding', ''
+                ):
+                    body = gzip.compress(body, compresslevel=6)
+                    headers['Content-Encoding'] = 'gzip'
+                self._send(entry['status'], body, headers)
+
+        return Handler
+
+    def start(self) -> 'FixtureServer':
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f'Fixture server with {len(self.archive)} responses listening on {self.url}'
+        )
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'FixtureServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Serve an HTTP archive as a local LinkedIn stand-in.'
+    )
+    parser.add_argument('--archive', type=Path, default=HTTP_ARCHIVE_PATH)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--latency-jitter', type=float, default=0.0)
+    parser.add_argument('--rate-429', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=int, default=None)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--compress', action='store_true')
+    parser.add_argument('--throttle-rate', type=float, default=None)
+    args = parser.parse_args()
+
+    setup_logging()
+    fixture_server = FixtureServer(
+        HttpArchive(args.archive),
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        rate_429=args.rate_429,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        compress=args.compress,
+        throttle_rate=args.throttle_rate,
+        port=args.port,
+    )
+    fixture_server.start()
+    try:
+        fixture_server._thread.join()
+    except KeyboardInterrupt:
+        fixture_server.stop()
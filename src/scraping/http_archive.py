@@ -0,0 +1,192 @@
+import gzip
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config.scraping import HTTP_ARCHIVE_PATH
+
+logger = logging.getLogger(__name__)
+
+HTTP_MODES = ['live', 'record', 'replay']
+
+
+def archive_key(method: str, url: str, params: Any = None) -> str:
+    """
+    Build the archive key of a request.
+
+    The key is the method plus the encoded path and query string, without the
+    scheme and host, so an archive recorded against LinkedIn can be replayed
+    against any base URL (e.g. a local fixture server).
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The request URL.
+        params (Any, optional): Query parameters passed to `requests`.
+
+    Returns:
+        str: The archive key, e.g. 'GET /jobs-guest/jobs/api/jobPosting/1'.
+    """
+    prepared = requests.Request(method.upper(), url, params=params).prepare()
+    return f'{prepared.method} {prepared.path_url}'
+
+
+class HttpArchive:
+    """
+    A compact on-disk archive of HTTP responses.
+
+    Entries are stored as gzip-compressed JSON lines keyed by `archive_key`.
+    Appending writes a new gzip member, so recording is crash-safe and never
+    rewrites earlier entries. When a key is recorded twice, the latest entry
+    wins on load.
+    """
+
+    def __init__(self, path: Path = HTTP_ARCHIVE_PATH):
+        """
+        Initialize the HttpArchive.
+
+        Args:
+            path (Path, optional): The archive file.
+                Defaults to `HTTP_ARCHIVE_PATH`.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """All archived entries by key, read from disk on first access."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = {}
+                if self.path.exists():
+                    with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                        for line in f:
+                            entry = json.loads(line)
+                            self._entries[entry['key']] = entry
+                    logger.info(
+                        f'Loaded {len(self._entries)} archived responses from {self.path}'
+                    )
+            return self._entries
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an archived response.
+
+        Args:
+            key (str): The archive key of the request.
+
+        Returns:
+            Optional[Dict[str, Any]]: The archived entry with its 'status',
+                'headers' and 'body', or None if the key was never recorded.
+        """
+        return self.entries.get(key)
+
+    def add(
+        self, key: str, status: int, headers: Dict[str, str], body: str
+    ) -> None:
+        """
+        Append a response to the archive.
+
+        Args:
+            key (str): The archive key of the request.
+            status (int): The HTTP status code.
+            headers (Dict[str, str]): Response headers worth keeping.
+            body (str): The decoded response body.
+        """
+        entry = {'key': key, 'status': status, 'headers': headers, 'body': body}
+        entries = self.entries
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, 'at', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            entries[key] = entry
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class ArchiveSession(requests.Session):
+    """
+    A `requests.Session` that records responses to, or replays them from, an
+    `HttpArchive`.
+
+    In 'record' mode requests go to the network as usual and every response
+    but the transient ones (429 and 5xx) is archived: client errors such as
+    the 404 of a removed posting are part of what a scrape sees, so they are
+    replayed too, keeping a replayed run identical to the recorded one.
+    Transient failures are left to `FixtureServer`, which injects them on
+    demand. In 'replay' mode no network access happens: the archived
+    response is returned, or a 404 response if the request was never
+    recorded.
+    """
+
+    RECORDED_HEADERS = ['Content-Type', 'Retry-After']
+
+    def __init__(self, archive: HttpArchive, mode: str = 'replay'):
+        """
+        Initialize the ArchiveSession.
+
+        Args:
+            archive (HttpArchive): The archive to record to or replay from.
+            mode (str, optional): 'record' or 'replay'. Defaults to 'replay'.
+
+        Raises:
+            ValueError: If `mode` is not 'record' or 'replay'.
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(
+                f"Invalid archive mode '{mode}'. Choose from 'record' or 'replay'."
+            )
+        super().__init__()
+        self.archive = archive
+        self.mode = mode
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:
+        key = archive_key(method, url, kwargs.get('params'))
+
+        if self.mode == 'replay':
+            return self._replay(key, method, url, kwargs.get('params'))
+
+        response = super().request(method, url, *args, **kwargs)
+        # Rate limiting and server errors would be retried; don't freeze them.
+        if response.status_code < 500 and response.status_code != 429:
+            self.archive.add(
+                key,
+                response.status_code,
+                {
+                    header: response.headers[header]
+                    for header in self.RECORDED_HEADERS
+                    if header in response.headers
+                },
+                response.text,
+            )
+        return response
+
+    def _replay(
+        self, key: str, method: str, url: str, params: Any
+    ) -> requests.Response:
+        """Build a response object from the archive without network access."""
+        entry = self.archive.get(key)
+
+        response = requests.Response()
+        response.request = requests.Request(
+            method.upper(), url, params=params
+        ).prepare()
+        response.url = response.request.url
+        response.encoding = 'utf-8'
+        if entry is None:
+            logger.debug(f'No archived response for {key}')
+            response.status_code = 404
+            response._content = b''
+            response.reason = 'Not Found'
+            return response
+
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body'].encode('utf-8')
+        return response
@@ -0,0 +1,466 @@
+import logging
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from config.scraping import (
+    KEYWORD_OVERLAP_PATH,
+    LOW_YIELD_PAGES,
+    LOW_YIELD_THRESHOLD,
+    SEARCH_PAGES_AHEAD,
+    WORK_MODEL,
+)
+
+from ..utils.metrics import metrics
+from .job_parser import parse_job_ids
+
+if TYPE_CHECKING:
+    from .linkedin_scraper import JobScraper
+
+logger = logging.getLogger(__name__)
+
+SEARCH_PAGE_SIZE = 10
+
+
+def unique_keywords(keywords: Iterable[str]) -> List[str]:
+    """
+    Drop repeated keywords, ignoring case and surrounding whitespace.
+
+    Args:
+        keywords (Iterable[str]): The keywords to search for.
+
+    Returns:
+        List[str]: The first occurrence of each keyword, in order.
+    """
+    seen: Set[str] = set()
+    unique = []
+    for keyword in keywords:
+        normalized = ' '.join(keyword.split()).casefold()
+        if normalized in seen:
+            logger.info(f"Skipping repeated keyword '{keyword}'.")
+            continue
+        seen.add(normalized)
+        unique.append(keyword)
+    return unique
+
+
+class SearchStream:
+    """
+    The search results of one keyword and work model, walked page by page.
+
+    Holds the crawl position and the statistics of the stream.
+    """
+
+    def __init__(
+        self,
+        keyword: str,
+        work_model_id: str = 'random',
+        n_ids_to_fetch: int = 1000,
+    ):
+        """
+        Initialize the SearchStream.
+
+        Args:
+            keyword (str): The raw keyword to search for.
+            work_model_id (str, optional): '1' (On-site), '2' (Remote),
+                '3' (Hybrid) or 'random', which picks one per page.
+                Defaults to 'random'.
+            n_ids_to_fetch (int, optional): Stop after this many new IDs;
+                also bounds the result offsets requested. Defaults to 1000.
+
+        Raises:
+            ValueError: If `work_model_id` is not one of the allowed values.
+        """
+        if work_model_id not in ['1', '2', '3', 'random']:
+            raise ValueError(
+                "Invalid 'work_model_id'. Choose from '1' (On-site), '2' (Remote), "
+                "'3' (Hybrid), or 'random'."
+            )
+        self.keyword = keyword
+        self.work_model_id = work_model_id
+        self.n_ids_to_fetch = n_ids_to_fetch
+
+        self.next_offset = 0
+        self.done = False
+        self.pages = 0
+        self.failed_pages = 0
+        self.new_ids = 0
+        self.low_yield_run = 0
+        self.stop_reason: Optional[str] = None
+        # Every ID the stream's pages listed, new or not.
+        self.seen_ids: Set[str] = set()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        # Fetched pages not applied yet, by offset.
+        self.results: Dict[int, Tuple[str, Optional[List[str]]]] = {}
+        self.next_result = 0
+        self.in_flight = 0
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether every page the stream may request has been scheduled."""
+        return self.done or self.next_offset >= self.n_ids_to_fetch
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds from the first request to the last applied page."""
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def pages_per_new_id(self) -> float:
+        """Search page requests spent per new ID discovered."""
+        return self.pages / self.new_ids if self.new_ids else float(self.pages)
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def ids_per_second(self) -> float:
+        return self.new_ids / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchStream('{self.keyword}', work_model={self.work_model_id}, "
+            f'pages={self.pages}, new_ids={self.new_ids})'
+        )
+
+
+class IdCrawler:
+    """
+    Crawl the search results of several streams concurrently.
+
+    Up to `max_workers` pages are fetched at once, spread over the streams
+    in turn, with each stream at most `pages_ahead` pages ahead of the last
+    page it processed. All requests go through the scraper's retrying
+    fetch and shared rate limiter. Pages are processed by the calling
+    thread in offset order per stream, so a stream stops at its first page
+    without results (pages requested past it are discarded) and
+    `job_ids_cache` has a single writer. When streams overlap, an ID is
+    credited to the stream whose page was processed first.
+
+    Results are listed newest first, so once a stream keeps returning IDs
+    that are already known (from earlier crawls or overlapping keywords),
+    its remaining pages are unlikely to be worth their requests: a stream
+    also stops after `low_yield_pages` consecutive pages whose share of new
+    IDs is below `low_yield_threshold`.
+    """
+
+    def __init__(
+        self,
+        scraper: 'JobScraper',
+        max_workers: Optional[int] = None,
+        pages_ahead: int = SEARCH_PAGES_AHEAD,
+        low_yield_threshold: float = LOW_YIELD_THRESHOLD,
+        low_yield_pages: int = LOW_YIELD_PAGES,
+    ):
+        """
+        Initialize the IdCrawler.
+
+        Args:
+            scraper (JobScraper): Provides the HTTP session, rate limiter,
+                HTML parser and `job_ids_cache`.
+            max_workers (Optional[int], optional): Maximum number of pages
+                fetched concurrently. Defaults to the scraper's `max_workers`.
+            pages_ahead (int, optional): Maximum number of pages of a stream
+                in flight or waiting to be processed.
+                Defaults to `SEARCH_PAGES_AHEAD`.
+            low_yield_threshold (float, optional): Share of new IDs below
+                which a page counts as low-yield.
+                Defaults to `LOW_YIELD_THRESHOLD`.
+            low_yield_pages (int, optional): Consecutive low-yield pages
+                after which a stream stops; 0 never stops early.
+                Defaults to `LOW_YIELD_PAGES`.
+        """
+        self.scraper = scraper
+        self.max_workers = max(1, max_workers or scraper.max_workers)
+        self.pages_ahead = max(1, pages_ahead)
+        self.low_yield_threshold = low_yield_threshold
+        self.low_yield_pages = low_yield_pages
+
+    def page_url(self, keyword: str, work_model_code: str, offset: int) -> str:
+        """Build the URL of a search results page."""
+        return (
+            f'{self.scraper.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?'
+            f'keywords={self.scraper.format_keyword(keyword)}&location=Brasil&geoId=106057199'
+            f'&f_WT={work_model_code}&start={offset}'
+        )
+
+    def fetch_page(
+        self, keyword: str, work_model_code: str, offset: int
+    ) -> Optional[List[str]]:
+        """
+        Fetch a search results page and extract its job IDs.
+
+        Returns:
+            Optional[List[str]]: The IDs on the page (empty past the last
+                result), or None if the page couldn't be fetched.
+        """
+        url = self.page_url(keyword, work_model_code, offset)
+        logger.debug(f'Fetching job ID page: {url}')
+        response = self.scraper.fetch_with_smart_retry(url)
+        if not response:
+            return None
+        with metrics.timer('scraper.parse_search_page', 1):
+            return parse_job_ids(response.text, self.scraper.html_parser)
+
+    def _schedule(
+        self,
+        executor: ThreadPoolExecutor,
+        in_flight: Dict[Future, Tuple[SearchStream, int, str]],
+        streams: List[SearchStream],
+    ) -> None:
+        """Submit pages, one stream at a time, until the workers are busy."""
+        submitted = True
+        while submitted and len(in_flight) < self.max_workers:
+            submitted = False
+            for stream in streams:
+                if len(in_flight) >= self.max_workers:
+                    break
+                if stream.exhausted or (
+                    stream.in_flight + len(stream.results) >= self.pages_ahead
+                ):
+                    continue
+
+                work_model_code = (
+                    random.choice(list(WORK_MODEL.keys()))
+                    if stream.work_model_id == 'random'
+                    else stream.work_model_id
+                )
+                offset = stream.next_offset
+                stream.next_offset += SEARCH_PAGE_SIZE
+                stream.in_flight += 1
+                if stream.started is None:
+                    stream.started = time.monotonic()
+                future = executor.submit(
+                    self.fetch_page, stream.keyword, work_model_code, offset
+                )
+                in_flight[future] = (stream, offset, work_model_code)
+                submitted = True
+
+    def _apply(self, stream: SearchStream) -> None:
+        """Merge the fetched pages of a stream that are next in order."""
+        while not stream.done and stream.next_result in stream.results:
+            offset = stream.next_result
+            work_model_code, job_ids = stream.results.pop(offset)
+            stream.next_result += SEARCH_PAGE_SIZE
+            stream.pages += 1
+            stream.finished = time.monotonic()
+
+            if job_ids is None:
+                stream.failed_pages += 1
+                logger.warning(
+                    f"Failed to fetch job ID page at offset {offset} for keyword '{stream.keyword}', skipping..."
+                )
+                continue
+
+            if not job_ids:
+                logger.info(
+                    f"No job cards found on page with offset {offset} for '{stream.keyword}'. May indicate end of results."
+                )
+                stream.done = True
+                stream.stop_reason = 'end of results'
+                break
+
+            page_ids_found = 0
+            for job_id in job_ids:
+                if not job_id:
+                    continue
+                stream.seen_ids.add(job_id)
+                if job_id not in self.scraper.job_ids_cache:
+                    self.scraper.job_ids_cache[job_id] = {
+                        'work_model': WORK_MODEL.get(work_model_code, 'Unknown'),
+                        'keyword': stream.keyword,
+                    }
+                    stream.new_ids += 1
+                    page_ids_found += 1
+
+            logger.info(
+                f"Found {page_ids_found} new job IDs on page with offset {offset} for '{stream.keyword}'."
+            )
+            if page_ids_found > 0:
+                self.scraper.save_job_cache(type='job_id')
+
+            if stream.new_ids >= stream.n_ids_to_fetch:
+                logger.info(
+                    f"Target of {stream.n_ids_to_fetch} new IDs met for '{stream.keyword}'. Stopping this stream."
+                )
+                stream.done = True
+                stream.stop_reason = 'target met'
+                break
+
+            if page_ids_found < self.low_yield_threshold * len(job_ids):
+                stream.low_yield_run += 1
+            else:
+                stream.low_yield_run = 0
+            if self.low_yield_pages and (
+                stream.low_yield_run >= self.low_yield_pages
+            ):
+                logger.info(
+                    f"{stream.low_yield_run} low-yield pages in a row for '{stream.keyword}' (work model {stream.work_model_id}). Stopping this stream."
+                )
+                stream.done = True
+                stream.stop_reason = 'low yield'
+
+        if stream.done:
+            # Discard the pages requested past the end of the stream.
+            stream.results.clear()
+
+    def crawl(self, streams: List[SearchStream]) -> List[SearchStream]:
+        """
+        Crawl the streams until each one ends, adding new IDs to the cache.
+
+        A stream ends at its first page without results, once it found
+        `n_ids_to_fetch` new IDs, or after its last allowed offset.
+
+        Args:
+            streams (List[SearchStream]): The searches to crawl.
+
+        Returns:
+            List[SearchStream]: The same streams, with their statistics.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='id-crawl'
+        )
+        in_flight: Dict[Future, Tuple[SearchStream, int, str]] = {}
+        try:
+            self._schedule(executor, in_flight, streams)
+            while in_flight:
+                completed, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    stream, offset, work_model_code = in_flight.pop(future)
+                    stream.in_flight -= 1
+                    try:
+                        job_ids = future.result()
+                    except Exception as e:
+                        logger.error(
+                            f"Error on job ID page at offset {offset} for '{stream.keyword}': {e}"
+                        )
+                        job_ids = None
+                    if not stream.done:
+                        stream.results[offset] = (work_model_code, job_ids)
+                        self._apply(stream)
+                self._schedule(executor, in_flight, streams)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.scraper.save_job_cache(type='job_id')
+
+        for stream in streams:
+            if stream.stop_reason is None:
+                stream.stop_reason = 'offset limit'
+            logger.info(
+                f"Stream '{stream.keyword}' (work model {stream.work_model_id}): "
+                f'{stream.pages} pages, {stream.new_ids} new IDs in {stream.elapsed:.1f}s '
+                f'({stream.pages_per_second:.2f} pages/s, {stream.ids_per_second:.2f} new IDs/s, '
+                f'{stream.pages_per_new_id:.2f} pages per new ID), '
+                f'stopped on {stream.stop_reason}.'
+            )
+        return streams
+
+
+def keyword_overlap_report(streams: List[SearchStream]) -> pd.DataFrame:
+    """
+    Summarize how much the search results of each keyword overlap.
+
+    Args:
+        streams (List[SearchStream]): Crawled streams. Streams of the same
+            keyword (one per work model) are combined.
+
+    Returns:
+        pd.DataFrame: One row per keyword with its 'pages', 'ids_seen' (all
+            the IDs its pages listed), 'new_ids', 'shared_ids' (also listed
+            for another keyword), 'overlap' (shared_ids / ids_seen),
+            'pages_per_new_id', and the keyword it shares most IDs with
+            ('closest_keyword', 'closest_shared'), most overlapping first.
+    """
+    pages: Dict[str, int] = defaultdict(int)
+    new_ids: Dict[str, int] = defaultdict(int)
+    seen: Dict[str, Set[str]] = defaultdict(set)
+    for stream in streams:
+        pages[stream.keyword] += stream.pages
+        new_ids[stream.keyword] += stream.new_ids
+        seen[stream.keyword] |= stream.seen_ids
+
+    keywords_by_id: Dict[str, List[str]] = defaultdict(list)
+    for keyword, job_ids in seen.items():
+        for job_id in job_ids:
+            keywords_by_id[job_id].append(keyword)
+
+    rows = []
+    for keyword, job_ids in seen.items():
+        shared_with: Dict[str, int] = defaultdict(int)
+        shared = 0
+        for job_id in job_ids:
+            others = [other for other in keywords_by_id[job_id] if other != keyword]
+            if others:
+                shared += 1
+            for other in others:
+                shared_with[other] += 1
+        closest = max(shared_with, key=shared_with.get, default=None)
+        rows.append(
+            {
+                'keyword': keyword,
+                'pages': pages[keyword],
+                'ids_seen': len(job_ids),
+                'new_ids': new_ids[keyword],
+                'shared_ids': shared,
+                'overlap': shared / len(job_ids) if job_ids else 0.0,
+                'pages_per_new_id': (
+                    pages[keyword] / new_ids[keyword]
+                    if new_ids[keyword]
+                    else float(pages[keyword])
+                ),
+                'closest_keyword': closest,
+                'closest_shared': shared_with[closest] if closest else 0,
+            }
+        )
+
+    report = pd.DataFrame(
+        rows,
+        columns=[
+            'keyword',
+            'pages',
+            'ids_seen',
+            'new_ids',
+            'shared_ids',
+            'overlap',
+            'pages_per_new_id',
+            'closest_keyword',
+            'closest_shared',
+        ],
+    )
+    return report.sort_values(
+        ['overlap', 'keyword'], ascending=[False, True], ignore_index=True
+    )
+
+
+def export_keyword_overlap(
+    streams: List[SearchStream], path: Path = KEYWORD_OVERLAP_PATH
+) -> pd.DataFrame:
+    """
+    Write the keyword overlap report of a crawl to a CSV file.
+
+    Args:
+        streams (List[SearchStream]): Crawled streams.
+        path (Path, optional): The output file.
+            Defaults to `KEYWORD_OVERLAP_PATH`.
+
+    Returns:
+        pd.DataFrame: The report that was written.
+    """
+    report = keyword_overlap_report(streams)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report.to_csv(path, index=False)
+    logger.info(
+        f"Saved keyword overlap of {len(report)} keywords to '{path}' "
+        f'({report["pages"].sum()} pages, {report["new_ids"].sum()} new IDs).'
+    )
+    return report
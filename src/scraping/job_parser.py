@@ -0,0 +1,408 @@
+import importlib.util
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+logger = logging.getLogger(__name__)
+
+# (tag, class) pairs of the single-valued fields of a job posting page.
+# A class matches like BeautifulSoup's `class_` filter: either one of the
+# element's classes or its whole class attribute.
+FIELD_SELECTORS: Dict[Tuple[str, str], str] = {
+    ('h2', 'top-card-layout__title'): 'job_title',
+    ('a', 'topcard__org-name-link'): 'company_name',
+    ('span', 'topcard__flavor topcard__flavor--bullet'): 'location',
+    ('span', 'posted-time-ago__text'): 'time_posted',
+    ('span', 'num-applicants__caption'): 'num_applicants',
+    ('div', 'show-more-less-html__markup'): 'job_description',
+}
+CRITERIA_ITEM = ('li', 'description__job-criteria-item')
+CRITERIA_LABEL = ('h3', 'description__job-criteria-subheader')
+CRITERIA_VALUE = ('span', 'description__job-criteria-text')
+# Result card of a search page; its job ID ends the 'data-entity-urn'.
+JOB_CARD = ('div', 'base-card')
+# Option of a search page filter; the work type options are labelled e.g.
+# 'Remote (1,234)'.
+FILTER_VALUE = ('div', 'filter-values-container__filter-value')
+WORK_MODEL_LABELS = {'On-site': 1, 'Remote': 2, 'Hybrid': 3}
+
+JOB_FIELDS = [
+    'job_title',
+    'company_name',
+    'location',
+    'time_posted',
+    'num_applicants',
+    'xp_level',
+    'job_type',
+    'job_sectors',
+    'job_description',
+]
+
+# Elements whose content isn't page text; BeautifulSoup's text leaves it out.
+NON_TEXT_TAGS = frozenset({'script', 'style', 'template'})
+
+BACKENDS = ['selectolax', 'lxml', 'bs4']
+_BACKEND_MODULES = {'selectolax': 'selectolax', 'lxml': 'lxml', 'bs4': 'bs4'}
+
+
+def available_backends() -> List[str]:
+    """
+    List the HTML parsing backends installed in the current environment.
+
+    Returns:
+        List[str]: Available backend names, fastest first.
+    """
+    return [
+        name
+        for name in BACKENDS
+        if importlib.util.find_spec(_BACKEND_MODULES[name]) is not None
+    ]
+
+
+def resolve_backend(backend: str = 'auto') -> str:
+    """
+    Resolve a requested backend name to one that can actually be used.
+
+    Args:
+        backend (str, optional): 'auto', 'selectolax', 'lxml' or 'bs4'.
+            'auto' picks the fastest installed backend. Defaults to 'auto'.
+
+    Returns:
+        str: The backend to use. Falls back to 'bs4' if the requested one is
+            not installed.
+
+    Raises:
+        ValueError: If `backend` is not a known backend name.
+    """
+    if backend != 'auto' and backend not in BACKENDS:
+        raise ValueError(
+            f"Invalid HTML parser backend '{backend}'. Choose from 'auto', {', '.join(repr(b) for b in BACKENDS)}."
+        )
+
+    installed = available_backends()
+    if backend == 'auto':
+        return installed[0]
+    if backend not in installed:
+        logger.warning(
+            f"HTML parser backend '{backend}' is not installed. Falling back to 'bs4'."
+        )
+        return 'bs4'
+    return backend
+
+
+def _class_matches(class_attr: Optional[str], target: str) -> bool:
+    """Check a class attribute the way BeautifulSoup's `class_` filter does."""
+    if not class_attr:
+        return False
+    classes = class_attr.split()
+    return target in classes or ' '.join(classes) == target
+
+
+def _field_for(tag: str, class_attr: Optional[str]) -> Optional[str]:
+    """Return the job field an element holds, if any."""
+    if not class_attr:
+        return None
+    classes = class_attr.split()
+    field = FIELD_SELECTORS.get((tag, ' '.join(classes)))
+    if field:
+        return field
+    for class_name in classes:
+        field = FIELD_SELECTORS.get((tag, class_name))
+        if field:
+            return field
+    return None
+
+
+def _parse_lxml(html: str) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """Walk the document once with lxml, collecting fields and criteria."""
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    def strings_of(element) -> Iterator[str]:
+        if element.text and element.tag not in NON_TEXT_TAGS:
+            yield element.text
+        for child in element:
+            # Comments and processing instructions have no string tag.
+            if isinstance(child.tag, str):
+                yield from strings_of(child)
+            if child.tail:
+                yield child.tail
+
+    def text_of(element) -> str:
+        return ''.join(strings_of(element)).strip()
+
+    def first_descendant(element, selector):
+        tag, class_name = selector
+        for child in element.iterdescendants(tag):
+            if _class_matches(child.get('class'), class_name):
+                return child
+        return None
+
+    fields: Dict[str, Any] = {}
+    criteria: List[Tuple[str, str]] = []
+    root = lxml_html.document_fromstring(html)
+
+    for element in root.iter(etree.Element):
+        class_attr = element.get('class')
+        if not class_attr:
+            continue
+
+        if element.tag == CRITERIA_ITEM[0] and _class_matches(
+            class_attr, CRITERIA_ITEM[1]
+        ):
+            label = first_descendant(element, CRITERIA_LABEL)
+            value = first_descendant(element, CRITERIA_VALUE)
+            if label is not None and value is not None:
+                criteria.append((text_of(label), text_of(value)))
+            continue
+
+        field = _field_for(element.tag, class_attr)
+        if field and field not in fields:
+            if field == 'job_description':
+                strings = (text.strip() for text in strings_of(element))
+                fields[field] = '\n'.join(text for text in strings if text)
+            else:
+                fields[field] = text_of(element)
+
+    return fields, criteria
+
+
+def _parse_selectolax(
+    html: str,
+) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """Walk the document once with selectolax, collecting fields and criteria."""
+    from selectolax.lexbor import LexborHTMLParser
+
+    def strings_of(node) -> List[str]:
+        return [
+            child.text_content or ''
+            for child in node.traverse(include_text=True)
+            if child.tag == '-text' and child.parent.tag not in NON_TEXT_TAGS
+        ]
+
+    def first_descendant(node, selector):
+        tag, class_name = selector
+        for child in node.traverse():
+            if child is not node and child.tag == tag:
+                if _class_matches(child.attributes.get('class'), class_name):
+                    return child
+        return None
+
+    fields: Dict[str, Any] = {}
+    criteria: List[Tuple[str, str]] = []
+    tree = LexborHTMLParser(html)
+
+    for node in tree.root.traverse():
+        class_attr = node.attributes.get('class')
+        if not class_attr:
+            continue
+
+        if node.tag == CRITERIA_ITEM[0] and _class_matches(
+            class_attr, CRITERIA_ITEM[1]
+        ):
+            label = first_descendant(node, CRITERIA_LABEL)
+            value = first_descendant(node, CRITERIA_VALUE)
+            if label is not None and value is not None:
+                criteria.append(
+                    (
+                        ''.join(strings_of(label)).strip(),
+                        ''.join(strings_of(value)).strip(),
+                    )
+                )
+            continue
+
+        field = _field_for(node.tag, class_attr)
+        if field and field not in fields:
+            if field == 'job_description':
+                strings = (text.strip() for text in strings_of(node))
+                fields[field] = '\n'.join(text for text in strings if text)
+            else:
+                fields[field] = ''.join(strings_of(node)).strip()
+
+    return fields, criteria
+
+
+def _parse_bs4(html: str) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """Walk the document once with BeautifulSoup, collecting fields and criteria."""
+    fields: Dict[str, Any] = {}
+    criteria: List[Tuple[str, str]] = []
+    soup = BeautifulSoup(html, 'html.parser')
+
+    for element in soup.descendants:
+        if not isinstance(element, Tag):
+            continue
+        class_list = element.get('class')
+        if not class_list:
+            continue
+        class_attr = ' '.join(class_list)
+
+        if element.name == CRITERIA_ITEM[0] and _class_matches(
+            class_attr, CRITERIA_ITEM[1]
+        ):
+            label = element.find(CRITERIA_LABEL[0], class_=CRITERIA_LABEL[1])
+            value = element.find(CRITERIA_VALUE[0], class_=CRITERIA_VALUE[1])
+            if label is not None and value is not None:
+                criteria.append((label.text.strip(), value.text.strip()))
+            continue
+
+        field = _field_for(element.name, class_attr)
+        if field and field not in fields:
+            if field == 'job_description':
+                fields[field] = element.get_text(separator='\n', strip=True)
+            else:
+                fields[field] = element.text.strip()
+
+    return fields, criteria
+
+
+_PARSERS = {
+    'selectolax': _parse_selectolax,
+    'lxml': _parse_lxml,
+    'bs4': _parse_bs4,
+}
+
+
+def parse_job_posting(html: str, backend: str = 'bs4') -> Dict[str, Any]:
+    """
+    Extract every field of a LinkedIn job posting page in a single pass.
+
+    The page is parsed once and its elements are walked once; each element
+    is matched against all the selectors of interest at the same time.
+
+    Args:
+        html (str): The raw HTML of a `jobs-guest/jobs/api/jobPosting` page.
+        backend (str, optional): A backend name as returned by
+            `resolve_backend`. Defaults to 'bs4'.
+
+    Returns:
+        Dict[str, Any]: The job fields listed in `JOB_FIELDS`. Fields missing
+            from the page are None.
+    """
+    fields, criteria = _PARSERS[backend](html)
+
+    # Criteria are keyed by label, so a repeated label keeps its first
+    # position but its last value.
+    job_criteria = dict(criteria)
+    criteria_values = list(job_criteria.values())
+
+    job_post = {field: fields.get(field) for field in JOB_FIELDS}
+    job_post['xp_level'] = (
+        criteria_values[0] if len(criteria_values) > 0 else None
+    )
+    job_post['job_type'] = (
+        criteria_values[1] if len(criteria_values) > 1 else None
+    )
+    job_post['job_sectors'] = (
+        criteria_values[3] if len(criteria_values) > 3 else None
+    )
+    return job_post
+
+
+def parse_job_ids(html: str, backend: str = 'bs4') -> List[str]:
+    """
+    Extract the job IDs of the result cards of a search results page.
+
+    Args:
+        html (str): The raw HTML of a
+            `jobs-guest/jobs/api/seeMoreJobPostings/search` page.
+        backend (str, optional): A backend name as returned by
+            `resolve_backend`. Defaults to 'bs4'.
+
+    Returns:
+        List[str]: The job ID of every card, in page order. Cards without
+            an ID give an empty string; an empty list means the page had no
+            results.
+    """
+    if not html.strip():
+        return []
+
+    tag, class_name = JOB_CARD
+    if backend == 'selectolax':
+        from selectolax.lexbor import LexborHTMLParser
+
+        urns = [
+            node.attributes.get('data-entity-urn')
+            for node in LexborHTMLParser(html).root.traverse()
+            if node.tag == tag
+            and _class_matches(node.attributes.get('class'), class_name)
+        ]
+    elif backend == 'lxml':
+        from lxml import html as lxml_html
+
+        urns = [
+            element.get('data-entity-urn')
+            for element in lxml_html.document_fromstring(html).iter(tag)
+            if _class_matches(element.get('class'), class_name)
+        ]
+    else:
+        urns = [
+            card.get('data-entity-urn')
+            for card in BeautifulSoup(html, 'html.parser').find_all(
+                tag, class_=class_name
+            )
+        ]
+    return [(urn or '').split(':')[-1] for urn in urns]
+
+
+def parse_work_model_counts(html: str, backend: str = 'bs4') -> Dict[int, int]:
+    """
+    Extract the number of results per work model from a search page.
+
+    Only the filter options are looked at; with 'bs4' only they are parsed.
+
+    Args:
+        html (str): The raw HTML of a `jobs/search` page.
+        backend (str, optional): A backend name as returned by
+            `resolve_backend`. Defaults to 'bs4'.
+
+    Returns:
+        Dict[int, int]: Work model IDs (1: On-site, 2: Remote, 3: Hybrid)
+            mapped to their job counts. Work models without a filter option
+            are missing.
+
+    Raises:
+        ValueError: If a work model label has no readable count.
+    """
+    tag, class_name = FILTER_VALUE
+    if not html.strip():
+        labels: List[str] = []
+    elif backend == 'selectolax':
+        from selectolax.lexbor import LexborHTMLParser
+
+        labels = [
+            label.text(strip=True)
+            for node in LexborHTMLParser(html).root.traverse()
+            if node.tag == tag
+            and _class_matches(node.attributes.get('class'), class_name)
+            for label in node.css('label')[:1]
+        ]
+    elif backend == 'lxml':
+        from lxml import html as lxml_html
+
+        labels = []
+        for element in lxml_html.document_fromstring(html).iter(tag):
+            if _class_matches(element.get('class'), class_name):
+                label = next(element.iter('label'), None)
+                if label is not None:
+                    labels.append(''.join(label.itertext()).strip())
+    else:
+        soup = BeautifulSoup(
+            html, 'html.parser', parse_only=SoupStrainer(tag, class_=class_name)
+        )
+        labels = [
+            label.get_text(strip=True)
+            for label in (div.find('label') for div in soup.find_all(tag))
+            if label
+        ]
+
+    counts: Dict[int, int] = {}
+    for text in labels:
+        for name, work_model_id in WORK_MODEL_LABELS.items():
+            if name in text:
+                count = text.split('(')[-1].split(')')[0]
+                counts[work_model_id] = int(
+                    count.replace(',', '').replace('.', '')
+                )
+                break
+    return counts
@@ -1,17 +1,55 @@
 import logging
-import pickle
 import random
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import quote
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
-from config.scraping import USER_AGENTS, WORK_MODEL
+from config.scraping import (
+    CACHE_BACKEND,
+    HTML_PARSER_BACKEND,
+    HTTP_ARCHIVE_PATH,
+    HTTP2,
+    HTTP_CLIENT,
+    HTTP_MODE,
+    JOB_AMOUNT_TTL,
+    LINKEDIN_BASE_URL,
+    MAX_WORKERS,
+    POOL_CONNECTIONS,
+    RATE_LIMIT_BURST,
+    REQUEST_TIMEOUT,
+    REQUESTS_PER_SECOND,
+    USER_AGENTS,
+)
+from config.storage import DEDUP_COLUMNS, FINGERPRINT_COLUMN, STORAGE_FORMAT
+
+from ..utils.fingerprint import posting_fingerprint
+from ..utils.metrics import metrics
+from ..utils.storage import JobDataset
+from .cache_store import CacheStore, open_cache_store
+from .http_archive import HTTP_MODES, ArchiveSession, HttpArchive
+from .id_crawler import IdCrawler, SearchStream
+from .job_parser import (
+    parse_job_posting,
+    parse_work_model_counts,
+    resolve_backend,
+)
+from .rate_limiter import RateLimiter
+from .retry_controller import RETRYABLE_STATUSES, RetryController
+from .transport import (
+    ACCEPT_ENCODING,
+    HttpxSession,
+    TransportStats,
+    connections_opened,
+    mount_adapter,
+    resolve_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,50 +60,118 @@ class JobScraper:
 
     This class handles fetching job IDs, retrieving detailed job information,
     caching results to avoid redundant requests, and saving data progressively
-    to CSV files. It incorporates retry mechanisms and random user-agent
-    rotation to improve scraping robustness.
+    to the raw jobs dataset (Parquet or CSV). It incorporates retry mechanisms
+    and random user-agent rotation to improve scraping robustness. Job details can be fetched by a
+    bounded pool of worker threads that share a per-host rate limiter.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        requests_per_second: float = REQUESTS_PER_SECOND,
+        base_url: str = LINKEDIN_BASE_URL,
+        cache_backend: str = CACHE_BACKEND,
+        html_parser: str = HTML_PARSER_BACKEND,
+        http_mode: str = HTTP_MODE,
+        archive_path: Path = HTTP_ARCHIVE_PATH,
+        storage_format: str = STORAGE_FORMAT,
+        http_client: str = HTTP_CLIENT,
+        http2: bool = HTTP2,
+        pool_maxsize: Optional[int] = None,
+    ):
         """
         Initialize the JobScraper instance.
 
-        Sets up a requests session, defines cache file paths, loads existing
-        caches (for job data and job IDs), and sets the scrape date.
+        Sets up a requests session, opens the caches (for job data and job
+        IDs) with the chosen backend, and sets the scrape date. Cache entries
+        are read lazily, not loaded up front.
+
+        Args:
+            max_workers (int, optional): Maximum number of job pages fetched
+                concurrently. 1 fetches serially. Defaults to `MAX_WORKERS`.
+            requests_per_second (float, optional): Sustained request rate
+                shared by all workers. Defaults to `REQUESTS_PER_SECOND`.
+            base_url (str, optional): Scheme and host every request is sent
+                to, e.g. a local stand-in server for testing.
+                Defaults to `LINKEDIN_BASE_URL`.
+            cache_backend (str, optional): Cache storage backend, 'sqlite'
+                or 'pickle'. Defaults to `CACHE_BACKEND`.
+            html_parser (str, optional): HTML parser backend for job pages,
+                'auto', 'selectolax', 'lxml' or 'bs4'.
+                Defaults to `HTML_PARSER_BACKEND`.
+            http_mode (str, optional): 'live' sends requests normally,
+                'record' also stores responses in the HTTP archive and
+                'replay' serves them from it without network access.
+                Defaults to `HTTP_MODE`.
+            archive_path (Path, optional): HTTP archive used by the 'record'
+                and 'replay' modes. Defaults to `HTTP_ARCHIVE_PATH`.
+            storage_format (str, optional): Format of the raw jobs dataset
+                written by checkpoints, 'parquet' or 'csv'.
+                Defaults to `STORAGE_FORMAT`.
+            http_client (str, optional): HTTP client of the 'live' mode,
+                'requests' or 'httpx' (falls back to 'requests' if not
+                installed). Defaults to `HTTP_CLIENT`.
+            http2 (bool, optional): Use HTTP/2 when the server supports it
+                (needs 'httpx' and `h2`). Defaults to `HTTP2`.
+            pool_maxsize (Optional[int], optional): Connections kept alive
+                per host. Defaults to `max_workers`, so every worker reuses
+                its own connection.
+
+        Raises:
+            ValueError: If `http_mode`, `http_client` or `storage_format` is
+                not supported.
         """
-        self.session = requests.Session()
-        self.scrape_date: str = datetime.today().strftime('%d-%m-%Y %H:%M:%S')
+        if http_mode not in HTTP_MODES:
+            raise ValueError(
+                f"Invalid 'http_mode'. Choose from {', '.join(repr(m) for m in HTTP_MODES)}."
+            )
 
-        self.job_data_cache_file: Path = Path('data/cache/job_data_cache.pkl')
-        self.job_data_cache_file.parent.mkdir(parents=True, exist_ok=True)
-        self.job_data_cache: Dict[str, Dict[str, Any]] = self.load_job_cache(
-            type='job_data'
+        self.max_workers: int = max(1, max_workers)
+        self.base_url: str = base_url.rstrip('/')
+        self.html_parser: str = resolve_backend(html_parser)
+        self.rate_limiter = RateLimiter(
+            rate=requests_per_second, burst=RATE_LIMIT_BURST
         )
+        self.retry_controller = RetryController(self.rate_limiter)
+
+        self.http_mode: str = http_mode
+        self.http_client: str = resolve_client(http_client, http2)
+        pool_maxsize = max(pool_maxsize or self.max_workers, 1)
+        if http_mode != 'live':
+            self.session = ArchiveSession(
+                HttpArchive(archive_path), mode=http_mode
+            )
+            self.http_client = 'requests'
+        elif self.http_client == 'httpx':
+            self.session = HttpxSession(pool_maxsize, http2=http2)
+        else:
+            self.session = requests.Session()
+        if isinstance(self.session, requests.Session):
+            mount_adapter(self.session, POOL_CONNECTIONS, pool_maxsize)
+        self.transport_stats = TransportStats()
+        self._header_sets: List[Dict[str, str]] = [
+            self._build_headers(user_agent) for user_agent in USER_AGENTS
+        ]
+        self.scrape_date: str = datetime.today().strftime('%d-%m-%Y %H:%M:%S')
 
-        self.job_ids_cache_file: Path = Path('data/cache/job_ids_cache.pkl')
-        self.job_ids_cache_file.parent.mkdir(parents=True, exist_ok=True)
-        self.job_ids_cache: Dict[str, Dict[str, str]] = self.load_job_cache(
-            type='job_id'
+        self.cache_backend: str = cache_backend
+        self.job_data_cache: CacheStore = self.load_job_cache(type='job_data')
+        self.job_ids_cache: CacheStore = self.load_job_cache(type='job_id')
+        self.job_amount_cache: CacheStore = self.load_job_cache(
+            type='job_amount'
         )
 
+        self.job_dataset = JobDataset(storage_format=storage_format)
         self.checkpoint_frequency: int = 5
 
-    def get_random_headers(self) -> Dict[str, str]:
-        """
-        Generate a dictionary of HTTP headers with a randomly selected User-Agent.
-
-        These headers are designed to mimic a real browser request to reduce
-        the chances of being blocked.
-
-        Returns:
-            Dict[str, str]: A dictionary containing HTTP headers.
-        """
-        user_agent = random.choice(USER_AGENTS)
+    @staticmethod
+    def _build_headers(user_agent: str) -> Dict[str, str]:
+        """Build the browser-like request headers of one User-Agent."""
         return {
             'User-Agent': user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -77,59 +183,106 @@ class JobScraper:
             'Referer': 'https://www.linkedin.com/jobs/',
         }
 
-    def load_job_cache(self, type: str = 'job_data') -> Dict[Any, Any]:
+    def get_random_headers(self) -> Dict[str, str]:
         """
-        Load a specified cache (either job data or job IDs) from a pickle file.
+        Pick the HTTP headers of a randomly selected User-Agent.
+
+        These headers are designed to mimic a real browser request to reduce
+        the chances of being blocked. They are built once per User-Agent and
+        shared, so callers must not modify them. Only the content codings
+        the client can decode are accepted.
+
+        Returns:
+            Dict[str, str]: A dictionary containing HTTP headers.
+        """
+        return random.choice(self._header_sets)
+
+    def load_job_cache(self, type: str = 'job_data') -> CacheStore:
+        """
+        Open a specified cache (job data, job IDs or job amounts) with the
+        configured backend.
 
         Args:
             type (str, optional): The type of cache to load.
-                Can be 'job_data' or 'job_id'. Defaults to 'job_data'.
+                Can be 'job_data', 'job_id' or 'job_amount'.
+                Defaults to 'job_data'.
 
         Returns:
-            Dict[Any, Any]: The loaded cache dictionary. Returns an empty
-                dictionary if the cache file doesn't exist or an error occurs
-                during loading.
+            CacheStore: A dictionary-like cache store. Entries are read on
+                demand; an empty store is returned if opening the cache fails.
         """
-        cache_file = self.job_data_cache_file
-        if type == 'job_id':
-            cache_file = self.job_ids_cache_file
-
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'rb') as f:
-                    loaded_cache = pickle.load(f)
-                    logger.info(
-                        f'Successfully loaded {type} cache with {len(loaded_cache)} entries from {cache_file}'
-                    )
-                    return loaded_cache
-            except Exception as e:
-                logger.error(
-                    f'Failed to load {type} cache from {cache_file}: {e}'
-                )
-        return {}
+        try:
+            cache = open_cache_store(type, backend=self.cache_backend)
+            logger.info(
+                f'Opened {type} cache with the {self.cache_backend} backend.'
+            )
+            return cache
+        except Exception as e:
+            logger.error(f'Failed to open {type} cache: {e}')
+            return open_cache_store(type, backend='pickle')
 
     def save_job_cache(self, type: str = 'job_data') -> None:
         """
-        Save the specified cache (job data or job IDs) to a pickle file.
+        Persist the new or changed entries of the specified cache (job data,
+        job IDs or job amounts).
 
         Args:
             type (str, optional): The type of cache to save.
-                Can be 'job_data' or 'job_id'. Defaults to 'job_data'.
+                Can be 'job_data', 'job_id' or 'job_amount'.
+                Defaults to 'job_data'.
         """
-        cache_file = self.job_data_cache_file
         job_cache = self.job_data_cache
         if type == 'job_id':
-            cache_file = self.job_ids_cache_file
             job_cache = self.job_ids_cache
+        elif type == 'job_amount':
+            job_cache = self.job_amount_cache
 
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(job_cache, f)
+            with metrics.timer('scraper.cache_save') as timer:
+                written = job_cache.flush()
+                timer.add_records(written or 0)
+            if written:
+                logger.info(
+                    f'{type.capitalize()} cache saved with {written} new or changed entries.'
+                )
+        except Exception as e:
+            logger.error(f'Failed to save {type} cache: {e}')
+
+    def close(self) -> None:
+        """
+        Flush and close the caches, the dataset index and the HTTP session,
+        logging the transport statistics.
+        """
+        self.log_transport_stats()
+        self.job_data_cache.close()
+        self.job_ids_cache.close()
+        self.job_amount_cache.close()
+        self.job_dataset.close()
+        self.session.close()
+
+    def log_transport_stats(self) -> Dict[str, Any]:
+        """
+        Log the latency and size statistics of the requests sent so far.
+
+        Returns:
+            Dict[str, Any]: The `TransportStats.summary`, plus the number of
+                'connections' opened (requests client only) and the
+                `RetryController.summary` under 'retry'.
+        """
+        summary = self.transport_stats.summary()
+        summary['connections'] = connections_opened(self.session)
+        summary['retry'] = self.retry_controller.summary(self.base_url)
+        if summary['requests']:
+            retry = summary['retry']
             logger.info(
-                f'{type.capitalize()} cache saved with {len(job_cache)} entries to {cache_file}'
+                f"HTTP ({self.http_client}): {summary['requests']} requests over "
+                f"{summary['connections'] or 'n/a'} connections, {summary['errors']} errors, "
+                f"latency mean {summary['latency_mean']:.3f}s / p95 {summary['latency_p95']:.3f}s, "
+                f"{summary['wire_bytes'] / 2**20:.1f} MiB received ({summary['body_bytes'] / 2**20:.1f} MiB decoded). "
+                f"{retry['retries']} retries, {retry['throttled']} throttled, request rate "
+                f"{retry['current_rate']:.2f}/s (lowest {retry['lowest_rate']:.2f}/s)."
             )
-        except Exception as e:
-            logger.error(f'Failed to save {type} cache to {cache_file}: {e}')
+        return summary
 
     def format_keyword(self, keyword: str) -> str:
         r"""
@@ -145,6 +298,7 @@ class JobScraper:
         """
         return f'"{quote(str(keyword))}"'
 
+    @metrics.timed('scraper.fetch')
     def fetch_with_smart_retry(
         self, url: str, max_retries: int = 5
     ) -> Optional[requests.Response]:
@@ -152,8 +306,12 @@ class JobScraper:
         Fetch a URL with a retry strategy that includes exponential backoff
         and header rotation.
 
-        Handles common HTTP errors like 429 (Too Many Requests) by waiting
-        before retrying.
+        Retries are driven by the shared `self.retry_controller`: a 429
+        lowers the request rate of every worker (which recovers gradually
+        afterwards) and, like a 503, pauses the host for its Retry-After
+        time or a jittered backoff. Other server errors, timeouts and
+        connection errors are retried after a jittered backoff of the
+        failing worker only. Other statuses (e.g. 404) are not retried.
 
         Args:
             url (str): The URL to fetch.
@@ -167,6 +325,7 @@ class JobScraper:
         current_headers = self.get_random_headers()
 
         for attempt in range(max_retries):
+            is_last = attempt == max_retries - 1
             try:
                 logger.info(
                     f'Request attempt {attempt + 1}/{max_retries} for {url}'
@@ -176,92 +335,160 @@ class JobScraper:
                     current_headers = self.get_random_headers()
                     logger.info(f'Rotated headers for retry {attempt + 1}')
 
-                response = self.session.get(
-                    url, headers=current_headers, timeout=10
-                )
-
-                if response.status_code == 200:
-                    return response
-                elif response.status_code == 429:
-                    wait_time = min(30, (2**attempt) + random.uniform(1, 3))
-                    logger.warning(
-                        f'Rate limited (429) on attempt {attempt + 1}. Waiting {wait_time:.2f}s before retry...'
-                    )
-                    time.sleep(wait_time)
-                else:
-                    logger.warning(
-                        f'Unexpected status code {response.status_code} for {url} on attempt {attempt + 1}.'
+                self.rate_limiter.acquire(url)
+                start = time.perf_counter()
+                try:
+                    response = self.session.get(
+                        url, headers=current_headers, timeout=REQUEST_TIMEOUT
                     )
-                    response.raise_for_status()
-                    return None
+                except requests.exceptions.RequestException:
+                    self.transport_stats.record(time.perf_counter() - start)
+                    metrics.count('scraper.request_errors')
+                    raise
+                latency = time.perf_counter() - start
+                self.transport_stats.record(latency, response)
+                metrics.observe('scraper.request_seconds', latency)
             except requests.exceptions.RequestException as e:
                 logger.error(
                     f'Request failed for {url} on attempt {attempt + 1}: {e}'
                 )
-                if attempt < max_retries - 1:
-                    pass
-                else:
+                if is_last:
                     logger.error(
                         f'All {max_retries} retries failed for {url}. Last error: {e}'
                     )
                     return None
+                self.retry_controller.on_error(url, attempt)
+                continue
+
+            if response.status_code == 200:
+                self.retry_controller.on_success(url)
+                return response
+
+            if response.status_code not in RETRYABLE_STATUSES:
+                logger.warning(
+                    f'Unexpected status code {response.status_code} for {url} on attempt {attempt + 1}. Not retrying.'
+                )
+                return None
+
+            if is_last:
+                # No retry left: don't pause the host for nothing.
+                self.retry_controller.on_throttled(
+                    url, attempt, response.status_code, retry=False
+                )
+                break
+            wait_time = self.retry_controller.on_throttled(
+                url,
+                attempt,
+                response.status_code,
+                response.headers.get('Retry-After'),
+            )
+            logger.warning(
+                f'Status {response.status_code} on attempt {attempt + 1} for {url}. Retrying in {wait_time:.2f}s '
+                f'(request rate {self.retry_controller.rate(url):.2f}/s)...'
+            )
 
         logger.error(f'All {max_retries} retries failed for {url}')
         return None
 
-    def get_job_amount(self, keywords: List[str]) -> Dict[str, Dict[int, int]]:
+    def get_job_amount(
+        self, keywords: List[str], max_age: float = JOB_AMOUNT_TTL
+    ) -> Dict[str, Dict[int, int]]:
         """
         Fetch the approximate number of job postings on LinkedIn for given
         keywords, categorized by work model (On-site, Remote, Hybrid).
 
-        Note: This method makes direct requests without the smart retry or session
-        headers. It might be less robust for extensive use. The parsing logic
-        is specific to LinkedIn's filter structure at the time of writing.
+        Search pages are fetched concurrently (up to `max_workers`) through
+        the pooled session, shared rate limiter and `fetch_with_smart_retry`.
+        Counts are kept in `self.job_amount_cache` and reused for `max_age`
+        seconds. A keyword whose page can't be fetched or read gets an empty
+        result; its cache entry records the error and is retried next time.
+        The parsing logic is specific to LinkedIn's filter structure at the
+        time of writing.
 
         Args:
             keywords (List[str]): A list of keywords to search for.
+            max_age (float, optional): Seconds a cached count stays valid;
+                0 always fetches. Defaults to `JOB_AMOUNT_TTL`.
 
         Returns:
             Dict[str, Dict[int, int]]: A dictionary where keys are the input
                 keywords and values are dictionaries mapping work model IDs
                 (1: On-site, 2: Remote, 3: Hybrid) to their respective job counts.
         """
+        now = time.time()
         work_type_counts: Dict[str, Dict[int, int]] = {}
-
+        to_fetch = []
         for keyword_raw in keywords:
-            keyword_formatted = self.format_keyword(keyword_raw)
-            url = f'https://www.linkedin.com/jobs/search?keywords={keyword_formatted}&location=Brasil&geoId=106057199'
-            logger.info(
-                f"Fetching job amounts for keyword: '{keyword_raw}' from URL: {url}"
-            )
+            entry = self.job_amount_cache.get(keyword_raw)
+            if (
+                entry
+                and entry.get('error') is None
+                and now - entry['fetched_at'] < max_age
+            ):
+                work_type_counts[keyword_raw] = {
+                    int(work_model_id): count
+                    for work_model_id, count in entry['counts'].items()
+                }
+            elif keyword_raw not in to_fetch:
+                to_fetch.append(keyword_raw)
 
-            response = requests.get(url)
-            list_soup = BeautifulSoup(response.text, 'html.parser')
-            work_type_filters = list_soup.find_all(
-                'div', class_='filter-values-container__filter-value'
-            )
+        logger.info(
+            f'Job amounts: {len(work_type_counts)} keywords cached, fetching {len(to_fetch)}.'
+        )
+        if to_fetch:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(to_fetch)),
+                thread_name_prefix='job-amount',
+            ) as executor:
+                results = list(executor.map(self.fetch_job_amount, to_fetch))
+
+            for keyword_raw, (counts, error) in zip(to_fetch, results):
+                self.job_amount_cache[keyword_raw] = {
+                    'counts': {
+                        str(work_model_id): count
+                        for work_model_id, count in counts.items()
+                    },
+                    'fetched_at': now,
+                    'error': error,
+                }
+                work_type_counts[keyword_raw] = counts
+            self.save_job_cache(type='job_amount')
 
-            keyword_counts: Dict[int, int] = {}
+        return {
+            keyword_raw: work_type_counts[keyword_raw]
+            for keyword_raw in keywords
+        }
 
-            for filter_div in work_type_filters:
-                label = filter_div.find('label')
-                if label:
-                    text = label.get_text(strip=True)
-                    if 'On-site' in text:
-                        keyword_counts[1] = int(
-                            text.split('(')[-1].split(')')[0].replace(',', '')
-                        )
-                    elif 'Remote' in text:
-                        keyword_counts[2] = int(
-                            text.split('(')[-1].split(')')[0].replace(',', '')
-                        )
-                    elif 'Hybrid' in text:
-                        keyword_counts[3] = int(
-                            text.split('(')[-1].split(')')[0].replace(',', '')
-                        )
+    def fetch_job_amount(
+        self, keyword_raw: str
+    ) -> Tuple[Dict[int, int], Optional[str]]:
+        """
+        Fetch and parse the job counts per work model of a single keyword.
 
-            work_type_counts[keyword_raw] = keyword_counts
-        return work_type_counts
+        Args:
+            keyword_raw (str): The keyword to search for.
+
+        Returns:
+            Tuple[Dict[int, int], Optional[str]]: The counts per work model
+                ID and None, or an empty dictionary and the error message.
+        """
+        keyword_formatted = self.format_keyword(keyword_raw)
+        url = f'{self.base_url}/jobs/search?keywords={keyword_formatted}&location=Brasil&geoId=106057199'
+        logger.info(
+            f"Fetching job amounts for keyword: '{keyword_raw}' from URL: {url}"
+        )
+
+        try:
+            response = self.fetch_with_smart_retry(url)
+            if not response:
+                raise ValueError('search page could not be fetched')
+            counts = parse_work_model_counts(response.text, self.html_parser)
+            if not counts:
+                raise ValueError('no work model filter found on the page')
+            return counts, None
+        except Exception as e:
+            logger.error(f"Failed to get job amounts for '{keyword_raw}': {e}")
+            return {}, str(e)
 
     def get_job_ids(
         self,
@@ -274,7 +501,7 @@ class JobScraper:
 
         Iterates through paginated search results, extracts job IDs, and stores
         them in `self.job_ids_cache` along with their work model and keyword.
-        Saves the cache periodically.
+        Saves the cache periodically. A single-stream `crawl_job_ids`.
 
         Args:
             n_ids_to_fetch (int): The target number of job IDs to try and fetch.
@@ -288,161 +515,187 @@ class JobScraper:
         Raises:
             ValueError: If `work_model_id` is not one of the allowed values.
         """
-        keyword_formatted = self.format_keyword(keyword_raw)
         logger.info(
             f"Initializing scraping for up to {n_ids_to_fetch} job IDs for keyword '{keyword_raw}' (work model: {work_model_id})."
         )
-
-        if work_model_id not in ['1', '2', '3', 'random']:
-            raise ValueError(
-                "Invalid 'work_model_id'. Choose from '1' (On-site), '2' (Remote), "
-                "'3' (Hybrid), or 'random'."
-            )
-
-        new_ids_scraped_count = 0
+        stream = SearchStream(keyword_raw, work_model_id, n_ids_to_fetch)
 
         try:
-            for start_offset in range(0, n_ids_to_fetch, 10):
-                if new_ids_scraped_count >= n_ids_to_fetch:
-                    logger.info(
-                        f'Target of {n_ids_to_fetch} new IDs likely met or exceeded. Stopping ID fetch for this run.'
-                    )
-                    break
-
-                current_work_model_code = (
-                    random.choice(list(WORK_MODEL.keys()))
-                    if work_model_id == 'random'
-                    else work_model_id
-                )
-
-                list_url = (
-                    f'https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?'
-                    f'keywords={keyword_formatted}&location=Brasil&geoId=106057199'
-                    f'&f_WT={current_work_model_code}&start={start_offset}'
-                )
-
-                logger.debug(f'Fetching job ID page: {list_url}')
-                response = self.fetch_with_smart_retry(list_url)
-
-                if not response:
-                    logger.warning(
-                        f"Failed to fetch job ID page at offset {start_offset} for keyword '{keyword_raw}', skipping..."
-                    )
-                    continue
-
-                list_soup = BeautifulSoup(response.text, 'html.parser')
-                job_cards = list_soup.find_all('div', class_='base-card')
-
-                if not job_cards:
-                    logger.info(
-                        f"No job cards found on page with offset {start_offset} for '{keyword_raw}'. May indicate end of results."
-                    )
-                    break
-
-                page_ids_found = 0
-                for card in job_cards:
-                    job_id = card.get('data-entity-urn', '').split(':')[-1]
-                    if job_id and job_id not in self.job_ids_cache:
-                        self.job_ids_cache[job_id] = {
-                            'work_model': WORK_MODEL.get(
-                                current_work_model_code, 'Unknown'
-                            ),
-                            'keyword': keyword_raw,
-                        }
-                        new_ids_scraped_count += 1
-                        page_ids_found += 1
-
-                logger.info(
-                    f'Found {page_ids_found} new job IDs on page with offset {start_offset}.'
-                )
-
-                if page_ids_found > 0:
-                    self.save_job_cache(type='job_id')
-
+            self.crawl_job_ids([stream])
             logger.success(
                 f"Finished scraping for keyword '{keyword_raw}'. "
-                f'Added {new_ids_scraped_count} new job IDs. '
+                f'Added {stream.new_ids} new job IDs. '
                 f'Total unique job IDs in cache: {len(self.job_ids_cache)}.'
             )
-
         except Exception as e:
             logger.error(
                 f"Unexpected error during 'get_job_ids' for keyword '{keyword_raw}': {e}",
                 exc_info=True,
             )
-        finally:
-            self.save_job_cache(type='job_id')
 
-    def save_checkpoint(
-        self, job_batch: List[Dict[str, Any]], output_path: Path
-    ) -> bool:
+    def crawl_job_ids(self, streams: List[SearchStream]) -> List[SearchStream]:
+        """
+        Scrape the job IDs of several searches concurrently.
+
+        Search result pages of all the streams are fetched by up to
+        `max_workers` threads under the shared rate limiter (see
+        `IdCrawler`), and new IDs are stored in `self.job_ids_cache` with
+        their work model and keyword.
+
+        Args:
+            streams (List[SearchStream]): The (keyword, work model) searches
+                to crawl.
+
+        Returns:
+            List[SearchStream]: The streams, with their page and new ID
+                counts and rates.
+        """
+        streams = IdCrawler(self).crawl(streams)
+        logger.success(
+            f'Crawled {sum(s.pages for s in streams)} search pages in {len(streams)} streams, '
+            f'adding {sum(s.new_ids for s in streams)} new job IDs. '
+            f'Total unique job IDs in cache: {len(self.job_ids_cache)}.'
+        )
+        return streams
+
+    def save_checkpoint(self, job_batch: List[Dict[str, Any]]) -> bool:
         """
-        Save a batch of scraped job data to a CSV file as a checkpoint.
+        Save a batch of scraped job data to the raw jobs dataset as a checkpoint.
 
-        Appends to the CSV if it already exists (without headers), otherwise
-        creates a new CSV with headers.
+        Appends a new Parquet part file (or appends to the CSV file, without
+        headers if it already exists).
 
         Args:
             job_batch (List[Dict[str, Any]]): A list of dictionaries, where each
                 dictionary represents a scraped job's data.
-            output_path (Path): The Path object for the output CSV file.
 
         Returns:
             bool: True if saving was successful, False otherwise.
         """
         try:
-            df_batch = pd.DataFrame(job_batch)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            file_exists = output_path.exists()
-            df_batch.to_csv(
-                output_path,
-                mode='a' if file_exists else 'w',
-                header=not file_exists,
-                index=False,
-            )
-            action = 'Appended' if file_exists else 'Created new file with'
+            existed = self.job_dataset.exists()
+            with metrics.timer('scraper.checkpoint', len(job_batch)):
+                self.job_dataset.append(pd.DataFrame(job_batch))
+            action = 'Appended' if existed else 'Created new dataset with'
             logger.info(
-                f'Checkpoint: {action} {len(job_batch)} jobs to {output_path}'
+                f'Checkpoint: {action} {len(job_batch)} jobs to {self.job_dataset.path}'
             )
             return True
         except Exception as e:
-            logger.error(f'Failed to save checkpoint to {output_path}: {e}')
+            logger.error(
+                f'Failed to save checkpoint to {self.job_dataset.path}: {e}'
+            )
             return False
 
-    def safe_find(
-        self, soup: BeautifulSoup, tag: str, attrs: Dict[str, str]
-    ) -> Optional[str]:
+    def fetch_job_post(
+        self, job_id: str, job_data: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
         """
-        Safely finds an element in a BeautifulSoup object and extracts its text.
+        Fetch and parse the detail page of a single job posting.
+
+        This method is safe to call from several worker threads at once: it
+        only reads shared state and leaves cache and checkpoint updates to
+        the caller.
 
         Args:
-            soup (BeautifulSoup): The BeautifulSoup object to search within.
-            tag (str): The HTML tag to find;
-            attrs (Dict[str, str]): A dictionary of attributes to filter the tag by.
+            job_id (str): The LinkedIn job ID.
+            job_data (Dict[str, str]): The `job_ids_cache` entry of the job,
+                holding its work model and keyword.
 
         Returns:
-            Optional[str]: The stripped text content of the element if found,
-                None otherwise.
+            Optional[Dict[str, Any]]: The parsed job data, or None if the
+                page could not be fetched.
         """
-        element = soup.find(tag, attrs)
-        return element.text.strip() if element else None
+        job_url = f'{self.base_url}/jobs-guest/jobs/api/jobPosting/{job_id}?_l=pt_BR'
 
-    def get_job_info(self) -> pd.DataFrame:
+        job_response = self.fetch_with_smart_retry(job_url)
+
+        if not job_response:
+            metrics.count('scraper.fetch_failures')
+            return None
+
+        job_post = {
+            'job_id': job_id,
+            'work_model': job_data['work_model'],
+            'keyword': job_data['keyword'],
+            'scrape_date': self.scrape_date,
+        }
+
+        with metrics.timer('scraper.parse', 1):
+            job_post.update(
+                parse_job_posting(job_response.text, backend=self.html_parser)
+            )
+
+        if job_post['job_description'] is None:
+            logger.warning(f'No job description found for job ID {job_id}')
+
+        job_post[FINGERPRINT_COLUMN] = posting_fingerprint(
+            [job_post.get(column) for column in DEDUP_COLUMNS]
+        )
+        return job_post
+
+    def iter_fetched_job_posts(
+        self, jobs: Iterable[Tuple[str, Dict[str, str]]]
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
         """
-        Scrapes detailed information for all job IDs stored in `self.job_ids_cache`.
+        Fetch job posts with up to `max_workers` requests in flight.
 
-        It checks `self.job_data_cache` first. If data is not cached, it fetches
-        the job details from LinkedIn, parses them, and updates both the job data
-        cache and a running list. Results are periodically saved to a CSV checkpoint.
-        It also attempts to resume by checking an existing output CSV for
-        already processed job IDs.
+        Results are yielded in the same order as `jobs`, regardless of the
+        order in which the requests complete, so downstream caching and
+        checkpointing stay deterministic.
 
-        Returns:
-            pd.DataFrame: A DataFrame containing all scraped job information,
-                including any data loaded from an existing output CSV.
-                Returns an empty DataFrame if no job IDs are available or
-                if scraping yields no new data.
+        Args:
+            jobs (Iterable[Tuple[str, Dict[str, str]]]): Pairs of job ID and
+                `job_ids_cache` entry to fetch.
+
+        Yields:
+            Tuple[str, Optional[Dict[str, Any]]]: The job ID and its parsed
+                data, or None if fetching failed.
+        """
+        if self.max_workers == 1:
+            for job_id, job_data in jobs:
+                yield job_id, self.fetch_job_post(job_id, job_data)
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='job-fetch'
+        )
+        pending: Deque[Tuple[str, Future]] = deque()
+        try:
+            for job_id, job_data in jobs:
+                pending.append(
+                    (
+                        job_id,
+                        executor.submit(self.fetch_job_post, job_id, job_data),
+                    )
+                )
+                # Keep a small queue ahead of the workers so none sits idle
+                # while the oldest request finishes.
+                if len(pending) >= 2 * self.max_workers:
+                    job_id, future = pending.popleft()
+                    yield job_id, future.result()
+
+            while pending:
+                job_id, future = pending.popleft()
+                yield job_id, future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def iter_job_info(self) -> Iterator[Dict[str, Any]]:
+        """
+        Scrape the jobs in `self.job_ids_cache`, yielding each record as soon
+        as it is available.
+
+        Jobs already in the raw jobs dataset are skipped. Cached jobs come
+        first, then jobs fetched from LinkedIn (concurrently when
+        `max_workers` > 1), each in `self.job_ids_cache` order. Checkpoints
+        to the dataset and cache flushes happen as a side effect while
+        iterating, and the last partial checkpoint is saved when the
+        iteration ends, fails or is stopped early. No records are kept, so
+        memory use doesn't grow with the number of jobs.
+
+        Yields:
+            Dict[str, Any]: The data of one job added to the dataset.
         """
         logger.info(
             f'Initializing scraping of detailed info for {len(self.job_ids_cache)} cached job IDs.'
@@ -452,34 +705,37 @@ class JobScraper:
             logger.warning(
                 'No job IDs found in job_ids_cache. Run get_job_ids() first or ensure cache is populated.'
             )
-            return pd.DataFrame()
+            return
 
-        job_list: List[Dict[str, Any]] = []
+        n_added = 0
+        n_fetched = 0
         checkpoint_batch: List[Dict[str, Any]] = []
         remaining_jobs = len(self.job_ids_cache)
-        output_path = Path('data/raw/jobs_data.csv')
+        output_path = self.job_dataset.path
 
+        n_processed = 0
         processed_ids: set[str] = set()
-        if output_path.exists():
+        if self.job_dataset.exists():
             try:
-                existing_df = pd.read_csv(output_path, on_bad_lines='skip')
-                if 'job_id' in existing_df.columns:
-                    processed_ids = set(
-                        existing_df['job_id'].astype(str).values
-                    )
-                    logger.info(
-                        f'Found {len(processed_ids)} already processed jobs in {output_path}'
-                    )
+                index = self.job_dataset.job_ids()
+                n_processed = len(index)
+                candidate_ids = list(self.job_ids_cache)
+                new_ids = set(index.missing(candidate_ids))
+                processed_ids = {
+                    job_id for job_id in candidate_ids if job_id not in new_ids
+                }
+                logger.info(
+                    f'Found {n_processed} already processed jobs in {output_path}'
+                )
             except Exception as e:
-                logger.error(f'Error reading existing CSV: {e}')
+                logger.error(f'Error reading existing job IDs: {e}')
 
         try:
+            jobs_to_fetch: List[Tuple[str, Dict[str, str]]] = []
             for job_id, job_data in self.job_ids_cache.items():
-                job_work_model = job_data['work_model']
-                job_keyword = job_data['keyword']
                 if job_id in processed_ids:
                     logger.info(
-                        f'Skipping job ID {job_id} - already in CSV file ({len(processed_ids)} total)'
+                        f'Skipping job ID {job_id} - already in {output_path} ({n_processed} total)'
                     )
                     remaining_jobs -= 1
                     continue
@@ -487,110 +743,46 @@ class JobScraper:
                 if job_id in self.job_data_cache:
                     logger.info(f'Using cached data for job ID {job_id}')
                     job_post = self.job_data_cache[job_id]
-                    job_list.append(self.job_data_cache[job_id])
+                    if FINGERPRINT_COLUMN not in job_post:
+                        # Cached before fingerprints were computed at ingest.
+                        job_post[FINGERPRINT_COLUMN] = posting_fingerprint(
+                            [job_post.get(column) for column in DEDUP_COLUMNS]
+                        )
                     checkpoint_batch.append(job_post)
                     remaining_jobs -= 1
 
                     if len(checkpoint_batch) >= self.checkpoint_frequency:
-                        self.save_checkpoint(checkpoint_batch, output_path)
+                        self.save_checkpoint(checkpoint_batch)
                         checkpoint_batch = []
 
+                    n_added += 1
+                    metrics.count('scraper.jobs_from_cache')
+                    yield job_post
                     continue
 
-                job_url = f'https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}?_l=pt_BR'
+                jobs_to_fetch.append((job_id, job_data))
 
-                job_response = self.fetch_with_smart_retry(job_url)
+            logger.info(
+                f'Fetching {len(jobs_to_fetch)} job pages with up to {self.max_workers} concurrent requests.'
+            )
 
-                if not job_response:
+            for job_id, job_post in self.iter_fetched_job_posts(jobs_to_fetch):
+                if not job_post:
                     logger.warning(
                         f'Failed to fetch job ID {job_id} after multiple retries, skipping...'
                     )
                     remaining_jobs -= 1
                     continue
 
-                job_post = {
-                    'job_id': job_id,
-                    'work_model': job_work_model,
-                    'keyword': job_keyword,
-                    'scrape_date': self.scrape_date,
-                }
-
-                job_soup = BeautifulSoup(job_response.text, 'html.parser')
-
-                job_post['job_title'] = self.safe_find(
-                    job_soup, 'h2', {'class': 'top-card-layout__title'}
-                )
-                job_post['company_name'] = self.safe_find(
-                    job_soup, 'a', {'class': 'topcard__org-name-link'}
-                )
-                job_post['location'] = self.safe_find(
-                    job_soup,
-                    'span',
-                    {'class': 'topcard__flavor topcard__flavor--bullet'},
-                )
-                job_post['time_posted'] = self.safe_find(
-                    job_soup, 'span', {'class': 'posted-time-ago__text'}
-                )
-                job_post['num_applicants'] = self.safe_find(
-                    job_soup, 'span', {'class': 'num-applicants__caption'}
-                )
-
-                job_criteria = {}
-                for item in job_soup.find_all(
-                    'li', class_='description__job-criteria-item'
-                ):
-                    try:
-                        label = item.find(
-                            'h3', class_='description__job-criteria-subheader'
-                        ).text.strip()
-                        value = item.find(
-                            'span', class_='description__job-criteria-text'
-                        ).text.strip()
-                        job_criteria[label] = value
-                    except AttributeError:
-                        continue
-
-                job_keys = list(job_criteria.keys())
-                job_post['xp_level'] = (
-                    job_criteria.get(job_keys[0], None)
-                    if len(job_keys) > 0
-                    else None
-                )
-                job_post['job_type'] = (
-                    job_criteria.get(job_keys[1], None)
-                    if len(job_keys) > 1
-                    else None
-                )
-                job_post['job_sectors'] = (
-                    job_criteria.get(job_keys[3], None)
-                    if len(job_keys) > 3
-                    else None
-                )
-
-                job_description_element = job_soup.find(
-                    'div', {'class': 'show-more-less-html__markup'}
-                )
-                if job_description_element:
-                    job_post[
-                        'job_description'
-                    ] = job_description_element.get_text(
-                        separator='\n', strip=True
-                    )
-                else:
-                    logger.warning(
-                        f'No job description found for job ID {job_id}'
-                    )
-                    job_post['job_description'] = None
-
-                job_list.append(job_post)
                 checkpoint_batch.append(job_post)
                 self.job_data_cache[job_id] = job_post
+                n_fetched += 1
 
-                if len(job_list) % 10 == 0:
+                if n_fetched % 10 == 0:
                     self.save_job_cache()
 
                 if len(checkpoint_batch) >= self.checkpoint_frequency:
-                    self.save_checkpoint(checkpoint_batch, output_path)
+                    self.save_checkpoint(checkpoint_batch)
                     checkpoint_batch = []
 
                 remaining_jobs -= 1
@@ -598,45 +790,65 @@ class JobScraper:
                     f'Processed job {job_id}, {remaining_jobs} remaining'
                 )
 
+                n_added += 1
+                metrics.count('scraper.jobs_fetched')
+                yield job_post
+
             if checkpoint_batch:
-                self.save_checkpoint(checkpoint_batch, output_path)
+                self.save_checkpoint(checkpoint_batch)
+                checkpoint_batch = []
 
             logger.success(
-                f'Added {len(job_list)} new jobs. Total processed: {len(processed_ids) + len(job_list)}'
+                f'Added {n_added} new jobs. Total processed: {n_processed + n_added}'
             )
 
-            if output_path.exists():
-                return pd.concat(
-                    [
-                        pd.read_csv(output_path, on_bad_lines='skip'),
-                        pd.DataFrame(job_list),
-                    ]
-                ).drop_duplicates('job_id')
-            
-            if job_list:
-                self.save_checkpoint(job_list, Path('data/raw/jobs_data.csv'))
-
-            return pd.DataFrame(job_list)
-        
         except Exception as e:
             logger.error(f'Unexpected error during job scraping: {e}')
+            raise
 
+        finally:
             if checkpoint_batch:
-                self.save_checkpoint(checkpoint_batch, output_path)
+                self.save_checkpoint(checkpoint_batch)
+            self.save_job_cache(type='job_data')
+            self.save_job_cache(type='job_id')
 
-            self.save_job_cache()
+    def iter_job_batches(
+        self, batch_size: int = 100
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Scrape jobs like `iter_job_info`, grouping the records into batches.
 
-            if output_path.exists():
-                try:
-                    return pd.read_csv(output_path, on_bad_lines='skip')
-                except:
-                    pass
+        Args:
+            batch_size (int, optional): Maximum number of jobs per batch.
+                Defaults to 100.
 
-            raise
+        Yields:
+            pd.DataFrame: Up to `batch_size` jobs added to the dataset.
+        """
+        batch: List[Dict[str, Any]] = []
+        for job_post in self.iter_job_info():
+            batch.append(job_post)
+            if len(batch) >= batch_size:
+                yield pd.DataFrame(batch)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch)
 
-        finally:
-            self.save_job_cache(type='job_data')
-            self.save_job_cache(type='job_id')
+    def get_job_info(self) -> pd.DataFrame:
+        """
+        Scrapes detailed information for all job IDs stored in `self.job_ids_cache`.
+
+        Collects everything yielded by `iter_job_info` into one DataFrame;
+        use `iter_job_info` or `iter_job_batches` to process jobs as they
+        arrive instead. The full history is available lazily through
+        `self.job_dataset.read()`.
+
+        Returns:
+            pd.DataFrame: A DataFrame with the jobs added to the dataset by
+                this call. Returns an empty DataFrame if no job IDs are
+                available or if scraping yields no new data.
+        """
+        return pd.DataFrame(list(self.iter_job_info()))
 
 
 if __name__ == '__main__':
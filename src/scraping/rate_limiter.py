@@ -0,0 +1,175 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    A thread-safe, per-host token bucket shared by every worker of a scraper.
+
+    Each host gets its own bucket refilled at `rate` tokens per second up to
+    `burst` tokens; the rate of a host can be changed while running (see
+    `set_rate`). Any worker can pause a host (e.g. after a 429 response),
+    which blocks every other worker requesting that host until the pause ends.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the RateLimiter.
+
+        Args:
+            rate (float): Sustained requests per second allowed per host.
+                A value <= 0 disables rate limiting (pauses still apply).
+            burst (int, optional): Maximum number of tokens a bucket can hold.
+                Defaults to 1.
+            clock (Callable[[], float], optional): Monotonic clock used for
+                refills. Defaults to `time.monotonic`.
+            sleep (Callable[[float], None], optional): Function used to wait.
+                Defaults to `time.sleep`.
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, float] = {}
+        self._last_refill: Dict[str, float] = {}
+        self._paused_until: Dict[str, float] = {}
+        self._rates: Dict[str, float] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """
+        Extract the host a URL is rate limited under.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            str: The URL's network location (host[:port]).
+        """
+        return urlparse(url).netloc
+
+    def _refill(self, host: str, now: float) -> None:
+        """Top up the bucket of `host` according to the elapsed time."""
+        if host not in self._tokens:
+            self._tokens[host] = float(self.burst)
+            self._last_refill[host] = now
+            return
+
+        elapsed = now - self._last_refill[host]
+        self._tokens[host] = min(
+            float(self.burst),
+            self._tokens[host] + elapsed * self._rates.get(host, self.rate),
+        )
+        self._last_refill[host] = now
+
+    def acquire(self, url: str) -> None:
+        """
+        Block until a request to the host of `url` is allowed.
+
+        Args:
+            url (str): The URL about to be requested.
+        """
+        host = self.host_of(url)
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                paused_until = self._paused_until.get(host, 0.0)
+                rate = self._rates.get(host, self.rate)
+                if now < paused_until:
+                    wait_time = paused_until - now
+                elif rate <= 0:
+                    return
+                else:
+                    self._refill(host, now)
+                    if self._tokens[host] >= 1:
+                        self._tokens[host] -= 1
+                        return
+                    wait_time = (1 - self._tokens[host]) / rate
+
+            self._sleep(wait_time)
+
+    def rate_of(self, url: str) -> float:
+        """
+        Return the current rate of the host of `url`.
+
+        Args:
+            url (str): A URL of the host.
+
+        Returns:
+            float: Requests per second allowed to the host.
+        """
+        with self._lock:
+            return self._rates.get(self.host_of(url), self.rate)
+
+    def set_rate(self, url: str, rate: float) -> None:
+        """
+        Change the rate of the host of `url`.
+
+        Tokens accumulated at the old rate are kept (up to `burst`).
+
+        Args:
+            url (str): A URL of the host.
+            rate (float): The new requests per second allowed to the host.
+        """
+        self.update_rate(url, lambda current: rate)
+
+    def update_rate(self, url: str, update: Callable[[float], float]) -> float:
+        """
+        Change the rate of the host of `url` based on its current rate.
+
+        The rate is read and replaced under the limiter's lock, so concurrent
+        updates are never lost. Tokens accumulated at the old rate are kept
+        (up to `burst`).
+
+        Args:
+            url (str): A URL of the host.
+            update (Callable[[float], float]): Called with the current rate,
+                returns the new one.
+
+        Returns:
+            float: The new rate.
+        """
+        host = self.host_of(url)
+        with self._lock:
+            now = self._clock()
+            # A paused host refills from the end of the pause instead.
+            if host in self._tokens and now >= self._last_refill[host]:
+                self._refill(host, now)
+            rate = update(self._rates.get(host, self.rate))
+            self._rates[host] = rate
+        return rate
+
+    def pause(self, url: str, seconds: float) -> None:
+        """
+        Pause every request to the host of `url` for `seconds`.
+
+        Overlapping pauses are merged, keeping the latest end time.
+
+        Args:
+            url (str): A URL of the host to pause.
+            seconds (float): How long to pause the host for.
+        """
+        host = self.host_of(url)
+        with self._lock:
+            resume_at = self._clock() + seconds
+            if resume_at > self._paused_until.get(host, 0.0):
+                self._paused_until[host] = resume_at
+                # Drop accumulated tokens so workers resume one at a time.
+                self._tokens[host] = 0.0
+                self._last_refill[host] = resume_at
+                logger.warning(
+                    f'Pausing all requests to {host} for {seconds:.2f}s.'
+                )
@@ -0,0 +1,299 @@
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+from config.scraping import (
+    MAX_BACKOFF,
+    MAX_RETRY_AFTER,
+    MIN_REQUESTS_PER_SECOND,
+    RATE_DECREASE_FACTOR,
+    RATE_INCREASE,
+)
+
+from ..utils.metrics import metrics
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: rate limiting, timeouts and server errors.
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[datetime] = None
+) -> Optional[float]:
+    """
+    Parse a Retry-After header, given in seconds or as an HTTP date.
+
+    Args:
+        value (Optional[str]): The header value.
+        now (Optional[datetime], optional): The current time, for dates.
+            Defaults to the current UTC time.
+
+    Returns:
+        Optional[float]: Seconds to wait (never negative), or None if the
+            header is missing or unreadable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class RetryController:
+    """
+    Adapt the request rate and retry delays to the server's responses.
+
+    Shared by every worker of a scraper, on top of its `RateLimiter`. The
+    rate of a host is managed AIMD-style: each 429 divides it by
+    `1 / decrease_factor` (at most once per pause, since concurrent workers
+    tend to be throttled together), and every successful request raises it
+    so that it grows by about `increase` requests per second each second,
+    back up to the configured maximum. A 429 or 503 also pauses the host for
+    its Retry-After time when given, otherwise for a jittered exponential
+    backoff. Other retryable failures (server errors, connection errors)
+    only delay the worker that got them, with the same jittered backoff.
+
+    Every new rate is observed in the 'scraper.request_rate' histogram of
+    `metrics`, next to the 'scraper.throttled_responses' and
+    'scraper.rate_decreases' counters.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        min_rate: float = MIN_REQUESTS_PER_SECOND,
+        decrease_factor: float = RATE_DECREASE_FACTOR,
+        increase: float = RATE_INCREASE,
+        max_backoff: float = MAX_BACKOFF,
+        max_retry_after: float = MAX_RETRY_AFTER,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize the RetryController.
+
+        Args:
+            rate_limiter (RateLimiter): The limiter whose host rates are
+                adjusted. Its `rate` is the maximum; a rate <= 0 (no limit)
+                disables the adaptation, leaving only pauses and backoff.
+            min_rate (float, optional): Lowest rate a host is slowed down to.
+                Defaults to `MIN_REQUESTS_PER_SECOND`.
+            decrease_factor (float, optional): Multiplier applied to the rate
+                on a 429. Defaults to `RATE_DECREASE_FACTOR`.
+            increase (float, optional): Requests per second regained per
+                second of successful requests. Defaults to `RATE_INCREASE`.
+            max_backoff (float, optional): Upper bound of the backoff delay
+                in seconds. Defaults to `MAX_BACKOFF`.
+            max_retry_after (float, optional): Upper bound honored for a
+                Retry-After header, in seconds. Defaults to `MAX_RETRY_AFTER`.
+            clock (Callable[[], float], optional): Monotonic clock.
+                Defaults to `time.monotonic`.
+            sleep (Callable[[float], None], optional): Function used to wait.
+                Defaults to `time.sleep`.
+            rng (Optional[random.Random], optional): Source of the jitter.
+        """
+        self.rate_limiter = rate_limiter
+        self.max_rate = rate_limiter.rate
+        self.min_rate = min(min_rate, self.max_rate) if self.max_rate > 0 else 0
+        self.decrease_factor = decrease_factor
+        self.increase = increase
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self._clock = clock
+        self._sleep = sleep
+        self._random = rng or random.Random()
+        self._lock = threading.Lock()
+        self._throttled_until: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {
+            'successes': 0,
+            'throttled': 0,
+            'rate_decreases': 0,
+            'retries': 0,
+        }
+        self.lowest_rate = self.max_rate
+
+    @property
+    def adaptive(self) -> bool:
+        """Whether the request rate is adapted (a maximum rate is set)."""
+        return self.max_rate > 0
+
+    def rate(self, url: str) -> float:
+        """
+        Return the current request rate of the host of `url`.
+
+        Args:
+            url (str): A URL of the host.
+
+        Returns:
+            float: Requests per second currently allowed (<= 0: unlimited).
+        """
+        return self.rate_limiter.rate_of(url)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Pick a "full jitter" exponential backoff delay.
+
+        Args:
+            attempt (int): The failed attempt number, starting at 0.
+
+        Returns:
+            float: Seconds, uniformly drawn from [0, min(max_backoff, 2**attempt)].
+        """
+        with self._lock:
+            return self._random.uniform(
+                0, min(self.max_backoff, 2.0**attempt)
+            )
+
+    def on_success(self, url: str) -> None:
+        """
+        Record a successful request, raising the host's rate additively.
+
+        Args:
+            url (str): The URL that succeeded.
+        """
+        with self._lock:
+            self.counts['successes'] += 1
+        if not self.adaptive:
+            return
+        changed = []
+
+        def increase(rate: float) -> float:
+            if rate >= self.max_rate:
+                return rate
+            changed.append(rate)
+            # `rate` successes take about a second, so the rate grows by
+            # about `increase` per second.
+            return min(self.max_rate, rate + self.increase / rate)
+
+        new_rate = self.rate_limiter.update_rate(url, increase)
+        if changed:
+            metrics.observe('scraper.request_rate', new_rate)
+
+    def on_throttled(
+        self,
+        url: str,
+        attempt: int,
+        status: int,
+        retry_after: Optional[str] = None,
+        retry: bool = True,
+    ) -> float:
+        """
+        Handle a retryable status, returning how long until the retry.
+
+        429 and 503 responses pause every worker on the host; a 429 also
+        lowers its rate. Other statuses only delay the calling worker, which
+        sleeps here. When the caller gives up (`retry` is False), a 429 still
+        lowers the rate but nothing is paused or slept.
+
+        Args:
+            url (str): The URL that failed.
+            attempt (int): The failed attempt number, starting at 0.
+            status (int): The response status.
+            retry_after (Optional[str], optional): The Retry-After header.
+            retry (bool, optional): Whether the request will be retried.
+                Defaults to True.
+
+        Returns:
+            float: The delay applied, in seconds (0 without a retry).
+        """
+        if not retry:
+            if status == 429:
+                self._decrease(url, 0.0)
+            return 0.0
+
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            delay = min(delay, self.max_retry_after)
+        else:
+            delay = self.backoff(attempt)
+
+        with self._lock:
+            self.counts['retries'] += 1
+
+        if status not in (429, 503):
+            self._sleep(delay)
+            return delay
+
+        if status == 429:
+            self._decrease(url, delay)
+        self.rate_limiter.pause(url, delay)
+        return delay
+
+    def on_error(self, url: str, attempt: int) -> float:
+        """
+        Delay the calling worker after a connection error or timeout.
+
+        Args:
+            url (str): The URL that failed.
+            attempt (int): The failed attempt number, starting at 0.
+
+        Returns:
+            float: The delay slept, in seconds.
+        """
+        with self._lock:
+            self.counts['retries'] += 1
+        delay = self.backoff(attempt)
+        self._sleep(delay)
+        return delay
+
+    def _decrease(self, url: str, pause: float) -> None:
+        """Lower the host's rate, once per throttling episode."""
+        host = self.rate_limiter.host_of(url)
+        now = self._clock()
+        metrics.count('scraper.throttled_responses')
+        previous = []
+
+        def decrease(rate: float) -> float:
+            previous.append(rate)
+            return max(self.min_rate, rate * self.decrease_factor)
+
+        with self._lock:
+            self.counts['throttled'] += 1
+            if not self.adaptive or now < self._throttled_until.get(host, 0.0):
+                return
+            new_rate = self.rate_limiter.update_rate(url, decrease)
+            # 429s answered before the slowdown took effect don't count.
+            self._throttled_until[host] = now + max(pause, 1.0 / new_rate)
+            self.counts['rate_decreases'] += 1
+            self.lowest_rate = min(self.lowest_rate, new_rate)
+        metrics.count('scraper.rate_decreases')
+        metrics.observe('scraper.request_rate', new_rate)
+        logger.warning(
+            f'Rate limited on {host}: lowering the request rate from {previous[0]:.2f} to {new_rate:.2f}/s.'
+        )
+
+    def summary(self, url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Summarize the controller's activity.
+
+        Args:
+            url (Optional[str], optional): A URL of the host whose current
+                rate is reported.
+
+        Returns:
+            Dict[str, Any]: The counts of successes, throttled responses,
+                rate decreases and retries, the lowest and current rate.
+        """
+        with self._lock:
+            summary: Dict[str, Any] = dict(self.counts)
+            summary['lowest_rate'] = self.lowest_rate
+        if url is not None:
+            summary['current_rate'] = self.rate(url)
+        return summary
@@ -1,25 +1,30 @@
+import argparse
 import logging
+import sys
 
 from config.scraping import KEYWORDS
 
 from ..utils.logger import setup_logging
+from ..utils.metrics import enable_metrics
+from ..utils.profiling import add_profiling_arguments, profiling_from_args
+from .id_crawler import SearchStream, export_keyword_overlap, unique_keywords
 from .linkedin_scraper import JobScraper
 
 logger = logging.getLogger(__name__)
 
-if __name__ == '__main__':
-    logger.info(f'Initializing main scraping pipeline.')
-    setup_logging()
 
-    try:
-        job_scraper = JobScraper()
-        logger.success(f'Successfully initialized scraper.')
-    except Exception as e:
-        logger.error(f'Unexpected error while starting scraper: {e}')
+def collect_job_ids(job_scraper: JobScraper) -> None:
+    """
+    Fetch the job amounts per keyword and work model, then crawl the job
+    IDs of all the (keyword, work model) searches concurrently and save the
+    keyword overlap report. Repeated keywords are searched once.
 
+    Args:
+        job_scraper (JobScraper): The scraper whose ID archive is filled.
+    """
     jobs = {}
     try:
-        jobs = job_scraper.get_job_amount(keywords=KEYWORDS)
+        jobs = job_scraper.get_job_amount(keywords=unique_keywords(KEYWORDS))
         num_keywords = len(jobs)
         total_postings = sum(
             sum(job_counts.values()) for job_counts in jobs.values()
@@ -30,27 +35,46 @@ if __name__ == '__main__':
     except Exception as e:
         logger.error(f'Failed to fetch job data: {e}')
 
-    if jobs:
-        for keyword, data in jobs.items():
-            for work_model_id, n_ids in data.items():
-                try:
-                    job_scraper.get_job_ids(
-                        n_ids - 10, keyword, str(work_model_id)
-                    )
-                    logger.success(
-                        f"Fetched job IDs for keyword='{keyword}', work_model_id={work_model_id}, count={n_ids - 10}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to fetch job IDs for keyword='{keyword}', work_model_id={work_model_id}: {e}"
-                    )
+    streams = [
+        SearchStream(keyword, str(work_model_id), n_ids - 10)
+        for keyword, data in jobs.items()
+        for work_model_id, n_ids in data.items()
+    ]
+    try:
+        job_scraper.crawl_job_ids(streams)
+        export_keyword_overlap(streams)
+    except Exception as e:
+        logger.error(f'Failed to fetch job IDs: {e}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Scrape LinkedIn job postings.')
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+
+    logger.info(f'Initializing main scraping pipeline.')
+    setup_logging()
+    enable_metrics()
+    profiling_from_args(args)
 
     try:
-        job_info = job_scraper.get_job_info()
-        logger.success(
-            f'Successfully fetched job info for {len(job_info)} job postings.'
-        )
+        job_scraper = JobScraper()
+        logger.success(f'Successfully initialized scraper.')
     except Exception as e:
-        logger.error(f'Failed to fetch detailed job info: {e}')
+        logger.error(f'Unexpected error while starting scraper: {e}')
+        sys.exit(1)
+
+    try:
+        collect_job_ids(job_scraper)
+
+        try:
+            job_info = job_scraper.get_job_info()
+            logger.success(
+                f'Successfully fetched job info for {len(job_info)} job postings.'
+            )
+        except Exception as e:
+            logger.error(f'Failed to fetch detailed job info: {e}')
+    finally:
+        job_scraper.close()
 
     logger.success('Scraping part completed.')
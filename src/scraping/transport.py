@@ -0,0 +1,244 @@
+import importlib.util
+import logging
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+logger = logging.getLogger(__name__)
+
+HTTP_CLIENTS = ['requests', 'httpx']
+
+# Content codings the HTTP clients can decode in this environment (brotli
+# and zstd only when their packages are installed). Advertising others
+# would get responses back that can't be read.
+ACCEPT_ENCODING = DEFAULT_ACCEPT_ENCODING
+
+
+def resolve_client(client: str = 'requests', http2: bool = False) -> str:
+    """
+    Resolve a requested HTTP client to one that can actually be used.
+
+    Args:
+        client (str, optional): 'requests' or 'httpx'. Defaults to 'requests'.
+        http2 (bool, optional): Whether HTTP/2 is wanted, which needs
+            'httpx' with the `h2` package. Defaults to False.
+
+    Returns:
+        str: The client to use. Falls back to 'requests' if 'httpx' (or `h2`
+            for HTTP/2) is not installed.
+
+    Raises:
+        ValueError: If `client` is not a known client name.
+    """
+    if client not in HTTP_CLIENTS:
+        raise ValueError(
+            f"Invalid HTTP client '{client}'. Choose from {', '.join(repr(c) for c in HTTP_CLIENTS)}."
+        )
+    if http2 and client != 'httpx':
+        logger.warning("HTTP/2 needs the 'httpx' client; using HTTP/1.1.")
+    if client == 'httpx':
+        missing = [
+            package
+            for package in (['httpx', 'h2'] if http2 else ['httpx'])
+            if importlib.util.find_spec(package) is None
+        ]
+        if missing:
+            logger.warning(
+                f"{', '.join(missing)} not installed. Falling back to the 'requests' client."
+            )
+            return 'requests'
+    return client
+
+
+def mount_adapter(
+    session: requests.Session,
+    pool_connections: int,
+    pool_maxsize: int,
+    max_retries: int = 0,
+) -> HTTPAdapter:
+    """
+    Mount a connection-pooling adapter for http and https on a session.
+
+    Args:
+        session (requests.Session): The session to configure.
+        pool_connections (int): Number of hosts with a connection pool.
+        pool_maxsize (int): Connections kept alive per host. Should be at
+            least the number of threads sharing the session, otherwise
+            connections are closed after use and reopened.
+        max_retries (int, optional): Connection-level retries done by
+            urllib3. Defaults to 0 (retries are handled by the scraper).
+
+    Returns:
+        HTTPAdapter: The mounted adapter.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
+
+
+class HttpxSession:
+    """
+    A minimal `requests.Session` stand-in backed by an `httpx.Client`.
+
+    Supports what `JobScraper` uses, `get` and `close`, optionally over
+    HTTP/2 (several concurrent requests on one connection). Transport
+    errors are raised as `requests.exceptions.ConnectionError`, so the
+    scraper's retry logic treats both clients alike.
+    """
+
+    def __init__(self, pool_maxsize: int, http2: bool = False):
+        """
+        Initialize the HttpxSession.
+
+        Args:
+            pool_maxsize (int): Maximum number of open connections.
+            http2 (bool, optional): Negotiate HTTP/2 with servers that
+                support it. Defaults to False.
+        """
+        import httpx
+
+        self._httpx = httpx
+        self.client = httpx.Client(
+            http2=http2,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize,
+            ),
+        )
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send a GET request, returning an `httpx.Response`."""
+        try:
+            return self.client.get(url, headers=headers, timeout=timeout)
+        except self._httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.client.close()
+
+
+def connections_opened(session: Any) -> Optional[int]:
+    """
+    Count the connections a `requests` session has opened so far.
+
+    Args:
+        session: A `requests.Session` (other clients are not supported).
+
+    Returns:
+        Optional[int]: The number of connections, or None if unknown.
+    """
+    if not isinstance(session, requests.Session):
+        return None
+    total = 0
+    # The same adapter is usually mounted for both http and https.
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+        if pools is None:
+            continue
+        for key in pools.keys():
+            total += pools[key].num_connections
+    return total
+
+
+class TransportStats:
+    """
+    Thread-safe latency and size statistics of the HTTP requests sent.
+
+    Wire bytes come from the Content-Length header (the compressed size when
+    the response is compressed); body bytes are the decoded content. The
+    mean and maximum latency are exact; the percentiles are computed from a
+    uniform random sample of at most `SAMPLE_SIZE` latencies (reservoir
+    sampling), so memory stays bounded during long scrapes.
+    """
+
+    SAMPLE_SIZE = 10_000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._random = random.Random(0)
+        self.requests = 0
+        self.errors = 0
+        self.statuses: Dict[int, int] = {}
+        self.latencies: List[float] = []
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+
+    def record(self, latency: float, response: Any = None) -> None:
+        """
+        Record a request.
+
+        Args:
+            latency (float): Seconds from sending the request to having the
+                whole response.
+            response (optional): The response, or None if the request failed.
+        """
+        with self._lock:
+            self.requests += 1
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+            if len(self.latencies) < self.SAMPLE_SIZE:
+                self.latencies.append(latency)
+            else:
+                # Keep each of the `requests` latencies with equal probability.
+                slot = self._random.randrange(self.requests)
+                if slot < self.SAMPLE_SIZE:
+                    self.latencies[slot] = latency
+            if response is None:
+                self.errors += 1
+                return
+            self.statuses[response.status_code] = (
+                self.statuses.get(response.status_code, 0) + 1
+            )
+            body_bytes = len(response.content)
+            self.body_bytes += body_bytes
+            try:
+                self.wire_bytes += int(response.headers['Content-Length'])
+            except (KeyError, ValueError):
+                self.wire_bytes += body_bytes
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the recorded requests.
+
+        Returns:
+            Dict[str, Any]: Request and error counts, responses per status,
+                mean/p50/p95/max latency in seconds and wire/body bytes.
+        """
+        with self._lock:
+            latencies = list(self.latencies)
+            summary = {
+                'requests': self.requests,
+                'errors': self.errors,
+                'statuses': dict(self.statuses),
+                'wire_bytes': self.wire_bytes,
+                'body_bytes': self.body_bytes,
+            }
+            latency_total, latency_max = self.latency_total, self.latency_max
+        if latencies:
+            latencies.sort()
+            summary.update(
+                latency_mean=latency_total / summary['requests'],
+                latency_p50=latencies[len(latencies) // 2],
+                latency_p95=latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                latency_max=latency_max,
+            )
+        return summary
@@ -0,0 +1,109 @@
+import hashlib
+from typing import Any, Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from config.storage import DEDUP_COLUMNS
+
+_NA = b'\x00NA'
+_SEPARATOR = b'\x1f'
+
+
+def _normalize(value: Any) -> bytes:
+    """Encode a field with case and whitespace differences removed."""
+    if not isinstance(value, str):
+        # None, NaN or pd.NA (the only values not equal to themselves).
+        if value is None or value is pd.NA or value != value:
+            return _NA
+        value = str(value)
+    return ' '.join(value.split()).casefold().encode('utf-8')
+
+
+def posting_fingerprint(values: Sequence[Any]) -> int:
+    """
+    Compute the 64-bit fingerprint of a posting's deduplication fields.
+
+    Fields are compared ignoring case and runs of whitespace; a missing
+    field differs from any string, including an empty one.
+
+    Args:
+        values (Sequence[Any]): The `DEDUP_COLUMNS` values of the posting,
+            in order.
+
+    Returns:
+        int: A signed 64-bit integer (fits an int64 column).
+    """
+    digest = hashlib.blake2b(
+        _SEPARATOR.join(_normalize(value) for value in values), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, 'little', signed=True)
+
+
+def posting_fingerprints(
+    df: pd.DataFrame, columns: List[str] = DEDUP_COLUMNS
+) -> pd.Series:
+    """
+    Compute the fingerprint of every row of a DataFrame.
+
+    Args:
+        df (pd.DataFrame): Postings with the deduplication columns.
+        columns (List[str], optional): The columns to fingerprint.
+            Defaults to `DEDUP_COLUMNS`.
+
+    Returns:
+        pd.Series: The int64 fingerprints, aligned with `df`.
+    """
+    rows = zip(*(df[column].tolist() for column in columns))
+    return pd.Series(
+        np.fromiter(
+            (posting_fingerprint(values) for values in rows),
+            dtype=np.int64,
+            count=len(df),
+        ),
+        index=df.index,
+        name='fingerprint',
+    )
+
+
+class FingerprintSet:
+    """
+    The fingerprints of the postings seen so far, for incremental dedup.
+
+    Checking a batch costs O(batch size), whatever the number of postings
+    seen before.
+    """
+
+    def __init__(self, fingerprints: Iterable[int] = ()):
+        """
+        Initialize the FingerprintSet.
+
+        Args:
+            fingerprints (Iterable[int], optional): Already seen
+                fingerprints, e.g. the column of a stored table.
+        """
+        self._seen = {int(fingerprint) for fingerprint in fingerprints}
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, fingerprint: object) -> bool:
+        return fingerprint in self._seen
+
+    def first_seen(self, fingerprints: Iterable[int]) -> np.ndarray:
+        """
+        Mark the postings not seen before, and remember them.
+
+        Args:
+            fingerprints (Iterable[int]): The fingerprints of a batch.
+
+        Returns:
+            np.ndarray: A boolean mask, True for the first occurrence of
+                each fingerprint not seen in earlier batches.
+        """
+        seen = self._seen
+        mask = []
+        for fingerprint in map(int, fingerprints):
+            mask.append(fingerprint not in seen)
+            seen.add(fingerprint)
+        return np.array(mask, dtype=bool)
@@ -3,6 +3,21 @@ from datetime import datetime
 from pathlib import Path
 
 LOG_TIMESTAMP = datetime.now().strftime('%Y%m%d_%H%M%S')
+SUCCESS_LEVEL = logging.INFO + 5
+
+
+def register_success_level() -> None:
+    """
+    Register the custom SUCCESS log level and the `Logger.success` method
+    """
+    logging.addLevelName(SUCCESS_LEVEL, 'SUCCESS')
+
+    def success(self, message, *args, **kwargs):
+        if self.isEnabledFor(SUCCESS_LEVEL):
+            self._log(SUCCESS_LEVEL, message, args, **kwargs)
+
+    logging.Logger.success = success
+
 
 def setup_logging(log_dir: str = 'logs') -> None:
     """
@@ -24,12 +39,5 @@ def setup_logging(log_dir: str = 'logs') -> None:
         ],
     )
 
-    SUCCESS_LEVEL = logging.INFO + 5
-    logging.addLevelName(SUCCESS_LEVEL, 'SUCCESS')
-
-    def success(self, message, *args, **kwargs):
-        if self.isEnabledFor(SUCCESS_LEVEL):
-            self._log(SUCCESS_LEVEL, message, args, **kwargs)
-
-    logging.Logger.success = success
+    register_success_level()
 
@@ -0,0 +1,306 @@
+import atexit
+import functools
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .logger import LOG_TIMESTAMP
+
+if TYPE_CHECKING:
+    from .profiling import Profiler
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(values: List[float], share: float) -> float:
+    """Return the value below which `share` of the sorted `values` fall."""
+    return values[min(len(values) - 1, int(len(values) * share))]
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    """Summarize a list of values (which must not be empty)."""
+    values = sorted(values)
+    return {
+        'mean': sum(values) / len(values),
+        'min': values[0],
+        'p50': _percentile(values, 0.5),
+        'p95': _percentile(values, 0.95),
+        'max': values[-1],
+    }
+
+
+class _NullTimer:
+    """The timer handed out while metrics are disabled: does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullTimer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def add_records(self, records: int) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """Time a block of code and record it in a `Metrics` registry."""
+
+    __slots__ = ('metrics', 'name', 'records', 'start', 'profile')
+
+    def __init__(self, metrics: 'Metrics', name: str, records: int):
+        self.metrics = metrics
+        self.name = name
+        self.records = records
+
+    def __enter__(self) -> '_Timer':
+        profiler = self.metrics.profiler
+        self.profile = profiler.start(self.name) if profiler else None
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.metrics.record_time(
+            self.name, time.perf_counter() - self.start, self.records
+        )
+        if self.profile is not None:
+            self.metrics.profiler.stop(self.name, self.profile)
+
+    def add_records(self, records: int) -> None:
+        """Count records processed inside the block, once known."""
+        self.records += records
+
+
+class Metrics:
+    """
+    Thread-safe timers, counters and histograms of a run.
+
+    Timers measure how long each stage takes (every call is kept, to report
+    percentiles) and how many records it processed, giving its throughput.
+    Counters add up events and histograms keep the distribution of values
+    such as batch or response sizes.
+
+    While disabled, `timer` returns a shared no-op context manager and the
+    other methods return immediately, so instrumented code costs next to
+    nothing. When a `Profiler` is attached (see `enable_profiling`), the
+    timed blocks are also profiled, one profile per stage name.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize the Metrics.
+
+        Args:
+            enabled (bool, optional): Whether to record anything.
+                Defaults to False.
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.timings: Dict[str, List[float]] = {}
+        self.records: Dict[str, int] = {}
+        self.counters: Dict[str, float] = {}
+        self.histograms: Dict[str, List[float]] = {}
+        self.profiler: Optional['Profiler'] = None
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._started = time.perf_counter()
+            self.timings.clear()
+            self.records.clear()
+            self.counters.clear()
+            self.histograms.clear()
+
+    def timer(self, name: str, records: int = 0) -> Any:
+        """
+        Time a block: `with metrics.timer('analysis.skill_extraction', n):`.
+
+        Args:
+            name (str): The stage name.
+            records (int, optional): Records processed by the block, for the
+                throughput. More can be added with `add_records` on the
+                returned timer. Defaults to 0.
+
+        Returns:
+            A context manager.
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, records)
+
+    def timed(
+        self, name: str, records: Optional[Callable[..., int]] = None
+    ) -> Callable:
+        """
+        Decorate a function so that every call is timed under `name`.
+
+        Args:
+            name (str): The stage name.
+            records (Optional[Callable[..., int]], optional): Called with the
+                function's arguments to count the records it processes, e.g.
+                `lambda df, *args, **kwargs: len(df)`.
+
+        Returns:
+            Callable: The decorator.
+        """
+
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                n_records = records(*args, **kwargs) if records else 0
+                with _Timer(self, name, n_records):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def record_time(self, name: str, seconds: float, records: int = 0) -> None:
+        """
+        Record one timed call.
+
+        Args:
+            name (str): The stage name.
+            seconds (float): Its duration.
+            records (int, optional): Records it processed. Defaults to 0.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.timings.setdefault(name, []).append(seconds)
+            self.records[name] = self.records.get(name, 0) + records
+
+    def count(self, name: str, value: float = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name (str): The counter name.
+            value (float, optional): The amount to add. Defaults to 1.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """
+        Add a value to a histogram.
+
+        Args:
+            name (str): The histogram name.
+            value (float): The observed value.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.histograms.setdefault(name, []).append(value)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize everything recorded.
+
+        Returns:
+            Dict[str, Any]: The run's wall time, then for every timer its
+                calls, total/mean/p50/p95/max seconds, records and records
+                (or calls, without records) per second; the counters; and
+                the count, mean, min, p50, p95 and max of every histogram.
+        """
+        with self._lock:
+            timings = {name: list(values) for name, values in self.timings.items()}
+            records = dict(self.records)
+            counters = dict(self.counters)
+            histograms = {
+                name: list(values) for name, values in self.histograms.items()
+            }
+            wall_time = time.perf_counter() - self._started
+
+        timers = {}
+        for name, values in timings.items():
+            total = sum(values)
+            distribution = _distribution(values)
+            timers[name] = {
+                'calls': len(values),
+                'total_seconds': total,
+                'mean_seconds': distribution['mean'],
+                'p50_seconds': distribution['p50'],
+                'p95_seconds': distribution['p95'],
+                'max_seconds': distribution['max'],
+                'records': records[name],
+                'per_second': (records[name] or len(values)) / total
+                if total > 0
+                else None,
+            }
+        return {
+            'wall_seconds': wall_time,
+            'timers': timers,
+            'counters': counters,
+            'histograms': {
+                name: {'count': len(values), **_distribution(values)}
+                for name, values in histograms.items()
+                if values
+            },
+        }
+
+    def write_summary(self, path: Path) -> Path:
+        """
+        Write the summary as JSON and log the time spent in each stage.
+
+        Args:
+            path (Path): The JSON file.
+
+        Returns:
+            Path: The file written.
+        """
+        summary = self.summary()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        for name, timer in sorted(
+            summary['timers'].items(), key=lambda item: -item[1]['total_seconds']
+        ):
+            rate = (
+                f", {timer['per_second']:.1f} {'records' if timer['records'] else 'calls'}/s"
+                if timer['per_second'] is not None
+                else ''
+            )
+            logger.info(
+                f"{name}: {timer['total_seconds']:.2f}s in {timer['calls']} calls{rate}"
+            )
+        logger.info(f'Saved run metrics to {path}')
+        return path
+
+
+# The registry used by the pipeline's stages; enabled by the entry points.
+metrics = Metrics()
+
+
+def metrics_path(log_dir: str = 'logs') -> Path:
+    """Return the metrics file of this run, next to its log file."""
+    return Path(log_dir) / f'{LOG_TIMESTAMP}_metrics.json'
+
+
+def enable_metrics(path: Optional[Path] = None) -> None:
+    """
+    Start recording metrics, writing their summary when the run ends.
+
+    Args:
+        path (Optional[Path], optional): The JSON file. Defaults to
+            `metrics_path()`, next to the log file.
+    """
+    if metrics.enabled:
+        return
+    metrics.reset()
+    metrics.enabled = True
+    atexit.register(metrics.write_summary, path or metrics_path())
@@ -0,0 +1,280 @@
+import argparse
+import atexit
+import cProfile
+import io
+import logging
+import pstats
+import threading
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .logger import LOG_TIMESTAMP
+from .metrics import enable_metrics, metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_N = 25
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """Take a tracemalloc snapshot without tracemalloc's own allocations."""
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+
+
+class Profiler:
+    """
+    Profile the stages timed by `metrics` with cProfile.
+
+    Every stage gets its own profile, merged across its profiled calls. To
+    keep the overhead small during long scrapes, only every
+    `sample_every`-th call of each stage is profiled, starting with the
+    first, so stages run once per run are always profiled. A stage started
+    while another one is being profiled in the same thread is part of the
+    outer profile.
+
+    Only one call is profiled at a time: since Python 3.12 cProfile is built
+    on `sys.monitoring`, so a single profile can be enabled per interpreter
+    and it records every thread. A sampled call started while another
+    thread's call is being profiled (the scraper fetches and parses jobs in
+    worker threads) is skipped and counted in `skipped`. On 3.12+ a profile
+    also includes what the other threads ran meanwhile.
+
+    With `memory`, tracemalloc also records how much the traced memory grew
+    at its peak during each profiled call (approximate when other threads
+    run at the same time). Snapshots are slow on large heaps, so they are
+    only compared around the first call of every stage, to list the lines
+    that allocated the most.
+    """
+
+    def __init__(
+        self,
+        log_dir: str = 'logs',
+        sample_every: int = 1,
+        memory: bool = False,
+        top_n: int = DEFAULT_TOP_N,
+    ):
+        """
+        Initialize the Profiler.
+
+        Args:
+            log_dir (str, optional): Directory of the reports. Defaults to 'logs'.
+            sample_every (int, optional): Profile one call out of this many
+                per stage. Defaults to 1 (every call).
+            memory (bool, optional): Also trace memory allocations.
+                Defaults to False.
+            top_n (int, optional): Functions and lines listed per stage in
+                the text report. Defaults to `DEFAULT_TOP_N`.
+        """
+        self.log_dir = Path(log_dir)
+        self.sample_every = max(1, sample_every)
+        self.memory = memory
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._busy = False
+        self.calls: Dict[str, int] = {}
+        self.skipped: Dict[str, int] = {}
+        self.profiles: Dict[str, List[cProfile.Profile]] = {}
+        self.allocations: Dict[str, Counter] = {}
+        self.peaks: Dict[str, int] = {}
+        self.snapshots: Dict[str, tracemalloc.Snapshot] = {}
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def start(self, name: str) -> Optional[Tuple]:
+        """
+        Start profiling a call of a stage, if it is sampled.
+
+        Args:
+            name (str): The stage name.
+
+        Returns:
+            Optional[Tuple]: A token to pass to `stop`, or None if the call
+                is not profiled.
+        """
+        if getattr(self._local, 'active', False):
+            return None
+        with self._lock:
+            call = self.calls.get(name, 0)
+            self.calls[name] = call + 1
+            if call % self.sample_every:
+                return None
+            if self._busy:
+                self.skipped[name] = self.skipped.get(name, 0) + 1
+                return None
+            self._busy = True
+
+        snapshot = None
+        baseline = 0
+        if self.memory:
+            if call == 0:
+                snapshot = _take_snapshot()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is active (e.g. the run is under cProfile).
+            with self._lock:
+                self._busy = False
+                self.skipped[name] = self.skipped.get(name, 0) + 1
+            return None
+        self._local.active = True
+        return profile, snapshot, baseline
+
+    def stop(self, name: str, token: Tuple) -> None:
+        """
+        Stop profiling a call started with `start`.
+
+        Args:
+            name (str): The stage name.
+            token (Tuple): The token returned by `start`.
+        """
+        profile, before, baseline = token
+        profile.disable()
+        self._local.active = False
+
+        peak = tracemalloc.get_traced_memory()[1] - baseline if self.memory else 0
+        if before is not None:
+            after = _take_snapshot()
+            allocations = Counter(
+                {
+                    str(stat.traceback): stat.size_diff
+                    for stat in after.compare_to(before, 'lineno')
+                    if stat.size_diff > 0
+                }
+            )
+
+        with self._lock:
+            self._busy = False
+            self.profiles.setdefault(name, []).append(profile)
+            if self.memory:
+                self.peaks[name] = max(self.peaks.get(name, 0), peak)
+            if before is not None:
+                self.allocations[name] = allocations
+                self.snapshots[name] = after
+
+    def write_reports(self) -> Optional[Path]:
+        """
+        Write a `.prof` file per stage and a text report of all stages.
+
+        The `.prof` files can be opened with `pstats` or tools such as
+        snakeviz. With memory tracing, the snapshot taken after the first
+        call of each stage is also dumped (load it with
+        `tracemalloc.Snapshot.load`).
+
+        Returns:
+            Optional[Path]: The text report, or None if nothing was profiled.
+        """
+        with self._lock:
+            profiles = {name: list(p) for name, p in self.profiles.items()}
+            calls = dict(self.calls)
+            skipped = dict(self.skipped)
+        if not profiles:
+            return None
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        prefix = f'{LOG_TIMESTAMP}_profile'
+        report = io.StringIO()
+        for name, stage_profiles in profiles.items():
+            stats = pstats.Stats(*stage_profiles, stream=report)
+            stats.dump_stats(self.log_dir / f'{prefix}_{name}.prof')
+
+            report.write(
+                f'=== {name}: profiled {len(stage_profiles)} of {calls[name]} calls'
+                f' ({skipped.get(name, 0)} sampled calls skipped while another'
+                f' was profiled) ===\n'
+            )
+            stats.sort_stats('cumulative').print_stats(self.top_n)
+
+            if name in self.allocations:
+                report.write(
+                    f'Peak memory growth: {self.peaks[name] / 2**20:.1f} MiB. '
+                    f'Largest allocations of the first call:\n'
+                )
+                for line, size in self.allocations[name].most_common(self.top_n):
+                    report.write(f'{size / 2**10:>12.1f} KiB  {line}\n')
+                report.write('\n')
+                self.snapshots[name].dump(
+                    str(self.log_dir / f'{prefix}_{name}.snapshot')
+                )
+
+        path = self.log_dir / f'{prefix}.txt'
+        path.write_text(report.getvalue(), encoding='utf-8')
+        logger.info(f'Saved profiles of {len(profiles)} stages to {path}')
+        return path
+
+
+def add_profiling_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the `--profile` options to an entry point's parser."""
+    group = parser.add_argument_group('profiling')
+    group.add_argument(
+        '--profile',
+        action='store_true',
+        help='Profile each stage with cProfile; reports go to logs/.',
+    )
+    group.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='Also trace memory allocations with tracemalloc.',
+    )
+    group.add_argument(
+        '--profile-every',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Only profile every Nth call of each stage (e.g. every Nth job).',
+    )
+    group.add_argument(
+        '--profile-top',
+        type=int,
+        default=DEFAULT_TOP_N,
+        metavar='N',
+        help='Entries listed per stage in the text report.',
+    )
+
+
+def enable_profiling(
+    sample_every: int = 1,
+    memory: bool = False,
+    top_n: int = DEFAULT_TOP_N,
+    log_dir: str = 'logs',
+) -> Profiler:
+    """
+    Profile the stages timed by `metrics`, writing the reports at exit.
+
+    Also enables the metrics, whose timers delimit the stages.
+
+    Args:
+        sample_every (int, optional): Profile one call out of this many per
+            stage. Defaults to 1.
+        memory (bool, optional): Also trace memory allocations.
+            Defaults to False.
+        top_n (int, optional): Entries listed per stage in the text report.
+            Defaults to `DEFAULT_TOP_N`.
+        log_dir (str, optional): Directory of the reports. Defaults to 'logs'.
+
+    Returns:
+        Profiler: The profiler attached to `metrics`.
+    """
+    enable_metrics()
+    if metrics.profiler is None:
+        metrics.profiler = Profiler(log_dir, sample_every, memory, top_n)
+        atexit.register(metrics.profiler.write_reports)
+    return metrics.profiler
+
+
+def profiling_from_args(args: argparse.Namespace) -> Optional[Profiler]:
+    """Enable profiling if `--profile` (or `--profile-memory`) was given."""
+    if not (args.profile or args.profile_memory):
+        return None
+    return enable_profiling(
+        sample_every=args.profile_every,
+        memory=args.profile_memory,
+        top_n=args.profile_top,
+    )
@@ -0,0 +1,680 @@
+import argparse
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+from config.storage import (
+    CATEGORICAL_COLUMNS,
+    DEDUP_COLUMNS,
+    FINGERPRINT_COLUMN,
+    RAW_JOBS_PATH,
+    STORAGE_FORMAT,
+    TABLE_COLUMN_TYPES,
+)
+
+from .fingerprint import posting_fingerprints
+from .logger import setup_logging
+
+logger = logging.getLogger(__name__)
+
+STORAGE_FORMATS = ['parquet', 'csv']
+PARTITION_KEY = 'scrape_day'
+
+
+def _check_format(storage_format: str) -> None:
+    if storage_format not in STORAGE_FORMATS:
+        raise ValueError(
+            f"Invalid storage format '{storage_format}'. Choose from {', '.join(repr(f) for f in STORAGE_FORMATS)}."
+        )
+
+
+def _scrape_day(scrape_date: str) -> str:
+    """Return the ISO day of a '%d-%m-%Y %H:%M:%S' scrape date."""
+    try:
+        return datetime.strptime(scrape_date, '%d-%m-%Y %H:%M:%S').strftime(
+            '%Y-%m-%d'
+        )
+    except (TypeError, ValueError):
+        return 'unknown'
+
+
+def with_categoricals(
+    df: pd.DataFrame, columns: List[str] = CATEGORICAL_COLUMNS
+) -> pd.DataFrame:
+    """
+    Convert the low-cardinality columns present in `df` to categoricals.
+
+    Args:
+        df: The DataFrame to convert.
+        columns: The columns to convert. Defaults to `CATEGORICAL_COLUMNS`.
+
+    Returns:
+        pd.DataFrame: A copy of `df` with the converted columns.
+    """
+    df = df.copy()
+    for column in columns:
+        if column in df.columns and not isinstance(
+            df[column].dtype, pd.CategoricalDtype
+        ):
+            df[column] = df[column].astype('category')
+    return df
+
+
+def _read_parts(
+    parts: List[Path], columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Read Parquet part files into one DataFrame, in the given order.
+
+    Columns missing from some parts are filled with nulls.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tables = []
+    for part in parts:
+        if columns is None:
+            tables.append(pq.read_table(part))
+        else:
+            present = set(pq.read_schema(part).names)
+            tables.append(
+                pq.read_table(part, columns=[c for c in columns if c in present])
+            )
+    if not tables:
+        return pd.DataFrame(columns=columns)
+
+    table = pa.concat_tables(tables, promote_options='default')
+    if FINGERPRINT_COLUMN in table.column_names:
+        # Read as nullable integers: parts written before the column existed
+        # have nulls, which would otherwise turn the hashes into floats.
+        position = table.column_names.index(FINGERPRINT_COLUMN)
+        fingerprints = table.column(FINGERPRINT_COLUMN).to_pandas(
+            types_mapper={pa.int64(): pd.Int64Dtype()}.get
+        )
+        df = table.drop_columns([FINGERPRINT_COLUMN]).to_pandas()
+        df.insert(position, FINGERPRINT_COLUMN, fingerprints.astype('Int64'))
+    else:
+        df = table.to_pandas()
+    if columns is not None:
+        df = df.reindex(columns=columns)
+    return df
+
+
+def _part_name() -> str:
+    """Build a unique part file name that sorts in write order."""
+    return f'part-{time.time_ns()}-{os.getpid()}.parquet'
+
+
+class JobIdIndex:
+    """
+    A persistent set of the job IDs stored in a `JobDataset`.
+
+    Kept in a small SQLite database next to the dataset and updated by every
+    append, so resuming a scrape only looks up the candidate IDs instead of
+    reading the whole dataset. A marker describing the dataset state the
+    index matches (e.g. its number of part files) is stored alongside the
+    IDs to detect when the dataset changed behind its back.
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the JobIdIndex.
+
+        Args:
+            db_path (Path): The SQLite database file.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS job_ids '
+            '(job_id TEXT PRIMARY KEY) WITHOUT ROWID'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS meta '
+            '(key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+        )
+
+    @property
+    def marker(self) -> Optional[str]:
+        """The dataset state the index was last updated for."""
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'marker'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def __contains__(self, job_id: object) -> bool:
+        return (
+            self._conn.execute(
+                'SELECT 1 FROM job_ids WHERE job_id = ?', (str(job_id),)
+            ).fetchone()
+            is not None
+        )
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM job_ids').fetchone()[0]
+
+    def missing(self, job_ids: Iterable[str]) -> List[str]:
+        """
+        Filter out the job IDs already in the index.
+
+        Args:
+            job_ids (Iterable[str]): Candidate job IDs.
+
+        Returns:
+            List[str]: The IDs not in the index, in their original order.
+        """
+        job_ids = [str(job_id) for job_id in job_ids]
+        known = set()
+        for start in range(0, len(job_ids), self.CHUNK_SIZE):
+            chunk = job_ids[start : start + self.CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            known.update(
+                row[0]
+                for row in self._conn.execute(
+                    f'SELECT job_id FROM job_ids WHERE job_id IN ({placeholders})',
+                    chunk,
+                )
+            )
+        return [job_id for job_id in job_ids if job_id not in known]
+
+    def add(self, job_ids: Iterable[str], marker: str) -> None:
+        """
+        Add job IDs and record the dataset state they bring the index to.
+
+        Args:
+            job_ids (Iterable[str]): The IDs just written to the dataset.
+            marker (str): The dataset state after the write.
+        """
+        with self._conn:
+            self._conn.execute('BEGIN')
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO job_ids (job_id) VALUES (?)',
+                ((str(job_id),) for job_id in job_ids),
+            )
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('marker', ?) "
+                'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                (marker,),
+            )
+
+    def rebuild(self, job_ids: Iterable[str], marker: str) -> None:
+        """
+        Replace the whole index.
+
+        Args:
+            job_ids (Iterable[str]): All the IDs in the dataset.
+            marker (str): The current dataset state.
+        """
+        self._conn.execute('DELETE FROM job_ids')
+        self.add(job_ids, marker)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class JobDataset:
+    """
+    Append-only storage of scraped job postings.
+
+    In the 'parquet' format every append writes a new part file into a
+    directory per scrape day (`<path>/scrape_day=YYYY-MM-DD/part-*.parquet`),
+    so existing data is never rewritten. All columns are stored as strings,
+    except `CATEGORICAL_COLUMNS`, which are dictionary-encoded and read back
+    as pandas categoricals. Free text with embedded newlines round-trips
+    unchanged, and readers can load only the columns they need.
+
+    The 'csv' format appends to a single `<path>.csv` file, as before. A
+    Parquet dataset that is still empty when first used imports the rows of
+    `<path>.csv`, if there is one, so switching formats loses nothing.
+
+    Every row is stored with the 64-bit fingerprint of its `DEDUP_COLUMNS`
+    (`FINGERPRINT_COLUMN`, an int64 in Parquet), computed on append when the
+    scraper didn't already add it. Rows written before the column existed
+    get it computed when read.
+
+    Either way, the IDs of the stored jobs are tracked in a `JobIdIndex`
+    (`<path>.ids.sqlite`) so they can be checked without reading the data.
+    """
+
+    def __init__(
+        self,
+        path: Path = RAW_JOBS_PATH,
+        storage_format: str = STORAGE_FORMAT,
+    ):
+        """
+        Initialize the JobDataset.
+
+        Args:
+            path (Path, optional): The dataset location, without suffix.
+                Defaults to `RAW_JOBS_PATH`.
+            storage_format (str, optional): 'parquet' or 'csv'.
+                Defaults to `STORAGE_FORMAT`.
+
+        Raises:
+            ValueError: If `storage_format` is not supported.
+        """
+        _check_format(storage_format)
+        self.storage_format = storage_format
+        self.path = (
+            Path(path) if storage_format == 'parquet' else Path(path).with_suffix('.csv')
+        )
+        self.index_path = self.path.parent / f'{self.path.name}.ids.sqlite'
+        self._index: Optional[JobIdIndex] = None
+        self._part_count = 0
+        self._last_part = ''
+        self._legacy_checked = storage_format == 'csv'
+
+    def import_csv(self, csv_path: Path) -> int:
+        """
+        Import a raw jobs CSV written in the 'csv' format into this dataset.
+
+        Args:
+            csv_path (Path): The CSV file.
+
+        Returns:
+            int: The number of rows imported.
+        """
+        header = list(pd.read_csv(csv_path, nrows=0).columns)
+        jobs = pd.read_csv(
+            csv_path,
+            dtype={
+                column: 'Int64' if column == FINGERPRINT_COLUMN else str
+                for column in header
+            },
+            on_bad_lines='skip',
+        )
+        # Importing replaces the automatic import of `<path>.csv`.
+        self._legacy_checked = True
+        self.append(jobs)
+        return len(jobs)
+
+    def _import_legacy_csv(self) -> None:
+        """
+        Import the CSV of the 'csv' format once, if the Parquet dataset is
+        still empty, so switching formats keeps the data scraped so far.
+        """
+        if self._legacy_checked:
+            return
+        self._legacy_checked = True
+        csv_path = self.path.with_suffix('.csv')
+        if self.part_files() or not csv_path.exists():
+            return
+        n_rows = self.import_csv(csv_path)
+        logger.info(f'Imported {n_rows} rows from {csv_path} into {self.path}')
+
+    def part_files(self) -> List[Path]:
+        """List the Parquet part files in append order."""
+        if not self.path.is_dir():
+            return []
+        return sorted(self.path.glob(f'{PARTITION_KEY}=*/part-*.parquet'))
+
+    def exists(self) -> bool:
+        """Check whether any data has been written."""
+        if self.storage_format == 'csv':
+            return self.path.exists()
+        self._import_legacy_csv()
+        return bool(self.part_files())
+
+    def _marker(self) -> str:
+        """Describe the current state of the data files."""
+        if self.storage_format == 'csv':
+            size = self.path.stat().st_size if self.path.exists() else 0
+            return f'csv:{size}'
+        parts = self.part_files()
+        self._part_count = len(parts)
+        self._last_part = (
+            parts[-1].relative_to(self.path).as_posix() if parts else ''
+        )
+        return f'parquet:{self._part_count}:{self._last_part}'
+
+    def job_ids(self) -> JobIdIndex:
+        """
+        Open the index of stored job IDs.
+
+        The index is rebuilt from the dataset's job_id column if it is
+        missing or out of date (e.g. data written by an older version).
+
+        Returns:
+            JobIdIndex: The up-to-date index.
+        """
+        self._import_legacy_csv()
+        if self._index is None:
+            self._index = JobIdIndex(self.index_path)
+            marker = self._marker()
+            if self._index.marker != marker:
+                job_ids = self.read(columns=['job_id'])['job_id'].dropna()
+                self._index.rebuild(job_ids.astype(str), marker)
+                logger.info(
+                    f'Rebuilt job ID index with {len(self._index)} IDs from {self.path}'
+                )
+        return self._index
+
+    def append(self, df: pd.DataFrame) -> None:
+        """
+        Append rows to the dataset and record their IDs in the index.
+
+        Args:
+            df: The rows to add, with the scraped job fields as columns.
+        """
+        if df.empty:
+            return
+        self._import_legacy_csv()
+
+        if FINGERPRINT_COLUMN not in df.columns and set(DEDUP_COLUMNS) <= set(
+            df.columns
+        ):
+            df = df.assign(**{FINGERPRINT_COLUMN: posting_fingerprints(df)})
+
+        index = self.job_ids()
+        new_parts = self._write(df)
+
+        if self.storage_format == 'csv':
+            marker = self._marker()
+        else:
+            # Part files only get added, so the marker is updated without
+            # listing the whole dataset again.
+            self._part_count += len(new_parts)
+            self._last_part = max(
+                [self._last_part]
+                + [part.relative_to(self.path).as_posix() for part in new_parts]
+            )
+            marker = f'parquet:{self._part_count}:{self._last_part}'
+        if 'job_id' in df.columns:
+            index.add(df['job_id'].dropna().astype(str), marker)
+
+    def _write(self, df: pd.DataFrame) -> List[Path]:
+        """Write rows to the data files, returning new part files."""
+        if self.storage_format == 'csv':
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            file_exists = self.path.exists()
+            if file_exists:
+                # Keep the columns of the existing header (files created
+                # before the fingerprint column have none).
+                header = list(pd.read_csv(self.path, nrows=0).columns)
+                if header != list(df.columns):
+                    df = df.reindex(columns=header)
+            df.to_csv(
+                self.path,
+                mode='a' if file_exists else 'w',
+                header=not file_exists,
+                index=False,
+            )
+            return []
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema(
+            [
+                (
+                    column,
+                    pa.dictionary(pa.int32(), pa.string())
+                    if column in CATEGORICAL_COLUMNS
+                    else pa.int64()
+                    if column == FINGERPRINT_COLUMN
+                    else pa.string(),
+                )
+                for column in df.columns
+            ]
+        )
+        as_strings = df.astype(object).where(df.notna(), None)
+        as_strings = as_strings.apply(
+            lambda column: column.map(
+                lambda value: value if value is None else str(value)
+            )
+            if column.name != FINGERPRINT_COLUMN
+            else column.astype('Int64')
+        )
+
+        days = (
+            as_strings['scrape_date'].map(_scrape_day)
+            if 'scrape_date' in as_strings.columns
+            else pd.Series('unknown', index=as_strings.index)
+        )
+        new_parts = []
+        for day, rows in as_strings.groupby(days, sort=False):
+            table = pa.Table.from_pandas(
+                rows, schema=schema, preserve_index=False
+            ).replace_schema_metadata(None)
+            partition = self.path / f'{PARTITION_KEY}={day}'
+            partition.mkdir(parents=True, exist_ok=True)
+            part = partition / _part_name()
+            pq.write_table(table, part)
+            new_parts.append(part)
+        return new_parts
+
+    def close(self) -> None:
+        """Close the job ID index, if it was opened."""
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read the dataset.
+
+        Args:
+            columns (Optional[List[str]], optional): Only load these columns.
+                Columns missing from older parts are filled with nulls.
+                Defaults to all columns.
+
+        Returns:
+            pd.DataFrame: The stored rows in append order. Empty if nothing
+                has been written.
+        """
+        self._import_legacy_csv()
+        df = self._read(columns)
+        if (
+            columns is None
+            and FINGERPRINT_COLUMN not in df.columns
+            and set(DEDUP_COLUMNS) <= set(df.columns)
+        ):
+            df[FINGERPRINT_COLUMN] = pd.Series(pd.NA, index=df.index, dtype='Int64')
+        if FINGERPRINT_COLUMN not in df.columns:
+            return df
+
+        missing = df[FINGERPRINT_COLUMN].isna()
+        if missing.any():
+            # Rows stored before fingerprints existed: only then are the
+            # deduplication columns needed.
+            source = (
+                df
+                if set(DEDUP_COLUMNS) <= set(df.columns)
+                else self._read(DEDUP_COLUMNS)
+            )
+            fill = missing & source[DEDUP_COLUMNS].notna().any(axis=1)
+            if fill.any():
+                df.loc[fill, FINGERPRINT_COLUMN] = posting_fingerprints(
+                    source[fill]
+                ).to_numpy()
+        df[FINGERPRINT_COLUMN] = df[FINGERPRINT_COLUMN].astype('Int64')
+        return df
+
+    def _read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the data files, filling missing columns with nulls."""
+        if self.storage_format == 'parquet':
+            return _read_parts(self.part_files(), columns)
+
+        if not self.path.exists():
+            return pd.DataFrame(columns=columns)
+        header = list(pd.read_csv(self.path, nrows=0).columns)
+        usecols = header if columns is None else [c for c in columns if c in header]
+        df = pd.read_csv(
+            self.path,
+            usecols=usecols,
+            dtype={FINGERPRINT_COLUMN: 'Int64'}
+            if FINGERPRINT_COLUMN in usecols
+            else None,
+            on_bad_lines='skip',
+        )
+        df = df.reindex(columns=columns if columns is not None else usecols)
+        if FINGERPRINT_COLUMN in df.columns:
+            df[FINGERPRINT_COLUMN] = df[FINGERPRINT_COLUMN].astype('Int64')
+        return df
+
+
+def write_table(
+    df: pd.DataFrame, path: Path, storage_format: str = STORAGE_FORMAT
+) -> Path:
+    """
+    Write a processed table, replacing any previous version.
+
+    Args:
+        df: The table to write.
+        path: The output location, without suffix.
+        storage_format: 'parquet' or 'csv'. Defaults to `STORAGE_FORMAT`.
+
+    Returns:
+        Path: The file written.
+
+    Raises:
+        ValueError: If `storage_format` is not supported.
+    """
+    _check_format(storage_format)
+    output_path = Path(path).with_suffix(f'.{storage_format}')
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if storage_format == 'parquet':
+        with_categoricals(df).to_parquet(output_path, index=False)
+    else:
+        df.to_csv(output_path, index=False)
+    logger.info(f'Saved {len(df)} rows to: {output_path}')
+    return output_path
+
+
+def _fixed_schema_table(df: pd.DataFrame) -> 'pa.Table':
+    """Convert rows to an Arrow table with the fixed types of `append_table`."""
+    import pyarrow as pa
+
+    arrays = {}
+    for column in df.columns:
+        values = df[column]
+        alias = TABLE_COLUMN_TYPES.get(column)
+        if alias == 'int64':
+            values = values.astype('Int64')
+        elif alias is not None and alias.startswith('timestamp'):
+            if not pd.api.types.is_datetime64_any_dtype(values):
+                # Dates not converted yet are in the scraper's format.
+                values = pd.to_datetime(
+                    values, format='%d-%m-%Y %H:%M:%S', errors='coerce'
+                )
+        elif alias is not None:
+            values = pd.to_numeric(values, errors='coerce').astype(alias)
+        else:
+            values = values.astype(object).where(values.notna(), None).map(
+                lambda value: value if value is None else str(value)
+            )
+        array = pa.array(
+            values,
+            type=pa.string() if alias is None else pa.type_for_alias(alias),
+            from_pandas=True,
+        )
+        if column in CATEGORICAL_COLUMNS:
+            array = array.dictionary_encode().cast(
+                pa.dictionary(pa.int32(), pa.string())
+            )
+        arrays[str(column)] = array
+    return pa.table(arrays)
+
+
+def append_table(
+    df: pd.DataFrame, path: Path, storage_format: str = STORAGE_FORMAT
+) -> Path:
+    """
+    Append rows to a processed table.
+
+    In Parquet the table is a directory (`<path>.parquet/`) with one part
+    file per append, written with a fixed schema so that every part has the
+    same schema whatever the batch contents: the columns of
+    `TABLE_COLUMN_TYPES` get their type, `CATEGORICAL_COLUMNS` are
+    dictionary-encoded strings and all other columns are strings. In CSV the
+    rows are appended to `<path>.csv`, writing the header only when the file
+    is created.
+
+    Args:
+        df: The rows to append.
+        path: The table location, without suffix.
+        storage_format: 'parquet' or 'csv'. Defaults to `STORAGE_FORMAT`.
+
+    Returns:
+        Path: The table written to.
+    """
+    _check_format(storage_format)
+    output_path = Path(path).with_suffix(f'.{storage_format}')
+    if df.empty:
+        return output_path
+
+    if storage_format == 'csv':
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        file_exists = output_path.exists()
+        df.to_csv(
+            output_path,
+            mode='a' if file_exists else 'w',
+            header=not file_exists,
+            index=False,
+        )
+        return output_path
+
+    import pyarrow.parquet as pq
+
+    table = _fixed_schema_table(df)
+    output_path.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, output_path / _part_name())
+    return output_path
+
+
+def read_table(
+    path: Path,
+    columns: Optional[List[str]] = None,
+    storage_format: str = STORAGE_FORMAT,
+) -> pd.DataFrame:
+    """
+    Read a processed table written by `write_table` or `append_table`.
+
+    Args:
+        path: The table location, without suffix.
+        columns: Only load these columns. Defaults to all columns.
+        storage_format: 'parquet' or 'csv'. Defaults to `STORAGE_FORMAT`.
+
+    Returns:
+        pd.DataFrame: The table.
+    """
+    _check_format(storage_format)
+    input_path = Path(path).with_suffix(f'.{storage_format}')
+    if storage_format == 'csv':
+        return pd.read_csv(input_path, usecols=columns)
+    if input_path.is_dir():
+        return _read_parts(sorted(input_path.glob('part-*.parquet')), columns)
+    return pd.read_parquet(input_path, columns=columns)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Convert the raw jobs CSV into the Parquet dataset.'
+    )
+    parser.add_argument(
+        '--csv', type=Path, default=RAW_JOBS_PATH.with_suffix('.csv')
+    )
+    parser.add_argument('--dataset', type=Path, default=RAW_JOBS_PATH)
+    args = parser.parse_args()
+
+    setup_logging()
+    dataset = JobDataset(args.dataset, storage_format='parquet')
+    if dataset.part_files():
+        logger.error(f'{args.dataset} already holds data; not converting.')
+    else:
+        n_rows = dataset.import_csv(args.csv)
+        logger.success(f'Converted {n_rows} rows from {args.csv} to {args.dataset}')
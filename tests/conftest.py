@@ -0,0 +1,4 @@
+from src.utils.logger import register_success_level
+
+# The modules log with `logger.success`, which the entry points register.
+register_success_level()
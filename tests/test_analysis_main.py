@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+
+from src.analysis import analysis_main
+from src.analysis.analysis_main import process_jobs
+from src.analysis.extracting_skills_list import SkillExtractor
+from src.analysis.incremental import PipelineState, run_incremental
+from src.analysis.location_resolver import LocationResolver
+
+SKILL_MAP = {'Python': [r'\bpython\b'], 'SQL': [r'\bsql\b']}
+
+
+def raw_jobs(scrape_date='10-05-2025 12:00:00'):
+    return pd.DataFrame(
+        {
+            'job_id': ['1', '2'],
+            'job_title': ['Engenheiro de Dados', 'Analista de Dados'],
+            'job_description': ['Python e SQL', 'SQL'],
+            'num_applicants': ['25 candidatos', None],
+            'scrape_date': [scrape_date, scrape_date],
+            'time_posted': ['há 2 dias', 'há 1 semana'],
+            'location': ['São Paulo, SP', 'Brasil'],
+        }
+    )
+
+
+@pytest.fixture
+def extractor():
+    extractor = SkillExtractor(SKILL_MAP)
+    yield extractor
+    extractor.close()
+
+
+def test_process_jobs_continues_when_classification_fails(extractor, monkeypatch):
+    def fail(df, output_path):
+        raise RuntimeError('classifier unavailable')
+
+    monkeypatch.setattr(analysis_main, 'classify_job_titles', fail)
+
+    df_jobs, df_skills = process_jobs(raw_jobs(), extractor, LocationResolver())
+
+    assert 'classified_job_title' not in df_jobs.columns
+    assert df_jobs['post_date'].tolist() == [
+        '08-05-2025 12:00:00',
+        '03-05-2025 12:00:00',
+    ]
+    assert {'city', 'state'} <= set(df_jobs.columns)
+    assert len(df_skills) == 3
+
+
+def test_process_jobs_keeps_the_scraped_columns_when_conversion_fails(extractor):
+    jobs = raw_jobs(scrape_date='not a date')
+
+    df_jobs, _ = process_jobs(
+        jobs, extractor, LocationResolver(), classify_titles=False
+    )
+
+    for column in ['num_applicants', 'scrape_date', 'time_posted', 'location']:
+        assert df_jobs[column].tolist() == jobs[column].tolist()
+    assert 'post_date' not in df_jobs.columns
+
+
+def test_incremental_run_stores_no_dates_after_a_failed_conversion(
+    extractor, tmp_path
+):
+    state_path = tmp_path / 'state.pkl'
+    jobs = raw_jobs(scrape_date='not a date')
+
+    df_jobs, _ = run_incremental(jobs, extractor, state_path=state_path)
+
+    assert df_jobs['scrape_date'].tolist() == jobs['scrape_date'].tolist()
+    assert 'location' in df_jobs.columns
+    state = PipelineState(state_path)
+    assert state.results['dates'] == {}
+    assert len(state.results['skills']) == 2
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from src.analysis.analysis_utils import parse_posted_date, parse_posted_dates
+
+
+def test_parse_posted_dates_matches_row_wise_parsing():
+    rng = np.random.default_rng(0)
+    cases = [
+        'Há 5 minutos', 'Há 1 hora', 'Há 3 horas', 'há 1 dia', 'Há 2 dias',
+        'Há 1 semana', 'Há 3 semanas', 'Há 1 mês', 'Há 2 meses', 'Há 1 ano',
+        'Há 2 anos', '  Há   4   dias  ', 'Há 2', 'Há', '', '   ',
+        'Há dois dias', 'Há 2 segundos', 'Há -3 dias', 'Há +4 horas',
+        'Há 1_000 minutos', 'Há 2.5 dias', 'Há ٣ dias', 'Há 3 DIAS',
+        'Há 2 mesesano', 'Reposted há 2 dias', 'Há 400 anos',
+        'Há 99999999999999 anos', 'Há 3 dias atrás', None, np.nan, 5,
+    ]
+    words = ['Há', 'há', 'Reposted', '']
+    amounts = ['1', '2', '10', '59', '0', '-1', 'x', '']
+    units = ['minuto', 'minutos', 'hora', 'horas', 'dia', 'dias', 'semana',
+             'semanas', 'mês', 'meses', 'ano', 'anos', 'segundos', '']
+    cases += [
+        ' '.join([rng.choice(words), rng.choice(amounts), rng.choice(units)])
+        for _ in range(10000)
+    ]
+    scrape_dates = pd.to_datetime(
+        pd.Series(
+            rng.choice(
+                ['10-05-2025 12:00:00', '01-01-2024 00:00:00', None],
+                size=len(cases),
+                p=[0.6, 0.35, 0.05],
+            )
+        ),
+        format='%d-%m-%Y %H:%M:%S',
+    )
+    df = pd.DataFrame(
+        {'time_posted': pd.Series(cases, dtype=object), 'scrape_date': scrape_dates}
+    )
+
+    expected = pd.to_datetime(df.apply(parse_posted_date, axis=1))
+    actual = parse_posted_dates(df['time_posted'], df['scrape_date'])
+
+    pd.testing.assert_series_equal(actual, expected, check_names=False)
@@ -0,0 +1,86 @@
+import pickle
+
+import pytest
+
+from src.scraping.cache_store import (
+    CacheStore,
+    SQLiteCacheStore,
+    open_cache_store,
+)
+
+
+def test_cache_store_requires_flush():
+    class NoFlush(CacheStore):
+        __getitem__ = __setitem__ = __delitem__ = __iter__ = __len__ = None
+
+    with pytest.raises(TypeError):
+        NoFlush()
+
+
+def test_sqlite_store_buffers_upserts_until_flush(tmp_path):
+    store = SQLiteCacheStore(tmp_path / 'cache.sqlite', 'jobs', batch_size=3)
+    store['1'] = {'title': 'Data Engineer'}
+    store['2'] = {'title': 'Analyst'}
+
+    assert store['1'] == {'title': 'Data Engineer'}
+    assert store._conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0] == 0
+
+    store['1'] = {'title': 'Data Scientist'}
+    store['3'] = ['a', 'b']
+    # The third pending key reached the batch size and flushed them all.
+    assert store._pending == {}
+    rows = dict(store._conn.execute('SELECT key, value FROM jobs').fetchall())
+    assert rows == {
+        '1': '{"title": "Data Scientist"}',
+        '2': '{"title": "Analyst"}',
+        '3': '["a", "b"]',
+    }
+
+    del store['2']
+    assert '2' not in store
+    assert store.flush() == 1
+    assert len(store) == 2
+    store.close()
+
+
+def test_sqlite_store_pages_through_rows_while_written(tmp_path, monkeypatch):
+    monkeypatch.setattr(SQLiteCacheStore, 'PAGE_SIZE', 2)
+    store = SQLiteCacheStore(tmp_path / 'cache.sqlite', 'jobs')
+    store.update_many({str(i): i for i in range(5)})
+
+    seen = []
+    for key, value in store.items():
+        seen.append((key, value))
+        store[key] = value * 10
+    store.flush()
+
+    assert seen == [(str(i), i) for i in range(5)]
+    assert list(store) == [str(i) for i in range(5)]
+    assert dict(store.items()) == {str(i): i * 10 for i in range(5)}
+    store.close()
+
+
+def test_sqlite_store_keeps_entries_when_reopened(tmp_path):
+    store = SQLiteCacheStore(tmp_path / 'cache.sqlite', 'jobs')
+    store['1'] = {'skills': ['python']}
+    store.close()
+
+    reopened = SQLiteCacheStore(tmp_path / 'cache.sqlite', 'jobs')
+    assert reopened['1'] == {'skills': ['python']}
+    assert len(reopened) == 1
+    reopened.close()
+
+
+def test_sqlite_cache_imports_the_pickle_cache_once(tmp_path):
+    with open(tmp_path / 'job_ids_cache.pkl', 'wb') as f:
+        pickle.dump({'python': ['1', '2']}, f)
+
+    store = open_cache_store('job_id', cache_dir=tmp_path)
+    assert dict(store.items()) == {'python': ['1', '2']}
+    store['python'] = ['3']
+    store.close()
+
+    # The table has entries now, so the pickle isn't imported over them.
+    store = open_cache_store('job_id', cache_dir=tmp_path)
+    assert dict(store.items()) == {'python': ['3']}
+    store.close()
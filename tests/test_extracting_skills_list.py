@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+
+from config.analysis import STANDARD_SKILL_MAP
+from src.analysis.extracting_skills_list import SkillExtractor
+
+
+@pytest.mark.parametrize('n_jobs', [0, -2])
+def test_invalid_n_jobs_is_rejected(n_jobs):
+    extractor = SkillExtractor(STANDARD_SKILL_MAP)
+    df = pd.DataFrame({'job_id': ['1'], 'job_description': ['Python e SQL']})
+
+    with pytest.raises(ValueError, match='Invalid n_jobs'):
+        extractor.extract_skills_parallel(['Python'], n_jobs)
+    with pytest.raises(ValueError, match='Invalid n_jobs'):
+        extractor.process_dataframe(df, 'job_description', n_jobs=n_jobs)
+
+
+def test_parallel_extraction_reuses_its_workers():
+    extractor = SkillExtractor(STANDARD_SKILL_MAP)
+    texts = ['Experiência com Python, SQL e Power BI', 'Scrum e Kanban', '']
+    expected = [extractor.extract_skills(text) for text in texts]
+    try:
+        assert extractor.extract_skills_parallel(texts, 2) == expected
+        executor = extractor._executor
+        assert extractor.extract_skills_parallel(texts, 2) == expected
+        assert extractor._executor is executor
+    finally:
+        extractor.close()
+    assert extractor._executor is None
@@ -0,0 +1,86 @@
+from src.scraping.id_crawler import (
+    IdCrawler,
+    SearchStream,
+    keyword_overlap_report,
+)
+
+
+class StubScraper:
+    """The parts of `JobScraper` the crawler uses, without HTTP."""
+
+    max_workers = 2
+    html_parser = 'bs4'
+
+    def __init__(self, known_ids):
+        self.job_ids_cache = {
+            job_id: {'work_model': 'Remote', 'keyword': 'old'} for job_id in known_ids
+        }
+
+    def save_job_cache(self, type='job_data'):
+        pass
+
+
+def crawler_serving(pages, known_ids=(), **kwargs):
+    """An IdCrawler whose search pages come from `pages[keyword][offset]`."""
+    crawler = IdCrawler(StubScraper(known_ids), **kwargs)
+    crawler.requested = []
+
+    def fetch_page(keyword, work_model_code, offset):
+        crawler.requested.append((keyword, offset))
+        return pages[keyword].get(offset, [])
+
+    crawler.fetch_page = fetch_page
+    return crawler
+
+
+def ids(start, stop):
+    return [str(job_id) for job_id in range(start, stop)]
+
+
+def test_stream_stops_after_consecutive_low_yield_pages():
+    # One new ID per page after the first: 10% new, below the 20% threshold.
+    pages = {'PMO': {0: ids(100, 110)}}
+    for page in range(1, 10):
+        pages['PMO'][page * 10] = ids(page * 9, page * 9 + 9) + [str(200 + page)]
+    crawler = crawler_serving(
+        pages, known_ids=ids(0, 100), low_yield_threshold=0.2, low_yield_pages=3
+    )
+
+    (stream,) = crawler.crawl([SearchStream('PMO', '2', n_ids_to_fetch=1000)])
+
+    assert stream.stop_reason == 'low yield'
+    assert stream.pages == 4
+    assert stream.new_ids == 13
+    assert max(offset for _, offset in crawler.requested) == 30
+
+
+def test_a_productive_page_resets_the_low_yield_run():
+    pages = {'PMO': {0: ids(0, 10), 10: ids(0, 10), 20: ids(100, 110)}}
+    for page in range(3, 6):
+        pages['PMO'][page * 10] = ids(0, 10)
+    crawler = crawler_serving(pages, low_yield_pages=2)
+
+    (stream,) = crawler.crawl([SearchStream('PMO', '2', n_ids_to_fetch=1000)])
+
+    assert stream.stop_reason == 'low yield'
+    assert stream.pages == 5
+    assert stream.new_ids == 20
+
+
+def test_keyword_overlap_report_credits_shared_ids():
+    pages = {
+        'Scrum Master': {0: ids(0, 10)},
+        'Agile Coach': {0: ids(5, 10) + ids(20, 25)},
+    }
+    crawler = crawler_serving(pages, low_yield_pages=0)
+    streams = crawler.crawl(
+        [SearchStream('Scrum Master', '2', 10), SearchStream('Agile Coach', '2', 10)]
+    )
+
+    report = keyword_overlap_report(streams).set_index('keyword')
+
+    assert report.loc['Scrum Master', 'ids_seen'] == 10
+    assert report.loc['Agile Coach', 'ids_seen'] == 10
+    assert report['shared_ids'].tolist() == [5, 5]
+    assert report.loc['Agile Coach', 'closest_keyword'] == 'Scrum Master'
+    assert report['new_ids'].sum() == 15
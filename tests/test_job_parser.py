@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+
+from src.scraping.job_parser import available_backends, parse_job_posting
+
+FIXTURE_PAGES = sorted(
+    (Path(__file__).parents[1] / 'benchmarks/fixtures/job_pages').glob('*.html')
+)
+SCRIPT_PAGE = """
+<html><body>
+<h2 class="top-card-layout__title">Data <script>track()</script>Engineer</h2>
+<ul><li class="description__job-criteria-item">
+  <h3 class="description__job-criteria-subheader">Nível<style>.a{}</style></h3>
+  <span class="description__job-criteria-text">Pleno</span>
+</li></ul>
+<div class="show-more-less-html__markup">Hello <script>var x=1;</script><style>.a{}</style>world<!-- note -->
+  <b>Python<script>y()</script></b> e SQL<template>t</template> remoto</div>
+</body></html>
+"""
+FAST_BACKENDS = [backend for backend in available_backends() if backend != 'bs4']
+
+
+def test_bs4_drops_script_and_style_text():
+    job_post = parse_job_posting(SCRIPT_PAGE, 'bs4')
+
+    assert job_post['job_title'] == 'Data Engineer'
+    assert job_post['xp_level'] == 'Pleno'
+    assert job_post['job_description'] == 'Hello\nworld\nPython\ne SQL\nremoto'
+
+
+@pytest.mark.skipif(not FAST_BACKENDS, reason='lxml and selectolax not installed')
+@pytest.mark.parametrize('backend', FAST_BACKENDS)
+@pytest.mark.parametrize(
+    'html',
+    [SCRIPT_PAGE] + [page.read_text(encoding='utf-8') for page in FIXTURE_PAGES],
+)
+def test_fast_backends_match_bs4(backend, html):
+    assert parse_job_posting(html, backend) == parse_job_posting(html, 'bs4')
@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from benchmarks.bench_scraper import build_synthetic_archive
+from src.scraping.fixture_server import FixtureServer
+from src.scraping.http_archive import HttpArchive
+from src.scraping.linkedin_scraper import JobScraper
+
+N_JOBS = 24
+REQUESTS_PER_SECOND = 40.0
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = tmp_path / 'archive.jsonl.gz'
+    build_synthetic_archive(path, 'Data Engineer', '2', N_JOBS)
+    return HttpArchive(path)
+
+
+def test_concurrent_scrape_keeps_order_and_rate(archive, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with FixtureServer(archive, latency=0.02, seed=0) as server:
+        request_times = []
+        draw = server._draw
+
+        def timed_draw():
+            request_times.append(time.monotonic())
+            return draw()
+
+        server._draw = timed_draw
+        scraper = JobScraper(
+            max_workers=4,
+            requests_per_second=REQUESTS_PER_SECOND,
+            base_url=server.url,
+        )
+        try:
+            scraper.get_job_ids(N_JOBS, 'Data Engineer', '2')
+            job_ids = list(scraper.job_ids_cache)
+            request_times.clear()
+            jobs = scraper.get_job_info()
+            stored = scraper.job_dataset.read()
+        finally:
+            scraper.close()
+
+    assert len(job_ids) == N_JOBS
+    assert jobs['job_id'].tolist() == job_ids
+    assert stored['job_id'].tolist() == job_ids
+    assert jobs['job_title'].notna().all()
+
+    # A token bucket lets `burst` requests through at once, then one every
+    # 1/rps seconds: any `burst` + 1 requests span at least 1/rps seconds.
+    burst = scraper.rate_limiter.burst
+    request_times.sort()
+    assert len(request_times) == N_JOBS
+    for i in range(burst, len(request_times)):
+        span = request_times[i] - request_times[i - burst]
+        assert span >= 1 / REQUESTS_PER_SECOND - 0.005
+
+
+def test_resumed_scrape_skips_the_stored_jobs(archive, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with FixtureServer(archive, seed=0) as server:
+        scraper = JobScraper(max_workers=2, requests_per_second=0, base_url=server.url)
+        try:
+            scraper.get_job_ids(N_JOBS, 'Data Engineer', '2')
+            first_ids = list(scraper.job_ids_cache)[:10]
+            for job_id in list(scraper.job_ids_cache)[10:]:
+                del scraper.job_ids_cache[job_id]
+            assert scraper.get_job_info()['job_id'].tolist() == first_ids
+        finally:
+            scraper.close()
+
+        resumed = JobScraper(max_workers=2, requests_per_second=0, base_url=server.url)
+        try:
+            resumed.get_job_ids(N_JOBS, 'Data Engineer', '2')
+            all_ids = list(resumed.job_ids_cache)
+            requests_before = server.request_count
+            jobs = resumed.get_job_info()
+            stored = resumed.job_dataset.read()
+        finally:
+            resumed.close()
+
+    assert jobs['job_id'].tolist() == all_ids[10:]
+    assert server.request_count - requests_before == N_JOBS - 10
+    assert stored['job_id'].tolist() == all_ids
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from src.utils.metrics import Metrics
+
+
+def test_summary_of_timers_counters_and_histograms():
+    metrics = Metrics(enabled=True)
+    for seconds in [0.1, 0.2, 0.3, 0.4]:
+        metrics.record_time('analysis.skill_extraction', seconds, records=50)
+    metrics.record_time('scraper.checkpoint', 0.5)
+    metrics.count('scraper.jobs_fetched')
+    metrics.count('scraper.jobs_fetched', 2)
+    for size in [10, 30, 20]:
+        metrics.observe('scraper.response_bytes', size)
+
+    summary = metrics.summary()
+
+    extraction = summary['timers']['analysis.skill_extraction']
+    assert extraction['calls'] == 4
+    assert extraction['records'] == 200
+    assert extraction['total_seconds'] == pytest.approx(1.0)
+    assert extraction['mean_seconds'] == pytest.approx(0.25)
+    assert extraction['p50_seconds'] == 0.3
+    assert extraction['max_seconds'] == 0.4
+    assert extraction['per_second'] == pytest.approx(200)
+    # Without records the throughput is in calls per second.
+    assert summary['timers']['scraper.checkpoint']['per_second'] == pytest.approx(2)
+    assert summary['counters'] == {'scraper.jobs_fetched': 3}
+    assert summary['histograms']['scraper.response_bytes'] == {
+        'count': 3,
+        'mean': 20,
+        'min': 10,
+        'p50': 20,
+        'p95': 30,
+        'max': 30,
+    }
+
+
+def test_timer_counts_records_added_inside_the_block():
+    metrics = Metrics(enabled=True)
+    with metrics.timer('analysis.load', 10) as timer:
+        timer.add_records(5)
+
+    @metrics.timed('analysis.classify', records=lambda titles: len(titles))
+    def classify(titles):
+        return titles
+
+    classify(['a', 'b'])
+
+    timers = metrics.summary()['timers']
+    assert timers['analysis.load']['records'] == 15
+    assert timers['analysis.classify']['records'] == 2
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics()
+    with metrics.timer('analysis.load', 10):
+        pass
+    metrics.count('scraper.jobs_fetched')
+    metrics.observe('scraper.response_bytes', 1)
+
+    summary = metrics.summary()
+    assert summary['timers'] == summary['counters'] == summary['histograms'] == {}
+
+
+def test_write_summary_saves_json(tmp_path):
+    metrics = Metrics(enabled=True)
+    metrics.record_time('analysis.load', 0.5, records=10)
+
+    path = metrics.write_summary(tmp_path / 'logs' / 'metrics.json')
+
+    saved = json.loads(path.read_text(encoding='utf-8'))
+    assert saved['timers']['analysis.load']['records'] == 10
+    assert saved['wall_seconds'] >= 0
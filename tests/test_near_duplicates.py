@@ -0,0 +1,16 @@
+from src.analysis.near_duplicates import NearDuplicateDetector, lsh_params
+
+
+def test_lsh_params_fit_the_signature():
+    bands, rows = lsh_params(0.8, 128)
+    assert bands * rows <= 128
+
+
+def test_near_duplicates_share_a_cluster():
+    base = ' '.join(f'palavra{i}' for i in range(200))
+    edited = base.replace('palavra100', 'termo100')
+    other = ' '.join(f'outra{i}' for i in range(200))
+
+    clusters = NearDuplicateDetector(0.8).cluster_ids([base, edited, other, None])
+
+    assert clusters.tolist() == [0, 0, 2, 3]
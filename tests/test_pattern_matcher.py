@@ -0,0 +1,57 @@
+import re
+
+from config.analysis import STANDARD_SKILL_MAP
+from src.analysis import pattern_matcher
+from src.analysis.pattern_matcher import MultiPatternMatcher
+
+TEXTS = [
+    'experiência com python, sql e power bi; desejável scrum e kanban',
+    'we use jira, confluence and ms project in an agile pmo',
+    'vaga para gerente de projetos pmp',
+    '',
+]
+
+
+def compiled_skill_map():
+    patterns = {}
+    for skill, skill_patterns in STANDARD_SKILL_MAP.items():
+        compiled = []
+        for pattern in skill_patterns:
+            try:
+                compiled.append(re.compile(pattern, re.IGNORECASE))
+            except re.error:
+                continue
+        patterns[skill] = compiled
+    return patterns
+
+
+def search_every_pattern(patterns, text):
+    return [
+        name
+        for name, group in patterns.items()
+        if any(pattern.search(text) for pattern in group)
+    ]
+
+
+def test_matcher_finds_what_searching_every_pattern_finds():
+    patterns = compiled_skill_map()
+    matcher = MultiPatternMatcher(patterns)
+    for text in TEXTS:
+        assert matcher.find(text) == search_every_pattern(patterns, text)
+
+
+def test_matcher_falls_back_without_the_private_re_parser(monkeypatch):
+    patterns = compiled_skill_map()
+    indexed = MultiPatternMatcher(patterns)
+    monkeypatch.setattr(pattern_matcher, 'sre_parser', None)
+    fallback = MultiPatternMatcher(patterns)
+
+    assert len(indexed._always) < len(indexed._patterns)
+    assert len(fallback._always) == len(fallback._patterns)
+    # Every skill name, alone and all together, so each skill is hit.
+    texts = TEXTS + [skill.lower() for skill in STANDARD_SKILL_MAP]
+    texts.append(' '.join(STANDARD_SKILL_MAP).lower())
+    for text in texts:
+        expected = search_every_pattern(patterns, text)
+        assert fallback.find(text) == expected
+        assert indexed.find(text) == expected
@@ -0,0 +1,37 @@
+import threading
+
+from src.utils.profiling import Profiler
+
+
+def test_profiler_profiles_one_call_at_a_time(tmp_path):
+    profiler = Profiler(log_dir=str(tmp_path))
+    fetch = profiler.start('fetch')
+    assert fetch is not None
+
+    tokens = []
+    worker = threading.Thread(target=lambda: tokens.append(profiler.start('parse')))
+    worker.start()
+    worker.join()
+    profiler.stop('fetch', fetch)
+    parse = profiler.start('parse')
+    profiler.stop('parse', parse)
+
+    assert tokens == [None]
+    assert profiler.calls == {'fetch': 1, 'parse': 2}
+    assert profiler.skipped == {'parse': 1}
+    assert {name: len(p) for name, p in profiler.profiles.items()} == {
+        'fetch': 1,
+        'parse': 1,
+    }
+    report = profiler.write_reports().read_text(encoding='utf-8')
+    assert 'parse: profiled 1 of 2 calls (1 sampled calls skipped' in report
+
+
+def test_nested_stages_are_part_of_the_outer_profile(tmp_path):
+    profiler = Profiler(log_dir=str(tmp_path))
+    outer = profiler.start('run')
+
+    assert profiler.start('fetch') is None
+    profiler.stop('run', outer)
+    assert profiler.skipped == {}
+    assert list(profiler.profiles) == ['run']
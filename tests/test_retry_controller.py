@@ -0,0 +1,47 @@
+import threading
+
+from src.scraping.rate_limiter import RateLimiter
+from src.scraping.retry_controller import RetryController
+
+URL = 'https://www.linkedin.com/jobs/view/1'
+
+
+def test_concurrent_rate_updates_are_not_lost():
+    limiter = RateLimiter(rate=1.0)
+
+    def add_one():
+        for _ in range(1000):
+            limiter.update_rate(URL, lambda rate: rate + 1)
+
+    threads = [threading.Thread(target=add_one) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert limiter.rate_of(URL) == 8001.0
+
+
+def test_successes_raise_the_rate_back_to_the_maximum():
+    limiter = RateLimiter(rate=4.0)
+    controller = RetryController(limiter, increase=1.0)
+    limiter.set_rate(URL, 1.0)
+
+    controller.on_success(URL)
+    assert limiter.rate_of(URL) == 2.0
+    for _ in range(20):
+        controller.on_success(URL)
+    assert limiter.rate_of(URL) == 4.0
+
+
+def test_throttled_last_attempt_lowers_the_rate_without_pausing():
+    slept = []
+    limiter = RateLimiter(rate=4.0, sleep=slept.append)
+    controller = RetryController(limiter, decrease_factor=0.5, sleep=slept.append)
+
+    delay = controller.on_throttled(URL, 4, 429, retry_after='30', retry=False)
+
+    assert delay == 0.0
+    assert limiter.rate_of(URL) == 2.0
+    assert limiter._paused_until == {}
+    assert slept == []
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.storage import JobDataset, append_table, read_table
+
+
+def test_append_table_batches_with_and_without_missing_values(tmp_path):
+    complete = pd.DataFrame(
+        {
+            'job_id': ['1', '2'],
+            'num_applicants': [3, 25],
+            'scrape_date': pd.to_datetime(['2025-05-01', '2025-05-02']),
+            'work_model': ['1', '2'],
+            'city': [None, None],
+        }
+    )
+    missing = pd.DataFrame(
+        {
+            'job_id': ['3'],
+            'num_applicants': [np.nan],
+            'scrape_date': [pd.NaT],
+            'work_model': [None],
+            'city': ['Curitiba'],
+        }
+    )
+    path = tmp_path / 'df_jobs'
+
+    append_table(complete, path, 'parquet')
+    append_table(missing, path, 'parquet')
+    df = read_table(path, storage_format='parquet')
+
+    assert df['job_id'].tolist() == ['1', '2', '3']
+    assert df['num_applicants'].dtype == 'float64'
+    assert df['num_applicants'].tolist()[:2] == [3.0, 25.0]
+    assert pd.isna(df['num_applicants'].iloc[2])
+    assert df['scrape_date'].dtype == 'datetime64[ns]'
+    assert pd.isna(df['scrape_date'].iloc[2])
+    assert df['work_model'].astype(object).tolist()[:2] == ['1', '2']
+    assert df['city'].tolist() == [None, None, 'Curitiba']
+
+
+def test_parquet_dataset_imports_the_legacy_csv_once(tmp_path):
+    legacy = JobDataset(tmp_path / 'jobs_data', storage_format='csv')
+    legacy.append(
+        pd.DataFrame(
+            {
+                'job_id': ['10', '11'],
+                'job_title': ['Scrum Master', 'Project Manager'],
+                'scrape_date': ['01-05-2025 10:00:00', '02-05-2025 10:00:00'],
+            }
+        )
+    )
+    legacy.close()
+
+    dataset = JobDataset(tmp_path / 'jobs_data', storage_format='parquet')
+    assert dataset.job_ids().missing(['10', '11', '12']) == ['12']
+    assert dataset.read()['job_id'].tolist() == ['10', '11']
+    dataset.close()
+
+    reopened = JobDataset(tmp_path / 'jobs_data', storage_format='parquet')
+    assert reopened.read()['job_id'].tolist() == ['10', '11']
+    reopened.close()
+
+
+def test_job_id_index_is_reused_until_the_dataset_changes(tmp_path, monkeypatch):
+    dataset = JobDataset(tmp_path / 'jobs_data', storage_format='parquet')
+    dataset.append(
+        pd.DataFrame(
+            {'job_id': ['1', '2'], 'scrape_date': ['01-05-2025 10:00:00'] * 2}
+        )
+    )
+    dataset.append(
+        pd.DataFrame({'job_id': ['3'], 'scrape_date': ['02-05-2025 10:00:00']})
+    )
+    dataset.close()
+
+    def no_read(self, columns=None):
+        raise AssertionError('the dataset was read to rebuild the index')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(JobDataset, 'read', no_read)
+        resumed = JobDataset(tmp_path / 'jobs_data', storage_format='parquet')
+        assert resumed.job_ids().missing(['4', '3', '2', '1', '5']) == ['4', '5']
+        resumed.close()
+
+    # A part removed behind the index's back makes it out of date.
+    resumed.part_files()[-1].unlink()
+    rebuilt = JobDataset(tmp_path / 'jobs_data', storage_format='parquet')
+    assert rebuilt.job_ids().missing(['1', '2', '3']) == ['3']
+    rebuilt.close()
@@ -0,0 +1,17 @@
+from src.scraping.transport import TransportStats
+
+
+def test_latency_sample_stays_bounded():
+    stats = TransportStats()
+    n_requests = 5 * TransportStats.SAMPLE_SIZE
+    for i in range(n_requests):
+        stats.record(i / n_requests)
+
+    summary = stats.summary()
+
+    assert len(stats.latencies) == TransportStats.SAMPLE_SIZE
+    assert summary['requests'] == summary['errors'] == n_requests
+    assert summary['latency_max'] == (n_requests - 1) / n_requests
+    assert abs(summary['latency_mean'] - 0.5) < 1e-3
+    assert abs(summary['latency_p50'] - 0.5) < 0.02
+    assert abs(summary['latency_p95'] - 0.95) < 0.02